@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Append-only, memory-mapped columnar archive of every outing, with career, season and course-history stats
+"""
+
+import argparse
+import json
+import mmap
+import os
+import sys
+from array import array
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from calculate_stats import SqliteSource, load_tournament_frame
+from trends import trend_batch
+
+ARCHIVE_DIR = 'stats_archive'
+META_FILE = 'archive.json'
+FORMAT_VERSION = 1
+
+# Fixed-width columns, one file each: (name, array typecode). Rounds are
+# individual rounds only; each round's holes are a contiguous run of hole rows.
+ROUND_COLUMNS = [('event', 'H'), ('day', 'b'), ('player', 'I'), ('course', 'I'), ('format', 'B'),
+                 ('par', 'B'), ('score', 'H'), ('hole_start', 'I'), ('hole_count', 'B')]
+HOLE_COLUMNS = [('hole', 'B'), ('par', 'B'), ('strokes', 'B')]
+MATCH_COLUMNS = [('event', 'H'), ('player', 'I'), ('points', 'd'), ('possible', 'H')]
+TABLES = {'rounds': ROUND_COLUMNS, 'holes': HOLE_COLUMNS, 'matches': MATCH_COLUMNS}
+# Round row ids grouped by these dictionary-encoded columns
+INDEXED_COLUMNS = ['player', 'course']
+
+def _column_path(directory: str, table: str, column: str) -> str:
+    return os.path.join(directory, f'{table}.{column}.bin')
+
+def _index_path(directory: str, column: str, generation: int) -> str:
+    # Versioned so a crash mid-append never pairs the old metadata with a newer index
+    return os.path.join(directory, f'index.{column}.{generation}.bin')
+
+def _empty_meta() -> Dict[str, Any]:
+    return {
+        'version': FORMAT_VERSION,
+        'byteorder': sys.byteorder,
+        'itemsizes': {code: array(code).itemsize for columns in TABLES.values() for _, code in columns},
+        'rows': dict.fromkeys(TABLES, 0),
+        'players': [], 'courses': [], 'formats': [],
+        'events': [],
+        'generation': 0,
+        'index_offsets': {column: [0] for column in INDEXED_COLUMNS}
+    }
+
+def read_meta(directory: str) -> Dict[str, Any]:
+    path = os.path.join(directory, META_FILE)
+    if not os.path.exists(path):
+        return _empty_meta()
+    with open(path, 'r') as file:
+        meta = json.load(file)
+    if meta['version'] != FORMAT_VERSION or meta['byteorder'] != sys.byteorder:
+        raise ValueError(f"{path} was written as version {meta['version']} ({meta['byteorder']}-endian); "
+                         f"this reader handles version {FORMAT_VERSION} ({sys.byteorder}-endian)")
+    expected = {code: array(code).itemsize for columns in TABLES.values() for _, code in columns}
+    if meta['itemsizes'] != expected:
+        raise ValueError(f"{path} uses column widths {meta['itemsizes']}, this platform {expected}")
+    return meta
+
+def _code(levels: List[str], codes: Dict[str, int], value: str) -> int:
+    code = codes.get(value)
+    if code is None:
+        code = codes[value] = len(levels)
+        levels.append(value)
+    return code
+
+def append_event(directory: str, source: Union[str, SqliteSource], event: str, season: int) -> Dict[str, int]:
+    """Append one tournament's rounds, holes and match points; returns the rows added per table
+
+    Column files only ever grow. Metadata (row counts, dictionaries, event
+    ranges and index offsets) is replaced atomically after the columns are
+    flushed, so readers - and the next append, which first truncates any
+    half-written tail - only ever see whole events.
+    """
+    meta = read_meta(directory)
+    if any(entry['name'] == event for entry in meta['events']):
+        raise ValueError(f"event {event!r} is already archived; the archive is append-only")
+    frame = load_tournament_frame(source)
+
+    event_code = len(meta['events'])
+    dictionaries = {name: (meta[name], {value: code for code, value in enumerate(meta[name])})
+                    for name in ('players', 'courses', 'formats')}
+    new = {table: {name: array(code) for name, code in columns} for table, columns in TABLES.items()}
+    rounds, holes, matches = new['rounds'], new['holes'], new['matches']
+    hole_base = meta['rows']['holes']
+
+    cards = defaultdict(list)
+    for row in frame.hole_scores:
+        cards[(row['player'], row['day'])].append((row['hole'], row['par'], row['strokes']))
+    for score in frame.rounds:
+        card = sorted(cards.get((score['player'], score['day']), []))
+        values = {
+            'event': event_code,
+            'day': score['day'],
+            'player': _code(*dictionaries['players'], score['player']),
+            'course': _code(*dictionaries['courses'], score['course']),
+            'format': _code(*dictionaries['formats'], score['format']),
+            'par': score['par'],
+            'score': score['score'],
+            'hole_start': hole_base + len(holes['hole']),
+            'hole_count': len(card)
+        }
+        for name, column in rounds.items():
+            column.append(values[name])
+        for hole, par, strokes in card:
+            holes['hole'].append(hole)
+            holes['par'].append(par)
+            holes['strokes'].append(strokes)
+    for result in frame.match_play_results:
+        matches['event'].append(event_code)
+        matches['player'].append(_code(*dictionaries['players'], result['player']))
+        matches['points'].append(result['total_points'])
+        matches['possible'].append(result['possible_points'])
+
+    os.makedirs(directory, exist_ok=True)
+    for table, columns in new.items():
+        for name, column in columns.items():
+            path = _column_path(directory, table, name)
+            with open(path, 'ab') as file:
+                file.truncate(meta['rows'][table] * column.itemsize)
+                column.tofile(file)
+                file.flush()
+                os.fsync(file.fileno())
+
+    first_round = meta['rows']['rounds']
+    meta['events'].append({'name': event, 'season': season, 'first_round': first_round,
+                           'rounds': len(rounds['event']), 'first_match': meta['rows']['matches'],
+                           'matches': len(matches['event'])})
+    for table, columns in new.items():
+        meta['rows'][table] += len(next(iter(columns.values())))
+    _write_indexes(directory, meta)
+    _save_meta(directory, meta)
+    for column in INDEXED_COLUMNS:
+        stale = _index_path(directory, column, meta['generation'] - 1)
+        if os.path.exists(stale):
+            os.remove(stale)
+    return {table: len(next(iter(columns.values()))) for table, columns in new.items()}
+
+def _write_indexes(directory: str, meta: Dict[str, Any]):
+    """Counting-sort every round id by player and by course into the next index generation"""
+    meta['generation'] += 1
+    total = meta['rows']['rounds']
+    for column in INDEXED_COLUMNS:
+        codes = array(dict(ROUND_COLUMNS)[column])
+        if total:
+            with open(_column_path(directory, 'rounds', column), 'rb') as file:
+                codes.fromfile(file, total)
+        offsets = [0] * (len(meta[column + 's']) + 1)
+        for code in codes:
+            offsets[code + 1] += 1
+        for code in range(1, len(offsets)):
+            offsets[code] += offsets[code - 1]
+        positions = offsets[:-1]
+        row_ids = array('I', bytes(4 * total))
+        for row, code in enumerate(codes):
+            row_ids[positions[code]] = row
+            positions[code] += 1
+        with open(_index_path(directory, column, meta['generation']), 'wb') as file:
+            row_ids.tofile(file)
+            file.flush()
+            os.fsync(file.fileno())
+        meta['index_offsets'][column] = offsets
+
+def _save_meta(directory: str, meta: Dict[str, Any]):
+    path = os.path.join(directory, META_FILE)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as file:
+        json.dump(meta, file, indent=2)
+    os.replace(temp_path, path)
+
+class Archive:
+    """Read-only view of an archive: every column is a memoryview over an mmap.
+
+    Nothing is decoded up front. Slicing a column (one event's rounds, one
+    round's holes) is a zero-copy view; players, courses and formats are
+    integer codes looked up through the dictionaries in archive.json.
+    """
+
+    def __init__(self, directory: str = ARCHIVE_DIR):
+        self.directory = directory
+        self.meta = read_meta(directory)
+        self._maps: List[mmap.mmap] = []
+        self.tables = {table: {name: self._map(_column_path(directory, table, name), code, self.meta['rows'][table])
+                               for name, code in columns}
+                       for table, columns in TABLES.items()}
+        self.rounds, self.holes, self.matches = self.tables['rounds'], self.tables['holes'], self.tables['matches']
+        self.indexes = {column: self._map(_index_path(directory, column, self.meta['generation']), 'I',
+                                          self.meta['rows']['rounds'])
+                        for column in INDEXED_COLUMNS}
+        self.codes = {name: {value: code for code, value in enumerate(self.meta[name])}
+                      for name in ('players', 'courses', 'formats')}
+        self.seasons = [event['season'] for event in self.meta['events']]
+
+    def _map(self, path: str, code: str, length: int) -> memoryview:
+        if length == 0:
+            return memoryview(array(code))
+        with open(path, 'rb') as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        # Rows past the recorded count belong to an unfinished append
+        return memoryview(mapped).cast(code)[:length]
+
+    def close(self):
+        for views in list(self.tables.values()) + [self.indexes]:
+            for view in views.values():
+                view.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps = []
+
+    def __enter__(self) -> 'Archive':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def rows_by(self, column: str, value: str) -> memoryview:
+        """Round ids for one player or course (a zero-copy slice of the index)"""
+        code = self.codes[column + 's'].get(value)
+        if code is None:
+            raise KeyError(f"no {column} {value!r} in the archive")
+        offsets = self.meta['index_offsets'][column]
+        return self.indexes[column][offsets[code]:offsets[code + 1]]
+
+    def round_holes(self, row: int) -> Tuple[memoryview, memoryview]:
+        """(par, strokes) views of one round's holes"""
+        start = self.rounds['hole_start'][row]
+        end = start + self.rounds['hole_count'][row]
+        return self.holes['par'][start:end], self.holes['strokes'][start:end]
+
+    def season_rounds(self, season: int) -> List[range]:
+        """Round id ranges of every event in a season"""
+        return [range(event['first_round'], event['first_round'] + event['rounds'])
+                for event in self.meta['events'] if event['season'] == season]
+
+def _round_summary(archive: Archive, row: int) -> Dict[str, Any]:
+    rounds = archive.rounds
+    event = archive.meta['events'][rounds['event'][row]]
+    return {
+        'score': rounds['score'][row],
+        'relative_to_par': rounds['score'][row] - rounds['par'][row],
+        'event': event['name'],
+        'season': event['season'],
+        'day': rounds['day'][row],
+        'course': archive.meta['courses'][rounds['course'][row]]
+    }
+
+def _scoring(archive: Archive, rows) -> Dict[str, Any]:
+    """Rounds, scoring average, relative to par and best round over round ids"""
+    score, par = archive.rounds['score'], archive.rounds['par']
+    played = len(rows)
+    total = sum(score[row] for row in rows)
+    relative = total - sum(par[row] for row in rows)
+    best = min(rows, key=score.__getitem__)
+    return {
+        'rounds_played': played,
+        'scoring_average': round(total / played, 2),
+        'average_relative_to_par': round(relative / played, 2),
+        'best_round': _round_summary(archive, best)
+    }
+
+def career_stats(archive: Archive, player: str) -> Dict[str, Any]:
+    """Every archived round, hole and match point of one player"""
+    rows = archive.rows_by('player', player)
+    if not rows:
+        raise KeyError(f"no individual rounds for {player!r}")
+    event_column = archive.rounds['event']
+    by_season = defaultdict(list)
+    events = set()
+    for row in rows:
+        events.add(event_column[row])
+        by_season[archive.seasons[event_column[row]]].append(row)
+
+    # Strokes over par, folded: -1 = birdie or better ... 3 = triple bogey or worse
+    outcomes = [0] * 5
+    for row in rows:
+        pars, strokes = archive.round_holes(row)
+        for hole_par, hole_strokes in zip(pars, strokes):
+            outcomes[min(max(hole_strokes - hole_par, -1), 3) + 1] += 1
+    holes_played = sum(outcomes)
+
+    code = archive.codes['players'][player]
+    points = possible = 0
+    for index, match_player in enumerate(archive.matches['player']):
+        if match_player == code:
+            points += archive.matches['points'][index]
+            possible += archive.matches['possible'][index]
+
+    worst = max(rows, key=archive.rounds['score'].__getitem__)
+    return {
+        'player': player,
+        'events_played': len(events),
+        'seasons': sorted(by_season),
+        **_scoring(archive, rows),
+        'worst_round': _round_summary(archive, worst),
+        'holes': {
+            'holes_played': holes_played,
+            'birdies_or_better': outcomes[0],
+            'pars': outcomes[1],
+            'bogeys': outcomes[2],
+            'double_bogeys': outcomes[3],
+            'triple_bogeys_or_worse': outcomes[4],
+            'par_or_better_percentage': round((outcomes[0] + outcomes[1]) / holes_played * 100, 1) if holes_played else 0
+        },
+        'match_play': {
+            'points': points,
+            'possible_points': possible,
+            'win_percentage': round(points / possible * 100, 1) if possible else 0
+        },
+        'by_season': {season: _scoring(archive, season_rows) for season, season_rows in sorted(by_season.items())}
+    }
+
+def season_stats(archive: Archive, season: int) -> Dict[str, Any]:
+    """Season leaderboard by scoring average relative to par"""
+    ranges = archive.season_rounds(season)
+    if not ranges:
+        raise KeyError(f"no events in season {season}")
+    by_player = defaultdict(list)
+    player_column = archive.rounds['player']
+    for span in ranges:
+        for row, code in zip(span, player_column[span.start:span.stop]):
+            by_player[code].append(row)
+    leaderboard = [{'player': archive.meta['players'][code], **_scoring(archive, rows)} for code, rows in by_player.items()]
+    leaderboard.sort(key=lambda entry: (entry['average_relative_to_par'], -entry['rounds_played']))
+    return {
+        'season': season,
+        'events': [event['name'] for event in archive.meta['events'] if event['season'] == season],
+        'rounds_played': sum(len(span) for span in ranges),
+        'leaderboard': leaderboard
+    }
+
+def course_history(archive: Archive, course: str) -> Dict[str, Any]:
+    """Every archived round at one course: field numbers per season and each player's record there"""
+    rows = archive.rows_by('course', course)
+    if not rows:
+        raise KeyError(f"no individual rounds at {course!r}")
+    by_player = defaultdict(list)
+    by_season = defaultdict(list)
+    player_column, event_column = archive.rounds['player'], archive.rounds['event']
+    for row in rows:
+        by_player[player_column[row]].append(row)
+        by_season[archive.seasons[event_column[row]]].append(row)
+    players = {archive.meta['players'][code]: _scoring(archive, player_rows) for code, player_rows in by_player.items()}
+    return {
+        'course': course,
+        **_scoring(archive, rows),
+        'by_season': {season: _scoring(archive, season_rows) for season, season_rows in sorted(by_season.items())},
+        'players': dict(sorted(players.items(), key=lambda item: item[1]['average_relative_to_par']))
+    }
+
+def form_table(archive: Archive, player: Optional[str] = None) -> Dict[str, Any]:
+    """Slope, current form and change point of every player's career relative to par, in one batch
+
+    The player index already lists each player's round ids in archive order,
+    i.e. a ragged array of histories; it is fed to trend_batch whole. Only
+    a single-player query carries the per-round form and rolling lines.
+    """
+    score, par = archive.rounds['score'], archive.rounds['par']
+    if player is not None:
+        rows = archive.rows_by('player', player)
+        if not rows:
+            raise KeyError(f"no individual rounds for {player!r}")
+        [trend] = trend_batch([score[row] - par[row] for row in rows], [0, len(rows)])
+        return {'player': player, **trend}
+    offsets = archive.meta['index_offsets']['player']
+    trends = trend_batch([score[row] - par[row] for row in archive.indexes['player']], offsets, series=False)
+    table = {name: trend for name, trend in zip(archive.meta['players'], trends) if trend['rounds']}
+    return dict(sorted(table.items(), key=lambda item: item[1]['current_form']))
+
+def _print_json(value: Any, output: Optional[str]):
+    text = json.dumps(value, indent=2)
+    if output:
+        with open(output, 'w') as file:
+            file.write(text)
+        print(f"Results saved to {os.path.normpath(output)}")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--archive', default=ARCHIVE_DIR, help='archive directory')
+    query = argparse.ArgumentParser(add_help=False)
+    query.add_argument('--output', help='write the JSON here instead of printing it')
+    commands = parser.add_subparsers(dest='command', required=True)
+    add = commands.add_parser('add', help='append one tournament (a cleaned CSV directory or a database event)')
+    add.add_argument('data_dir', nargs='?', default='.', help='directory holding the cleaned CSV files')
+    add.add_argument('--db', metavar='PATH', help='read the event from this SQLite database instead')
+    add.add_argument('--event', required=True, help='name to archive the tournament under (and the database event)')
+    add.add_argument('--season', type=int, required=True, help='season (year) the tournament belongs to')
+    commands.add_parser('events', parents=[query], help='list archived events')
+    commands.add_parser('career', parents=[query], help="one player's career statistics").add_argument('player')
+    commands.add_parser('season', parents=[query], help="one season's leaderboard").add_argument('season', type=int)
+    commands.add_parser('course', parents=[query], help='every round at one course').add_argument('course')
+    commands.add_parser('form', parents=[query], help="every player's career trend and current form (or one player's)"
+                        ).add_argument('player', nargs='?')
+    args = parser.parse_args()
+
+    if args.command == 'add':
+        source = SqliteSource(args.db, args.event) if args.db else args.data_dir
+        try:
+            added = append_event(args.archive, source, args.event, args.season)
+        except ValueError as error:
+            parser.error(str(error))
+        print(f"Archived {args.event} ({args.season}) into {os.path.normpath(args.archive)}: "
+              f"{added['rounds']} rounds, {added['holes']} holes, {added['matches']} match results")
+    else:
+        with Archive(args.archive) as archive:
+            try:
+                if args.command == 'events':
+                    result = archive.meta['events']
+                elif args.command == 'career':
+                    result = career_stats(archive, args.player)
+                elif args.command == 'season':
+                    result = season_stats(archive, args.season)
+                elif args.command == 'form':
+                    result = form_table(archive, args.player)
+                else:
+                    result = course_history(archive, args.course)
+            except KeyError as error:
+                parser.error(error.args[0])
+            _print_json(result, args.output)
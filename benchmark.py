@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark the stats pipeline on synthetic tournaments and flag regressions against a stored baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from calculate_stats import (TournamentFrame, calculate_course_difficulty, calculate_course_performance,
+                             calculate_head_to_head_records, calculate_individual_player_stats,
+                             calculate_hole_analysis, calculate_performance_trends, calculate_player_statistics,
+                             calculate_tournament_summary, generate_tournament_insights, load_tournament_frame, run)
+from synthetic_data import generate_tournament
+
+DEFAULT_SIZES = [8, 1000, 10000, 100000]
+BASELINE_FILE = 'benchmark_baseline.json'
+WORK_DIR = '.benchmark_data'
+TOLERANCE = 0.25            # slower or bigger than baseline by more than this fraction is a regression
+MIN_SECONDS_DELTA = 0.005   # ...and by more than timer noise
+MIN_MEMORY_DELTA = 65536
+
+def tournament_dir(work_dir: str, players: int, seed: int) -> str:
+    """Generate a synthetic tournament once per (players, seed) and reuse it"""
+    directory = os.path.join(work_dir, f'players_{players}_seed_{seed}')
+    marker = os.path.join(directory, '.complete')
+    if not os.path.exists(marker):
+        print(f"Generating {players} players in {directory}...")
+        generate_tournament(directory, players, seed=seed)
+        open(marker, 'w').close()
+    return directory
+
+def benchmarks(directory: str, frame: TournamentFrame) -> List[Tuple[str, Callable[[], Any], int, str]]:
+    """(name, call, items processed, unit) for every calculate_* function and the end-to-end run"""
+    players = frame.players
+    rows = len(frame.individual_scores) + len(frame.hole_scores) + len(frame.match_play_results) + len(frame.player_stats)
+    rounds = len(frame.rounds)
+
+    def end_to_end():
+        # Load, every section and the JSON write; chatter is suppressed
+        with contextlib.redirect_stdout(io.StringIO()):
+            run([(directory, directory)], use_cache=False)
+
+    return [
+        ('load_tournament_frame', lambda: load_tournament_frame(directory), rows, 'rows'),
+        ('calculate_tournament_summary', lambda: calculate_tournament_summary(frame), rounds, 'rounds'),
+        ('calculate_individual_player_stats', lambda: [calculate_individual_player_stats(p, frame) for p in players],
+         len(players), 'players'),
+        ('calculate_course_performance', lambda: [calculate_course_performance(p, frame.player_rounds(p)) for p in players],
+         len(players), 'players'),
+        ('calculate_course_difficulty', lambda: calculate_course_difficulty(frame), rounds, 'rounds'),
+        ('calculate_head_to_head_records',
+         lambda: calculate_head_to_head_records(frame.match_play_results, frame.hole_scores, players),
+         len(frame.hole_scores), 'hole rows'),
+        ('calculate_performance_trends', lambda: calculate_performance_trends(frame), rounds, 'rounds'),
+        ('generate_tournament_insights', lambda: generate_tournament_insights(frame), rounds, 'rounds'),
+        ('calculate_hole_analysis', lambda: calculate_hole_analysis(frame.hole_scores, players, frame.courses),
+         len(frame.hole_scores), 'hole rows'),
+        ('calculate_player_statistics', lambda: calculate_player_statistics(directory), rows, 'rows'),
+        ('end_to_end', end_to_end, rows, 'rows')
+    ]
+
+def measure(call: Callable[[], Any], repeat: int, memory: bool) -> Dict[str, Any]:
+    """Best wall time of `repeat` runs, then one traced run for peak memory"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    result = {'seconds': round(min(times), 6)}
+    if memory:
+        # Separate run: tracing slows allocation-heavy code several times over
+        tracemalloc.start()
+        try:
+            call()
+            result['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+def run_benchmarks(sizes: List[int], work_dir: str = WORK_DIR, seed: int = 0, repeat: int = 1,
+                   memory: bool = True, only: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Time (and trace) every benchmark at every field size"""
+    results = {}
+    for players in sizes:
+        directory = tournament_dir(work_dir, players, seed)
+        frame = load_tournament_frame(directory)
+        print(f"[{players} players]")
+        size_results = {}
+        for name, call, items, unit in benchmarks(directory, frame):
+            if only and name not in only:
+                continue
+            result = measure(call, repeat, memory)
+            result['items'] = items
+            result['throughput'] = round(items / result['seconds'], 1) if result['seconds'] else None
+            result['unit'] = unit
+            size_results[name] = result
+            memory_note = f", peak {result['peak_memory_bytes'] / 1024 / 1024:.1f} MiB" if memory else ''
+            print(f"  {name}: {result['seconds']:.4f}s ({result['throughput']:,.0f} {unit}/s{memory_note})")
+        # Process-wide high-water mark so far (kilobytes on Linux)
+        size_results['max_rss_bytes'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        results[str(players)] = size_results
+        del frame
+    return {
+        'recorded': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'seed': seed,
+        'sizes': results
+    }
+
+def find_regressions(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = TOLERANCE) -> List[str]:
+    """Benchmarks slower or hungrier than the baseline beyond tolerance (and noise)"""
+    regressions = []
+    for size, size_results in results['sizes'].items():
+        base_size = baseline.get('sizes', {}).get(size, {})
+        for name, result in size_results.items():
+            base = base_size.get(name)
+            if not isinstance(result, dict) or not isinstance(base, dict):
+                continue
+            seconds, base_seconds = result['seconds'], base['seconds']
+            if seconds > base_seconds * (1 + tolerance) and seconds - base_seconds > MIN_SECONDS_DELTA:
+                regressions.append(f"{size} players {name}: {seconds:.4f}s vs {base_seconds:.4f}s baseline "
+                                   f"(+{(seconds / base_seconds - 1) * 100:.0f}%)")
+            peak, base_peak = result.get('peak_memory_bytes'), base.get('peak_memory_bytes')
+            if peak is not None and base_peak and peak > base_peak * (1 + tolerance) and peak - base_peak > MIN_MEMORY_DELTA:
+                regressions.append(f"{size} players {name}: peak {peak:,} bytes vs {base_peak:,} baseline "
+                                   f"(+{(peak / base_peak - 1) * 100:.0f}%)")
+    return regressions
+
+def _save_json(value: Dict[str, Any], filename: str):
+    temp_path = filename + '.tmp'
+    with open(temp_path, 'w') as file:
+        json.dump(value, file, indent=2)
+    os.replace(temp_path, filename)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='field sizes (players) to benchmark')
+    parser.add_argument('--only', nargs='+', metavar='NAME', help='run only these benchmarks')
+    parser.add_argument('--repeat', type=int, default=1, help='runs per benchmark; the fastest counts')
+    parser.add_argument('--no-memory', action='store_true', help='skip the traced run that measures peak memory')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the synthetic tournaments')
+    parser.add_argument('--work-dir', default=WORK_DIR, help='where synthetic tournaments are generated and kept')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='stored results to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='store these results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help='allowed slowdown/growth as a fraction')
+    parser.add_argument('--output', default='benchmark_results.json', help='where to write these results')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.work_dir, args.seed, args.repeat, not args.no_memory, args.only)
+    _save_json(results, args.output)
+    print(f"Benchmark results saved to {os.path.normpath(args.output)}")
+
+    if args.save_baseline:
+        _save_json(results, args.baseline)
+        print(f"Baseline saved to {os.path.normpath(args.baseline)}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as file:
+            regressions = find_regressions(results, json.load(file), args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {os.path.normpath(args.baseline)}:")
+            for line in regressions:
+                print(f"  {line}")
+            raise SystemExit(1)
+        print(f"No regressions against {os.path.normpath(args.baseline)}")
+    else:
+        print(f"No baseline at {os.path.normpath(args.baseline)}; run with --save-baseline to record one")
@@ -3,108 +3,544 @@
 Calculate advanced golf statistics from cleaned tournament data
 """
 
+import argparse
 import csv
+import inspect
 import json
+import os
 import statistics
+from array import array
 from collections import defaultdict
-from typing import Dict, List, Any, Tuple
-
-def load_csv_data(filename: str) -> List[Dict[str, Any]]:
-    """Load data from CSV file"""
-    data = []
-    with open(filename, 'r') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            # Convert numeric fields
-            if 'score' in row and row['score']:
-                row['score'] = int(row['score'])
-            if 'par' in row and row['par']:
-                row['par'] = int(row['par'])
-            if 'day' in row and row['day'] != 'Total':
-                row['day'] = int(row['day'])
-            if 'total_points' in row and row['total_points']:
-                row['total_points'] = float(row['total_points'])
-            if 'stableford_points' in row and row['stableford_points']:
-                row['stableford_points'] = int(row['stableford_points'])
-            data.append(row)
-    return data
-
-def calculate_player_statistics():
-    """Calculate comprehensive statistics for all players"""
-    
-    # Load data
-    individual_scores = load_csv_data('individual_scores.csv')
-    match_play_results = load_csv_data('match_play_results.csv')
-    player_stats = load_csv_data('player_stats.csv')
-    
-    # Get individual players (exclude team entries)
-    individual_players = ['Jimbo', 'Mike', 'Dave', 'Ryan', 'AJ', 'Nixon', 'Todd', 'Doug']
-    
-    results = {
-        'tournament_summary': calculate_tournament_summary(individual_scores, individual_players),
-        'player_statistics': {},
-        'course_analysis': calculate_course_difficulty(individual_scores, individual_players),
-        'head_to_head': calculate_head_to_head_records(match_play_results),
-        'performance_trends': calculate_performance_trends(individual_scores, individual_players),
-        'tournament_insights': generate_tournament_insights(individual_scores, match_play_results, player_stats, individual_players)
+from collections.abc import Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import accumulate
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from course_data import COURSES_FILE, load_courses
+from handicap import player_handicap
+from hole_analysis import calculate_hole_analysis
+from insights import AWARD_LABELS, AWARD_PLACES, INSIGHT_RULES, evaluate_rules
+from match_play import MATCH_PLAY_FORMATS, pairwise_results
+from rank_index import rank_entries
+from stats_cache import CACHE_DIR, SectionCache, fingerprint_files
+from stats_db import DEFAULT_DB, StatsStore, connect, list_events
+from stats_output import write_json_stream
+from stage_profile import start_profiling, stage, stop_profiling
+from trends import trend_rows
+
+# Declared column types for each cleaned CSV (see clean_data.py).
+# Columns not listed here are loaded as text.
+CSV_SCHEMAS: Dict[str, Dict[str, str]] = {
+    'individual_scores.csv': {
+        'course': 'str', 'day': 'day', 'format': 'str', 'par': 'int',
+        'player': 'str', 'score': 'int', 'stableford_points': 'optional_int'
+    },
+    'match_play_results.csv': {
+        'day': 'day', 'format': 'str', 'player': 'str',
+        'possible_points': 'int', 'total_points': 'float'
+    },
+    'player_stats.csv': {
+        'birdies': 'int', 'bogeys': 'int', 'double_bogeys': 'int', 'over_par_holes': 'int',
+        'pars': 'int', 'player': 'str', 'quadruple_bogeys': 'int', 'quintuple_plus': 'int',
+        'scoring_average': 'float', 'total_holes': 'int', 'total_score': 'int',
+        'triple_bogeys': 'int', 'under_par_holes': 'int'
+    },
+    'team_scores.csv': {
+        'day': 'day', 'format': 'str', 'score': 'float', 'team': 'str'
+    },
+    'hole_scores.csv': {
+        'course': 'str', 'day': 'day', 'format': 'str', 'hole': 'int',
+        'par': 'int', 'player': 'str', 'strokes': 'int'
     }
-    
-    # Calculate detailed stats for each player
-    for player in individual_players:
-        results['player_statistics'][player] = calculate_individual_player_stats(
-            player, individual_scores, match_play_results, player_stats
-        )
-    
+}
+
+# Course ratings and stroke indexes live next to the pipeline scripts
+COURSES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), COURSES_FILE)
+
+PROFILE_FILE = 'calculate_stats_profile.json'
+
+TOTAL_DAY = 0                    # team_scores.csv labels the tournament total row 'Total'
+MISSING_INT = -(2 ** 31)         # blank optional integers (e.g. stableford_points)
+DOMINANT_POINTS = 10             # match play points at or above which a player dominated
+STRUGGLED_POINTS = 7             # ... and at or below which they struggled
+
+def _parse_day(value: str) -> int:
+    return TOTAL_DAY if value == 'Total' else int(value)
+
+def _parse_optional_int(value: str) -> int:
+    return int(value) if value else MISSING_INT
+
+# kind -> (array typecode, parser); text columns are dictionary-encoded
+_COLUMN_KINDS = {
+    'int': ('l', int),
+    'float': ('d', float),
+    'day': ('b', _parse_day),
+    'optional_int': ('l', _parse_optional_int),
+    'str': ('L', None)
+}
+
+class RowView(Mapping):
+    """Read-only dict view of one row of a ColumnTable"""
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: 'ColumnTable', index: int):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, name: str) -> Any:
+        return self._table.value(name, self._index)
+
+    def __iter__(self):
+        return iter(self._table.fieldnames)
+
+    def __len__(self) -> int:
+        return len(self._table.fieldnames)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+class ColumnTable:
+    """Typed, column-oriented table loaded from a cleaned CSV file.
+
+    Each column is a compact array; text columns store integer codes into a
+    per-column list of distinct values. Iterating yields lazy RowView
+    mappings so callers written against the old list-of-dicts keep working.
+    """
+
+    def __init__(self, fieldnames: List[str], kinds: Dict[str, str]):
+        self.fieldnames = fieldnames
+        self.kinds = {name: kinds.get(name, 'str') for name in fieldnames}
+        self.columns = {name: array(_COLUMN_KINDS[kind][0]) for name, kind in self.kinds.items()}
+        self.levels = {name: [] for name, kind in self.kinds.items() if kind == 'str'}
+        self._codes = {name: {} for name in self.levels}
+        self._length = 0
+
+    def append(self, values: List[str]):
+        """Append one raw CSV record, converting each field to its column type"""
+        for name, raw in zip(self.fieldnames, values):
+            kind = self.kinds[name]
+            if kind == 'str':
+                codes = self._codes[name]
+                code = codes.get(raw)
+                if code is None:
+                    code = codes[raw] = len(self.levels[name])
+                    self.levels[name].append(raw)
+                self.columns[name].append(code)
+            else:
+                self.columns[name].append(_COLUMN_KINDS[kind][1](raw))
+        self._length += 1
+
+    def append_values(self, values: Iterable[Any]):
+        """Append one already-typed record, e.g. a database row"""
+        for name, value in zip(self.fieldnames, values):
+            kind = self.kinds[name]
+            if kind == 'str':
+                codes = self._codes[name]
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(self.levels[name])
+                    self.levels[name].append(value)
+                self.columns[name].append(code)
+            elif kind == 'day':
+                self.columns[name].append(TOTAL_DAY if value in (None, 'Total') else value)
+            elif kind == 'optional_int':
+                self.columns[name].append(MISSING_INT if value is None else value)
+            else:
+                self.columns[name].append(value)
+        self._length += 1
+
+    def value(self, name: str, index: int) -> Any:
+        """Decoded value of one cell"""
+        kind = self.kinds[name]
+        raw = self.columns[name][index]
+        if kind == 'str':
+            return self.levels[name][raw]
+        if kind == 'day' and raw == TOTAL_DAY:
+            return 'Total'
+        if kind == 'optional_int' and raw == MISSING_INT:
+            return None
+        return raw
+
+    def column(self, name: str) -> List[Any]:
+        """Decoded values of a whole column"""
+        kind = self.kinds[name]
+        if kind == 'str':
+            levels = self.levels[name]
+            return [levels[code] for code in self.columns[name]]
+        if kind in ('day', 'optional_int'):
+            return [self.value(name, i) for i in range(self._length)]
+        return list(self.columns[name])
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> RowView:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('row index out of range')
+        return RowView(self, index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield RowView(self, index)
+
+def load_csv_data(filename: str) -> ColumnTable:
+    """Stream a cleaned CSV file into typed columns using its declared schema"""
+    schema = CSV_SCHEMAS.get(os.path.basename(filename), {})
+    with stage(f'load_csv_data:{os.path.normpath(filename)}') as profile, open(filename, 'r', newline='') as file:
+        reader = csv.reader(file)
+        fieldnames = next(reader, [])
+        table = ColumnTable(fieldnames, schema)
+        for record in reader:
+            table.append(record)
+        profile['rows'] = len(table)
+    return table
+
+def load_optional_csv(filename: str) -> Optional[ColumnTable]:
+    """Like load_csv_data, but None for a table clean_data.py did not write (it skips empty ones)"""
+    return load_csv_data(filename) if os.path.exists(filename) else None
+
+TEAM_FORMATS = ('Scramble', 'Best Ball Team')
+
+class TournamentFrame:
+    """Individual rounds indexed by player, course and day.
+
+    Built once per run so every stats function reads pre-grouped rounds
+    instead of re-filtering the raw score list for each player. Each table
+    is indexed on its own, so a re-read table can be swapped in without
+    re-indexing the others.
+    """
+
+    def __init__(self, individual_scores: ColumnTable, match_play_results: Optional[ColumnTable],
+                 player_stats: Optional[ColumnTable], players: List[str], store: Optional[StatsStore] = None,
+                 hole_scores: Optional[ColumnTable] = None):
+        self.players = players
+        self.store = store  # SQLite backend: aggregates come from SQL instead of Python loops
+        self.courses = load_courses(COURSES_PATH) if os.path.exists(COURSES_PATH) else {}
+        self.individual_scores = individual_scores
+        self._index_rounds()
+        self._index_match_play(match_play_results)
+        self._index_player_stats(player_stats)
+        self._index_hole_scores(hole_scores)
+
+    def _index_rounds(self):
+        # Individual rounds only (exclude team formats), in file order
+        self.rounds = []
+        self.by_player = defaultdict(list)
+        self.by_course = defaultdict(list)
+        self.by_day = defaultdict(list)
+
+        roster = set(self.players)
+        for score in self.individual_scores:
+            if score['player'] not in roster or score['format'] in TEAM_FORMATS:
+                continue
+            self.rounds.append(score)
+            self.by_player[score['player']].append(score)
+            self.by_course[score['course']].append(score)
+            self.by_day[score['day']].append(score)
+
+    def _index_match_play(self, match_play_results: Optional[ColumnTable]):
+        # Events without match play days or a summary table have no such files
+        self.match_play_results = match_play_results if match_play_results is not None else []
+        # First row per player, matching the previous next(...) lookups
+        self.match_play = {}
+        for result in self.match_play_results:
+            self.match_play.setdefault(result['player'], result)
+
+    def _index_player_stats(self, player_stats: Optional[ColumnTable]):
+        self.player_stats = player_stats if player_stats is not None else []
+        self.detailed_stats = {}
+        for stats in self.player_stats:
+            self.detailed_stats.setdefault(stats['player'], stats)
+
+    def _index_hole_scores(self, hole_scores: Optional[ColumnTable]):
+        self.hole_scores = hole_scores if hole_scores is not None else []  # older exports have none
+        # Hole-by-hole strokes per player and day
+        self.hole_cards = defaultdict(dict)
+        for row in self.hole_scores:
+            self.hole_cards[row['player']].setdefault(row['day'], {})[row['hole']] = row['strokes']
+
+    def replace_table(self, filename: str, table: Optional[ColumnTable]):
+        """Swap in a re-read table (by CSV name) and rebuild only its indexes; individual scores re-derive the roster"""
+        if filename == 'individual_scores.csv':
+            self.individual_scores = table
+            self.players = derive_roster(table)
+            self._index_rounds()
+        elif filename == 'match_play_results.csv':
+            self._index_match_play(table)
+        elif filename == 'player_stats.csv':
+            self._index_player_stats(table)
+        elif filename == 'hole_scores.csv':
+            self._index_hole_scores(table)
+        else:
+            raise ValueError(f"Unknown table: {filename}")
+
+    def player_rows(self, filename: str) -> Mapping[str, Any]:
+        """A table's per-player index (rounds, match play row, summary row or hole cards), comparable by value"""
+        return {
+            'individual_scores.csv': self.by_player,
+            'match_play_results.csv': self.match_play,
+            'player_stats.csv': self.detailed_stats,
+            'hole_scores.csv': self.hole_cards
+        }[filename]
+
+    def player_hole_cards(self, player: str) -> Dict[int, List[int]]:
+        """Day -> strokes in hole order for a player"""
+        return {day: [card[hole] for hole in sorted(card)] for day, card in self.hole_cards.get(player, {}).items()}
+
+    def player_rounds(self, player: str) -> List[Dict]:
+        """Individual rounds for a player, in file order"""
+        return self.by_player.get(player, [])
+
+def derive_roster(individual_scores: Iterable[Mapping]) -> List[str]:
+    """Individual players (exclude team entries), in order of first appearance"""
+    roster = {}
+    for score in individual_scores:
+        if score['format'] not in TEAM_FORMATS:
+            roster.setdefault(score['player'], None)
+    return list(roster)
+
+class SqliteSource(NamedTuple):
+    """One event stored in the SQLite database written by clean_data.py --sqlite"""
+    db_path: str
+    event: str
+
+def load_tournament_frame(source: Union[str, SqliteSource] = '.') -> TournamentFrame:
+    """Load one tournament's cleaned tables (a CSV directory or a database event) and index them"""
+    if isinstance(source, SqliteSource):
+        store = StatsStore(source.db_path, source.event)
+        tables = {}
+        for table in ('individual_scores', 'match_play_results', 'player_stats', 'hole_scores'):
+            with stage(f'fetch_table:{source.event}.{table}') as profile:
+                names, rows = store.fetch_table(table)
+                tables[table] = ColumnTable(names, CSV_SCHEMAS[f'{table}.csv'])
+                for row in rows:
+                    tables[table].append_values(row)
+                profile['rows'] = len(tables[table])
+        individual_scores = tables['individual_scores']
+        with stage(f'index_frame:{source.event}', len(individual_scores)):
+            return TournamentFrame(individual_scores, tables['match_play_results'], tables['player_stats'],
+                                   derive_roster(individual_scores), store, tables['hole_scores'])
+    
+    individual_scores = load_csv_data(os.path.join(source, 'individual_scores.csv'))
+    match_play_results = load_optional_csv(os.path.join(source, 'match_play_results.csv'))
+    player_stats = load_optional_csv(os.path.join(source, 'player_stats.csv'))
+    hole_scores = load_optional_csv(os.path.join(source, 'hole_scores.csv'))
+    
+    with stage(f'index_frame:{os.path.normpath(source)}', len(individual_scores)):
+        return TournamentFrame(individual_scores, match_play_results, player_stats, derive_roster(individual_scores),
+                               hole_scores=hole_scores)
+
+# Result sections in output order; each player's entry follows as 'player_statistics.<name>'
+SECTIONS = ['tournament_summary', 'course_analysis', 'head_to_head', 'performance_trends', 'tournament_insights',
+            'hole_analysis']
+PLAYER_SECTION_PREFIX = 'player_statistics.'
+
+# Cleaned tables each section reads besides the roster; a player's section reads only that player's rows
+# (TournamentFrame.player_rows) of every table
+SECTION_TABLES = {
+    'tournament_summary': ['individual_scores.csv'],
+    'course_analysis': ['individual_scores.csv'],
+    'head_to_head': ['match_play_results.csv', 'hole_scores.csv'],
+    'performance_trends': ['individual_scores.csv'],
+    'tournament_insights': ['individual_scores.csv', 'match_play_results.csv', 'player_stats.csv'],
+    'hole_analysis': ['hole_scores.csv']
+}
+
+def section_names(frame: TournamentFrame) -> List[str]:
+    """Every independently computable section of the results"""
+    return SECTIONS + [PLAYER_SECTION_PREFIX + player for player in frame.players]
+
+def compute_section(frame: TournamentFrame, name: str) -> Any:
+    """Compute one results section from the frame"""
+    if name.startswith(PLAYER_SECTION_PREFIX):
+        return calculate_individual_player_stats(name[len(PLAYER_SECTION_PREFIX):], frame)
+    if name == 'tournament_summary':
+        return calculate_tournament_summary(frame)
+    if name == 'course_analysis':
+        return calculate_course_difficulty(frame)
+    if name == 'head_to_head':
+        return calculate_head_to_head_records(frame.match_play_results, frame.hole_scores, frame.players)
+    if name == 'performance_trends':
+        return calculate_performance_trends(frame)
+    if name == 'tournament_insights':
+        return generate_tournament_insights(frame)
+    if name == 'hole_analysis':
+        return calculate_hole_analysis(frame.hole_scores, frame.players, frame.courses)
+    raise ValueError(f"Unknown section: {name}")
+
+def section_inputs(frame: TournamentFrame, name: str) -> Any:
+    """Input rows a section depends on, used as its cache key"""
+    if name.startswith(PLAYER_SECTION_PREFIX):
+        player = name[len(PLAYER_SECTION_PREFIX):]
+        return [
+            [dict(r) for r in frame.player_rounds(player)],
+            dict(frame.detailed_stats.get(player, {})),
+            dict(frame.match_play.get(player, {})),
+            frame.player_hole_cards(player)
+        ]
+    if name == 'head_to_head':
+        match_play_holes = [dict(r) for r in frame.hole_scores if r['format'] in MATCH_PLAY_FORMATS]
+        return [frame.players, [dict(r) for r in frame.match_play_results], match_play_holes]
+    if name == 'hole_analysis':
+        return [frame.players, [dict(r) for r in frame.hole_scores]]
+    
+    rounds = [dict(r) for r in frame.rounds]
+    if name == 'course_analysis':
+        return rounds
+    if name == 'tournament_insights':
+        return [frame.players, rounds, [dict(r) for r in frame.match_play_results], [dict(r) for r in frame.player_stats]]
+    return [frame.players, rounds]
+
+_worker_frames: Dict[Tuple, TournamentFrame] = {}
+
+def frame_key(source: Union[str, SqliteSource]) -> Tuple:
+    """Identity plus modification times of a tournament's tables; changes whenever they are rewritten"""
+    if isinstance(source, SqliteSource):
+        return (os.path.abspath(source.db_path), source.event, os.stat(source.db_path).st_mtime_ns)
+    paths = [os.path.join(source, name) for name in ('individual_scores.csv', 'match_play_results.csv', 'player_stats.csv', 'hole_scores.csv')]
+    return (os.path.abspath(source),) + tuple(os.stat(path).st_mtime_ns if os.path.exists(path) else None for path in paths)
+
+def compute_section_in_worker(source: Union[str, SqliteSource], name: str) -> Any:
+    """Process-pool entry point: each worker loads a tournament once and reuses it"""
+    key = frame_key(source)
+    if key not in _worker_frames:
+        _worker_frames[key] = load_tournament_frame(source)
+    return compute_section(_worker_frames[key], name)
+
+_DEFERRED = object()
+
+def plan_sections(source: Union[str, SqliteSource] = '.', cache: Optional[SectionCache] = None,
+                  executor: Optional[Executor] = None) -> Dict[str, Any]:
+    """Load a tournament and start computing every section not found in the cache"""
+    frame = load_tournament_frame(source)
+    pending = []
+    
+    for name in section_names(frame):
+        if executor is None:
+            # Serial runs compute each section only when the output reaches it
+            pending.append((name, None, _DEFERRED))
+            continue
+        key = None
+        if cache is not None:
+            hit, value, key = cache.lookup(name, section_inputs(frame, name))
+            if hit:
+                pending.append((name, None, value))
+                continue
+        pending.append((name, key, executor.submit(compute_section_in_worker, source, name)))
+    
+    return {'frame': frame, 'players': frame.players, 'cache': cache, 'pending': pending}
+
+def _resolve_section(plan: Dict[str, Any], name: str, key: Optional[str], value: Any) -> Any:
+    with stage(f'section:{name}'):
+        cache = plan['cache']
+        if value is _DEFERRED:
+            frame = plan['frame']
+            if cache is None:
+                return compute_section(frame, name)
+            return cache.get_or_compute(name, section_inputs(frame, name), lambda: compute_section(frame, name))
+        if isinstance(value, Future):
+            value = value.result()
+        if key is not None:
+            cache.store(name, key, value)
+        return value
+
+def iter_results(plan: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+    """Yield the top-level results in output order, resolving each section as it is reached
+
+    'player_statistics' is yielded as an iterator of (player, stats) pairs
+    that must be consumed before advancing to the next section. Nothing is
+    retained once yielded, so a consumer that writes sections out as they
+    arrive holds at most one section in memory.
+    """
+    pending = {name: (key, value) for name, key, value in plan['pending']}
+    plan['pending'] = []
+    
+    def resolve(name: str) -> Any:
+        key, value = pending.pop(name)
+        return _resolve_section(plan, name, key, value)
+    
+    yield 'tournament_summary', resolve('tournament_summary')
+    yield 'player_statistics', ((player, resolve(PLAYER_SECTION_PREFIX + player)) for player in plan['players'])
+    for name in SECTIONS[1:]:
+        yield name, resolve(name)
+    
+    cache = plan['cache']
+    if cache is not None:
+        cache.prune()
+        print(cache.report())
+
+def assemble_results(plan: Dict[str, Any]) -> Dict[str, Any]:
+    """Wait for a plan's sections and merge them in the fixed output order"""
+    results = {}
+    for name, value in iter_results(plan):
+        results[name] = dict(value) if name == 'player_statistics' else value
     return results
 
-def calculate_tournament_summary(individual_scores: List[Dict], players: List[str]) -> Dict[str, Any]:
+def calculate_player_statistics(source: Union[str, SqliteSource] = '.', cache: Optional[SectionCache] = None,
+                                executor: Optional[Executor] = None) -> Dict[str, Any]:
+    """Calculate comprehensive statistics for all players"""
+    return assemble_results(plan_sections(source, cache, executor))
+
+def find_tournament_dirs(root: str) -> List[str]:
+    """Directories under root holding a cleaned tournament, in sorted order"""
+    found = []
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith('.'))
+        if 'individual_scores.csv' in files:
+            found.append(directory)
+    return found
+
+def calculate_tournament_summary(frame: TournamentFrame) -> Dict[str, Any]:
     """Calculate overall tournament summary"""
     
-    # Get individual rounds only (exclude team formats)
-    individual_rounds = [
-        score for score in individual_scores 
-        if score['player'] in players and score['format'] != 'Scramble'
-    ]
-    
-    # Calculate total scores for final leaderboard
-    player_totals = defaultdict(int)
-    rounds_played = defaultdict(int)
-    
-    for score in individual_rounds:
-        if score['format'] != 'Best Ball Team':  # Only individual scores
-            player_totals[score['player']] += score['score']
-            rounds_played[score['player']] += 1
-    
-    # Create leaderboard
+    # Total score and rounds per player, from SQL or from the indexed rounds
+    if frame.store is not None:
+        player_totals = frame.store.player_totals()
+        total_rounds, courses_played = frame.store.round_counts()
+    else:
+        player_totals = []
+        for player in frame.players:
+            player_rounds = frame.player_rounds(player)
+            if player_rounds:
+                player_totals.append((player, sum(r['score'] for r in player_rounds), len(player_rounds)))
+        total_rounds, courses_played = len(frame.rounds), len(frame.by_course)
+    
+    # Create leaderboard, ranked by one stable sort (ties stay in player order)
     leaderboard = []
-    for player in players:
-        if player in player_totals:
-            leaderboard.append({
-                'player': player,
-                'total_score': player_totals[player],
-                'rounds_played': rounds_played[player],
-                'scoring_average': round(player_totals[player] / rounds_played[player], 2) if rounds_played[player] > 0 else 0
-            })
-    
-    leaderboard.sort(key=lambda x: x['total_score'])
+    for rank, (player, total_score, rounds_played), percentile in rank_entries(player_totals, itemgetter(1)):
+        leaderboard.append({
+            'player': player,
+            'total_score': total_score,
+            'rounds_played': rounds_played,
+            'scoring_average': round(total_score / rounds_played, 2),
+            'rank': rank,
+            'percentile': percentile
+        })
     
     return {
         'winner': leaderboard[0]['player'] if leaderboard else None,
         'winning_score': leaderboard[0]['total_score'] if leaderboard else None,
         'leaderboard': leaderboard,
-        'total_rounds': len([s for s in individual_rounds if s['format'] != 'Best Ball Team']),
-        'courses_played': len(set(s['course'] for s in individual_rounds))
+        'total_rounds': total_rounds,
+        'courses_played': courses_played
     }
 
-def calculate_individual_player_stats(player: str, individual_scores: List[Dict], 
-                                    match_play_results: List[Dict], player_stats: List[Dict]) -> Dict[str, Any]:
+def course_aggregates(course_rounds: Dict[str, List[Mapping]]) -> List[Tuple[str, int, int, int, int, int]]:
+    """(course, rounds, score sum, over-par sum, best, worst) per course, in Python"""
+    aggregates = []
+    for course, rounds in course_rounds.items():
+        scores = [r['score'] for r in rounds]
+        aggregates.append((course, len(scores), sum(scores), sum(r['score'] - r['par'] for r in rounds),
+                           min(scores), max(scores)))
+    return aggregates
+
+def calculate_individual_player_stats(player: str, frame: TournamentFrame) -> Dict[str, Any]:
     """Calculate comprehensive statistics for a single player"""
     
-    # Get player's individual rounds (exclude team formats)
-    player_rounds = [
-        score for score in individual_scores 
-        if score['player'] == player and score['format'] not in ['Scramble', 'Best Ball Team']
-    ]
+    player_rounds = frame.player_rounds(player)
     
     if not player_rounds:
         return {}
@@ -114,10 +550,10 @@ def calculate_individual_player_stats(player: str, individual_scores: List[Dict]
     relative_scores = [score - par for score, par in zip(scores, pars)]
     
     # Get detailed stats
-    detailed_stats = next((stats for stats in player_stats if stats['player'] == player), {})
+    detailed_stats = frame.detailed_stats.get(player, {})
     
     # Get match play performance
-    match_play = next((mp for mp in match_play_results if mp['player'] == player), {})
+    match_play = frame.match_play.get(player, {})
     
     # Calculate best and worst rounds
     best_round = min(scores) if scores else None
@@ -155,7 +591,7 @@ def calculate_individual_player_stats(player: str, individual_scores: List[Dict]
         'consistency': {
             'score_standard_deviation': consistency_score,
             'relative_par_standard_deviation': consistency_relative,
-            'consistency_rating': 'Excellent' if consistency_score < 5 else 'Good' if consistency_score < 8 else 'Average' if consistency_score < 12 else 'Poor'
+            'consistency_rating': consistency_rating(consistency_score)
         },
         'detailed_performance': {
             'birdies': int(detailed_stats.get('birdies', 0)),
@@ -169,71 +605,68 @@ def calculate_individual_player_stats(player: str, individual_scores: List[Dict]
         },
         'match_play_performance': {
             'total_points': float(match_play.get('total_points', 0)),
-            'possible_points': 18,
-            'win_percentage': round((float(match_play.get('total_points', 0)) / 18) * 100, 1) if match_play else 0
+            'possible_points': match_play.get('possible_points') or 18,
+            'win_percentage': round((float(match_play.get('total_points', 0)) / (match_play.get('possible_points') or 18)) * 100, 1) if match_play else 0
         },
         'daily_performance': daily_performance,
-        'course_performance': calculate_course_performance(player, player_rounds)
+        'course_performance': calculate_course_performance(player, player_rounds, frame.store),
+        'handicap': player_handicap(sorted(player_rounds, key=lambda r: r['day']), frame.player_hole_cards(player), frame.courses)
     }
 
-def calculate_course_performance(player: str, player_rounds: List[Dict]) -> Dict[str, Any]:
+def consistency_rating(score_standard_deviation: float) -> str:
+    """Label for the spread of a player's round scores"""
+    if score_standard_deviation < 5:
+        return 'Excellent'
+    if score_standard_deviation < 8:
+        return 'Good'
+    if score_standard_deviation < 12:
+        return 'Average'
+    return 'Poor'
+
+def calculate_course_performance(player: str, player_rounds: List[Dict], store: Optional[StatsStore] = None) -> Dict[str, Any]:
     """Calculate performance by course for a player"""
-    course_stats = defaultdict(list)
-    
-    for round_data in player_rounds:
-        course = round_data['course']
-        relative_score = round_data['score'] - round_data['par']
-        course_stats[course].append({
-            'score': round_data['score'],
-            'par': round_data['par'],
-            'relative': relative_score,
-            'day': round_data['day']
-        })
+    if store is not None:
+        aggregates = store.course_aggregates(player)
+    else:
+        course_rounds = defaultdict(list)
+        for round_data in player_rounds:
+            course_rounds[round_data['course']].append(round_data)
+        aggregates = course_aggregates(course_rounds)
     
     course_performance = {}
-    for course, rounds in course_stats.items():
-        scores = [r['score'] for r in rounds]
-        relatives = [r['relative'] for r in rounds]
+    for course, rounds_played, score_sum, relative_sum, best, _ in aggregates:
+        avg_relative = relative_sum / rounds_played
         
         course_performance[course] = {
-            'rounds_played': len(rounds),
-            'average_score': round(sum(scores) / len(scores), 2),
-            'average_relative_to_par': round(sum(relatives) / len(relatives), 2),
-            'best_round': min(scores),
-            'performance_rating': 'Excellent' if sum(relatives) / len(relatives) < 0 else 'Good' if sum(relatives) / len(relatives) < 5 else 'Average' if sum(relatives) / len(relatives) < 10 else 'Struggled'
+            'rounds_played': rounds_played,
+            'average_score': round(score_sum / rounds_played, 2),
+            'average_relative_to_par': round(avg_relative, 2),
+            'best_round': best,
+            'performance_rating': 'Excellent' if avg_relative < 0 else 'Good' if avg_relative < 5 else 'Average' if avg_relative < 10 else 'Struggled'
         }
     
     return course_performance
 
-def calculate_course_difficulty(individual_scores: List[Dict], players: List[str]) -> Dict[str, Any]:
+def calculate_course_difficulty(frame: TournamentFrame) -> Dict[str, Any]:
     """Analyze course difficulty based on player performance"""
     
-    # Get individual rounds only
-    individual_rounds = [
-        score for score in individual_scores 
-        if score['player'] in players and score['format'] not in ['Scramble', 'Best Ball Team']
-    ]
-    
-    course_stats = defaultdict(lambda: {'scores': [], 'relative_scores': []})
-    
-    for round_data in individual_rounds:
-        course = round_data['course']
-        relative_score = round_data['score'] - round_data['par']
-        course_stats[course]['scores'].append(round_data['score'])
-        course_stats[course]['relative_scores'].append(relative_score)
+    if frame.store is not None:
+        aggregates = frame.store.course_aggregates()
+    else:
+        aggregates = course_aggregates(frame.by_course)
     
     course_analysis = {}
-    for course, stats in course_stats.items():
-        avg_score = sum(stats['scores']) / len(stats['scores'])
-        avg_relative = sum(stats['relative_scores']) / len(stats['relative_scores'])
+    for course, rounds_played, score_sum, relative_sum, best, worst in aggregates:
+        avg_score = score_sum / rounds_played
+        avg_relative = relative_sum / rounds_played
         
         course_analysis[course] = {
             'average_score': round(avg_score, 2),
             'average_over_par': round(avg_relative, 2),
-            'rounds_played': len(stats['scores']),
+            'rounds_played': rounds_played,
             'difficulty_rating': 'Very Hard' if avg_relative > 15 else 'Hard' if avg_relative > 10 else 'Moderate' if avg_relative > 5 else 'Manageable',
-            'best_score': min(stats['scores']),
-            'worst_score': max(stats['scores'])
+            'best_score': best,
+            'worst_score': worst
         }
     
     # Rank courses by difficulty
@@ -244,42 +677,44 @@ def calculate_course_difficulty(individual_scores: List[Dict], players: List[str
         'difficulty_ranking': [{'course': course, 'avg_over_par': stats['average_over_par']} for course, stats in sorted_courses]
     }
 
-def calculate_head_to_head_records(match_play_results: List[Dict]) -> Dict[str, Any]:
+def calculate_head_to_head_records(match_play_results: Iterable[Mapping], hole_scores: Iterable[Mapping] = (),
+                                   players: Optional[List[str]] = None) -> Dict[str, Any]:
     """Calculate head-to-head records from match play day"""
     
-    # Sort players by match play points
-    sorted_players = sorted(match_play_results, key=lambda x: x['total_points'], reverse=True)
+    # Rank players by match play points
+    ranked = list(rank_entries(match_play_results, itemgetter('total_points'), lower_is_better=False))
+    leaderboard = [
+        {
+            'player': player['player'],
+            'points': player['total_points'],
+            'percentage': round((player['total_points'] / (player['possible_points'] or 18)) * 100, 1),
+            'rank': rank,
+            'percentile': percentile
+        }
+        for rank, player, percentile in ranked
+    ]
     
     head_to_head = {
-        'match_play_leaderboard': [
-            {
-                'player': player['player'],
-                'points': player['total_points'],
-                'percentage': round((player['total_points'] / 18) * 100, 1)
-            }
-            for player in sorted_players
-        ],
-        'match_play_champion': sorted_players[0]['player'] if sorted_players else None,
-        'dominant_performers': [p for p in sorted_players if p['total_points'] >= 10],
-        'struggled_performers': [p for p in sorted_players if p['total_points'] <= 7]
+        'match_play_leaderboard': leaderboard,
+        'match_play_champion': leaderboard[0]['player'] if leaderboard else None,
+        'dominant_performers': [dict(player) for _, player, _ in ranked if player['total_points'] >= DOMINANT_POINTS],
+        'struggled_performers': [dict(player) for _, player, _ in ranked if player['total_points'] <= STRUGGLED_POINTS]
     }
     
+    # Every player against every other, played out from the hole-by-hole cards
+    pairwise = pairwise_results(hole_scores, players)
+    if pairwise['rounds']:
+        head_to_head['pairwise'] = pairwise
+    
     return head_to_head
 
-def calculate_performance_trends(individual_scores: List[Dict], players: List[str]) -> Dict[str, Any]:
+def calculate_performance_trends(frame: TournamentFrame) -> Dict[str, Any]:
     """Calculate performance trends across the 4 days"""
     
-    # Get individual rounds only
-    individual_rounds = [
-        score for score in individual_scores 
-        if score['player'] in players and score['format'] not in ['Scramble', 'Best Ball Team']
-    ]
-    
     player_trends = {}
     
-    for player in players:
-        player_rounds = [r for r in individual_rounds if r['player'] == player]
-        player_rounds.sort(key=lambda x: x['day'])
+    for player in frame.players:
+        player_rounds = sorted(frame.player_rounds(player), key=lambda x: x['day'])
         
         if len(player_rounds) < 2:
             continue
@@ -316,6 +751,16 @@ def calculate_performance_trends(individual_scores: List[Dict], players: List[st
                 'consistency_across_days': round(statistics.stdev(daily_scores), 2) if len(daily_scores) > 1 else 0
             }
     
+    # Slope, current form and change points for every player in one batch over a ragged array; the
+    # per-round form and rolling lines are left out, as the dashboard charts the daily scores instead.
+    offsets = array('l', [0])
+    offsets.extend(accumulate(len(trend['daily_relative_to_par']) for trend in player_trends.values()))
+    batch = trend_rows([value for trend in player_trends.values() for value in trend['daily_relative_to_par']], offsets)
+    for trend, (_, slope, form, change_point) in zip(player_trends.values(), batch):
+        trend['slope_per_round'] = slope
+        trend['current_form'] = form
+        trend['change_point'] = change_point
+    
     return player_trends
 
 def find_best_improvement(scores: List[int]) -> str:
@@ -334,126 +779,226 @@ def find_best_improvement(scores: List[int]) -> str:
     
     return best_day if best_improvement > 0 else 'No significant improvement'
 
-def generate_tournament_insights(individual_scores: List[Dict], match_play_results: List[Dict], 
-                               player_stats: List[Dict], players: List[str]) -> Dict[str, Any]:
+def generate_tournament_insights(frame: TournamentFrame, places: int = AWARD_PLACES) -> Dict[str, Any]:
     """Generate fun facts and insights about the tournament"""
-    
-    # Get individual rounds
-    individual_rounds = [
-        score for score in individual_scores 
-        if score['player'] in players and score['format'] not in ['Scramble', 'Best Ball Team']
-    ]
-    
-    # Calculate various superlatives
-    player_totals = defaultdict(int)
-    player_rounds_count = defaultdict(int)
-    
-    for round_data in individual_rounds:
-        player_totals[round_data['player']] += round_data['score']
-        player_rounds_count[round_data['player']] += 1
-    
-    # Find various achievements
-    lowest_round = min(individual_rounds, key=lambda x: x['score'])
-    highest_round = max(individual_rounds, key=lambda x: x['score'])
-    
-    # Most consistent player (lowest standard deviation)
-    most_consistent = None
-    lowest_std = float('inf')
-    
-    for player in players:
-        player_scores = [r['score'] for r in individual_rounds if r['player'] == player]
-        if len(player_scores) > 1:
-            std = statistics.stdev(player_scores)
-            if std < lowest_std:
-                lowest_std = std
-                most_consistent = player
-    
-    # Match play dominator
-    match_play_winner = max(match_play_results, key=lambda x: x['total_points'])
-    
-    # Most birdies, most big numbers
-    most_birdies = max(player_stats, key=lambda x: int(x.get('birdies', 0)))
-    most_pars = max(player_stats, key=lambda x: int(x.get('pars', 0)))
-    most_big_numbers = max(player_stats, key=lambda x: int(x.get('quadruple_bogeys', 0)) + int(x.get('quintuple_plus', 0)))
+    # Every superlative is a rule in INSIGHT_RULES, evaluated in one scan of each table
+    ranked = evaluate_rules(INSIGHT_RULES, {
+        'rounds': frame.rounds,
+        'match_play': frame.match_play_results,
+        'player_stats': frame.player_stats
+    }, places)
+    
+    def leader(name: str) -> Tuple[Any, Any]:
+        """(value, entry) of an award's winner; the earliest among ties, as min()/max() picked"""
+        return (ranked[name][0][1], ranked[name][0][2]) if ranked[name] else (None, None)
+    
+    _, champion = leader('tournament_champion')
+    _, lowest_round = leader('lowest_single_round')
+    _, highest_round = leader('highest_single_round')
+    lowest_std, most_consistent = leader('most_consistent_player')
+    match_play_points, match_play_winner = leader('match_play_dominator')
+    birdies, most_birdies = leader('birdie_machine')
+    pars, most_pars = leader('steady_eddie')
+    big_numbers, most_big_numbers = leader('big_number_specialist')
     
     return {
-        'tournament_champion': min(player_totals.items(), key=lambda x: x[1])[0] if player_totals else None,
-        'lowest_single_round': {
-            'player': lowest_round['player'],
-            'score': lowest_round['score'],
-            'course': lowest_round['course'],
-            'day': lowest_round['day']
-        },
-        'highest_single_round': {
-            'player': highest_round['player'],
-            'score': highest_round['score'],
-            'course': highest_round['course'],
-            'day': highest_round['day']
-        },
+        'tournament_champion': champion,
+        'lowest_single_round': lowest_round,
+        'highest_single_round': highest_round,
         'most_consistent_player': {
             'player': most_consistent,
             'standard_deviation': round(lowest_std, 2) if most_consistent else None
         },
         'match_play_dominator': {
-            'player': match_play_winner['player'],
-            'points': match_play_winner['total_points']
+            'player': match_play_winner,
+            'points': match_play_points
         },
         'birdie_machine': {
-            'player': most_birdies['player'],
-            'birdies': int(most_birdies['birdies'])
+            'player': most_birdies,
+            'birdies': birdies
         },
         'steady_eddie': {
-            'player': most_pars['player'],
-            'pars': int(most_pars['pars'])
+            'player': most_pars,
+            'pars': pars
         },
         'big_number_specialist': {
-            'player': most_big_numbers['player'],
-            'big_numbers': int(most_big_numbers['quadruple_bogeys']) + int(most_big_numbers['quintuple_plus'])
+            'player': most_big_numbers,
+            'big_numbers': big_numbers
         },
-        'fun_facts': generate_fun_facts(individual_rounds, match_play_results, player_stats, players)
+        'fun_facts': generate_fun_facts(ranked),
+        'awards': {
+            name: [_award_entry(rank, value, entry, label) for rank, value, entry in ranked[name]]
+            for name, label in AWARD_LABELS.items()
+        }
     }
 
-def generate_fun_facts(individual_rounds: List[Dict], match_play_results: List[Dict], 
-                      player_stats: List[Dict], players: List[str]) -> List[str]:
-    """Generate a list of fun facts about the tournament"""
+def _award_entry(rank: int, value: Any, entry: Any, label: str) -> Dict[str, Any]:
+    """One place in an award: rounds keep their details, players and courses are named by label"""
+    details = entry if isinstance(entry, dict) else {label: entry}
+    return {'rank': rank, **details, 'value': round(value, 2) if isinstance(value, float) else value}
+
+def generate_fun_facts(ranked: Dict[str, List[Tuple[int, Any, Any]]]) -> List[str]:
+    """Generate a list of fun facts about the tournament from the evaluated insight rules"""
     facts = []
+    total = {name: entries[0][1] for name, entries in ranked.items() if name not in AWARD_LABELS}
     
     # Total strokes
-    total_strokes = sum(r['score'] for r in individual_rounds)
-    facts.append(f"The group combined for {total_strokes} total strokes across all individual rounds")
+    facts.append(f"The group combined for {total['total_strokes']} total strokes across all individual rounds")
     
     # Course comparisons
-    course_averages = defaultdict(list)
-    for round_data in individual_rounds:
-        course_averages[round_data['course']].append(round_data['score'] - round_data['par'])
+    if ranked['easiest_course']:
+        _, easiest_average, easiest_course = ranked['easiest_course'][0]
+        _, hardest_average, hardest_course = ranked['hardest_course'][0]
+        facts.append(f"{easiest_course} was the most player-friendly course (avg +{round(easiest_average, 1)})")
+        facts.append(f"{hardest_course} proved the most challenging (avg +{round(hardest_average, 1)})")
     
-    easiest_course = min(course_averages.items(), key=lambda x: sum(x[1])/len(x[1]))
-    hardest_course = max(course_averages.items(), key=lambda x: sum(x[1])/len(x[1]))
-    
-    facts.append(f"{easiest_course[0]} was the most player-friendly course (avg +{round(sum(easiest_course[1])/len(easiest_course[1]), 1)})")
-    facts.append(f"{hardest_course[0]} proved the most challenging (avg +{round(sum(hardest_course[1])/len(hardest_course[1]), 1)})")
-    
-    # Birdie drought
-    total_birdies = sum(int(p.get('birdies', 0)) for p in player_stats)
-    total_holes = len(players) * 54  # 8 players × 54 holes each
-    facts.append(f"Only {total_birdies} birdies were made out of {total_holes} total holes played ({round((total_birdies/total_holes)*100, 1)}%)")
+    # Birdie drought; holes and possible points come from the tables rather than a 54-hole, 18-point event
+    total_birdies, total_holes = total['total_birdies'], total['total_holes']
+    if total_holes:
+        facts.append(f"Only {total_birdies} birdies were made out of {total_holes} total holes played ({round((total_birdies/total_holes)*100, 1)}%)")
     
     # Match play facts
-    match_play_total = sum(float(mp['total_points']) for mp in match_play_results)
-    facts.append(f"In match play, the group earned {match_play_total} out of {len(players) * 18} possible points")
+    facts.append(f"In match play, the group earned {total['match_play_points']} out of {total['match_play_possible']} possible points")
     
     return facts
 
-def save_results_to_json(results: Dict[str, Any]):
+def save_results_to_json(results: Dict[str, Any], filename: str = 'advanced_stats.json', compact: bool = False):
     """Save all calculated statistics to JSON file"""
-    with open('advanced_stats.json', 'w') as file:
-        json.dump(results, file, indent=2)
+    # Write to a temporary file so readers (the dashboard, watch mode) never see a half-written document
+    temp_path = filename + '.tmp'
+    with stage(f'serialize:{filename}', len(results['player_statistics'])) as profile:
+        with open(temp_path, 'w') as file:
+            if compact:
+                json.dump(results, file, separators=(',', ':'))
+            else:
+                json.dump(results, file, indent=2)
+        os.replace(temp_path, filename)
+        profile['bytes'] = os.path.getsize(filename)
     
-    print("Advanced statistics saved to advanced_stats.json")
+    print(f"Advanced statistics saved to {filename}")
     print(f"Analyzed {len(results['player_statistics'])} players across {results['tournament_summary']['courses_played']} courses")
 
+def save_results_streaming(plan: Dict[str, Any], filename: str = 'advanced_stats.json', compact: bool = False):
+    """Write each section to JSON as soon as it is computed, without building the full results"""
+    counts = {'players': 0, 'courses': 0}
+    
+    def sections() -> Iterator[Tuple[str, Any]]:
+        for name, value in iter_results(plan):
+            if name == 'tournament_summary':
+                counts['courses'] = value['courses_played']
+            if name == 'player_statistics':
+                value = counted(value)
+            yield name, value
+    
+    def counted(players: Iterator[Tuple[str, Any]]) -> Iterator[Tuple[str, Any]]:
+        for item in players:
+            counts['players'] += 1
+            yield item
+    
+    # Write to a temporary file so readers never see a half-written document
+    temp_path = filename + '.tmp'
+    with stage(f'serialize_stream:{filename}') as profile:
+        with open(temp_path, 'w') as file:
+            write_json_stream(sections(), file, indent=None if compact else 2)
+        os.replace(temp_path, filename)
+        profile['rows'] = counts['players']
+        profile['bytes'] = os.path.getsize(filename)
+    
+    print(f"Advanced statistics streamed to {filename}")
+    print(f"Analyzed {counts['players']} players across {counts['courses']} courses")
+
+def run(targets: List[Tuple[str, Union[str, SqliteSource]]], workers: int = 1, use_cache: bool = True,
+        cache_dir: str = CACHE_DIR, stream: bool = False, compact: bool = False):
+    """Calculate and save stats for one or more (output directory, source) tournaments"""
+    # Code the sections depend on, plus the course ratings used for handicaps
+    fingerprint = fingerprint_files(__file__, inspect.getfile(StatsStore), inspect.getfile(pairwise_results),
+                                    inspect.getfile(player_handicap), inspect.getfile(load_courses),
+                                    inspect.getfile(evaluate_rules), inspect.getfile(calculate_hole_analysis),
+                                    inspect.getfile(rank_entries), inspect.getfile(trend_rows),
+                                    *([COURSES_PATH] if os.path.exists(COURSES_PATH) else []))
+    executor = ProcessPoolExecutor(max_workers=workers or None) if workers != 1 else None
+    try:
+        # Submit every tournament before waiting, so the pool stays busy across events
+        plans = []
+        for data_dir, source in targets:
+            os.makedirs(data_dir, exist_ok=True)
+            cache = SectionCache(os.path.join(data_dir, cache_dir), fingerprint) if use_cache else None
+            with stage(f'plan:{os.path.normpath(data_dir)}'):
+                plans.append((data_dir, plan_sections(source, cache, executor)))
+        for data_dir, plan in plans:
+            if len(targets) > 1:
+                print(f"[{data_dir}]")
+            json_path = os.path.normpath(os.path.join(data_dir, 'advanced_stats.json'))
+            if stream:
+                save_results_streaming(plan, json_path, compact)
+                continue
+            with stage(f'assemble:{os.path.normpath(data_dir)}'):
+                results = assemble_results(plan)
+            save_results_to_json(results, json_path, compact)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+def database_targets(db_path: str, event: Optional[str], batch: bool, data_dir: str) -> List[Tuple[str, SqliteSource]]:
+    """Resolve --db/--event/--batch into (output directory, source) pairs"""
+    conn = connect(db_path)
+    events = list_events(conn)
+    conn.close()
+    if event is not None:
+        if event not in events:
+            raise ValueError(f"event {event!r} not found in {db_path} (available: {', '.join(events) or 'none'})")
+        return [(data_dir, SqliteSource(db_path, event))]
+    if batch:
+        # One output directory per event, like a --batch run over CSV directories
+        return [(os.path.join(data_dir, name), SqliteSource(db_path, name)) for name in events]
+    if len(events) != 1:
+        raise ValueError(f"{db_path} holds {len(events)} events; choose one with --event "
+                         f"(available: {', '.join(events) or 'none'})")
+    return [(data_dir, SqliteSource(db_path, events[0]))]
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data-dir', default='.', help='directory holding the cleaned CSV files')
+    parser.add_argument('--batch', metavar='DIR', nargs='?', const='.',
+                        help='process every tournament directory found under DIR (with --db: every stored event)')
+    parser.add_argument('--db', metavar='PATH', nargs='?', const=DEFAULT_DB,
+                        help=f'read tables from the SQLite database written by clean_data.py --sqlite (default {DEFAULT_DB})')
+    parser.add_argument('--event', help='event to analyze when the database holds several')
+    parser.add_argument('--workers', type=int, default=1, help='worker processes (0 = one per CPU)')
+    parser.add_argument('--stream', action='store_true',
+                        help='write advanced_stats.json section by section as it is computed')
+    parser.add_argument('--compact', action='store_true', help='write advanced_stats.json without indentation')
+    parser.add_argument('--no-cache', action='store_true', help='recompute every section from scratch')
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='where cached sections are stored, relative to each tournament')
+    parser.add_argument('--profile', metavar='PATH', nargs='?', const='',
+                        help=f'record time, CPU, peak memory and rows per stage (default {PROFILE_FILE} next to the outputs)')
+    parser.add_argument('--profile-stage', metavar='STAGE',
+                        help='also dump cProfile stats and a tracemalloc snapshot for this stage (e.g. section:head_to_head)')
+    args = parser.parse_args()
+    
+    if args.db:
+        if not os.path.exists(args.db):
+            parser.error(f"database {args.db} not found; create it with clean_data.py --sqlite")
+        try:
+            targets = database_targets(args.db, args.event, args.batch is not None, args.data_dir)
+        except ValueError as error:
+            parser.error(str(error))
+    elif args.event:
+        parser.error("--event requires --db")
+    else:
+        data_dirs = find_tournament_dirs(args.batch) if args.batch else [args.data_dir]
+        targets = [(data_dir, data_dir) for data_dir in data_dirs]
+    if not targets:
+        parser.error(f"no tournaments found under {args.batch or args.db}")
+    
+    if args.profile_stage and args.profile is None:
+        parser.error("--profile-stage requires --profile")
+    output_root = args.batch or args.data_dir
+    profiler = start_profiling(args.profile_stage, output_root) if args.profile is not None else None
+    
     print("Calculating advanced golf statistics...")
-    results = calculate_player_statistics()
-    save_results_to_json(results)
-    print("Analysis complete!")
\ No newline at end of file
+    run(targets, args.workers, not args.no_cache, args.cache_dir, args.stream, args.compact)
+    print("Analysis complete!")
+    if profiler is not None:
+        profiler.save(args.profile or os.path.join(output_root, PROFILE_FILE))
+        stop_profiling()
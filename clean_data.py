@@ -3,203 +3,474 @@
 Clean and extract data from myrtleScores.csv into structured CSV files
 """
 
+import argparse
 import csv
-from typing import List, Dict, Any
+import os
+import re
+import sqlite3
+from array import array
+from collections import Counter
+from itertools import compress, repeat
+from operator import sub
+from typing import Iterable, Iterator, List, Dict, Any, Optional
 
-def clean_myrtle_scores():
+from course_data import COURSES_FILE, Course, find_course, load_courses
+from scoring import ScoringEngine
+from stage_profile import start_profiling, stage, stop_profiling
+import stats_db
+
+# Round formats, matched against the section title in this order
+FORMAT_KEYWORDS = [
+    ('Scramble', 'Scramble'),
+    ('Match Play', 'Match Play'),
+    ('Best Ball', 'Best Ball'),
+    ('Stableford', 'Stableford'),
+    ('Stroke Play', 'Stroke Play')
+]
+
+# Names written differently in the summary tables than on the scorecards
+PLAYER_ALIASES = {
+    'Jimmy': 'Jimbo'
+}
+
+TALLY_FIELDS = ['birdies', 'pars', 'bogeys', 'double', 'triple', 'quadruple', 'quintuple_plus']
+
+DAY_HEADER = re.compile(r'^\s*"?Day\s+(\d+)\b', re.IGNORECASE)
+SUMMARY_DAY = re.compile(r'^Day\s*(\d+)$', re.IGNORECASE)
+BEST_BALL_SUFFIX = ' best'
+
+HOLES_PER_ROUND = 18
+TEAM_ROUND_FORMATS = ('Scramble',)
+
+PROFILE_FILE = 'clean_data_profile.json'
+
+OUTPUT_FILES = ['individual_scores.csv', 'match_play_results.csv', 'team_scores.csv', 'player_stats.csv', 'hole_scores.csv']
+
+def clean_myrtle_scores(source: str = 'myrtleScores.csv', output_dir: str = '.', db_path: Optional[str] = None,
+                        event: Optional[str] = None, write_csv: bool = True, courses_file: str = COURSES_FILE):
     """Main function to clean and extract all data"""
-    
-    # Read the raw data
-    with open('myrtleScores.csv', 'r') as file:
-        lines = file.readlines()
-    
-    # Extract individual scores
-    individual_scores = extract_individual_scores(lines)
-    save_to_csv(individual_scores, 'individual_scores.csv')
-    
-    # Extract match play results
-    match_play_results = extract_match_play_results(lines)
-    save_to_csv(match_play_results, 'match_play_results.csv')
-    
-    # Extract team scores
-    team_scores = extract_team_scores(lines)
-    save_to_csv(team_scores, 'team_scores.csv')
-    
-    # Extract player stats
-    player_stats = extract_player_stats(lines)
-    save_to_csv(player_stats, 'player_stats.csv')
-    
+
+    written = []
+    pending = None
+    event_number = 0
+    event = event or os.path.splitext(os.path.basename(source))[0]
+    conn = stats_db.connect(db_path) if db_path else None
+    try:
+        # Course scorecards let Stableford points be computed instead of trusting the typed-in column
+        with stage('load_courses'):
+            courses = load_courses(courses_file) if os.path.exists(courses_file) else {}
+
+        def save(tournament: Dict[str, Any], number: Optional[int]):
+            # More than one tournament: give each its own directory and event name
+            directory = event_directory(output_dir, number) if number else output_dir
+            name = f'{event}-{number:03d}' if number else event
+            paths = save_tournament(tournament, directory if write_csv else None, conn, name, source, courses)
+            written.append((name, paths))
+
+        # Stream the raw export; only one tournament is held in memory at a time
+        with stage(f'read_source:{os.path.normpath(source)}') as profile, open(source, 'r', newline='') as file:
+            reader = csv.reader(file)
+            for tournament in iter_tournaments(reader):
+                event_number += 1
+                if pending is not None:
+                    save(pending, event_number - 1)
+                pending = tournament
+            profile['rows'] = reader.line_num
+
+        if pending is None:
+            print(f"No tournaments found in {source}")
+            return
+
+        save(pending, event_number if event_number > 1 else None)
+    finally:
+        if conn is not None:
+            conn.close()
+
     print("Data extraction completed successfully!")
-    print("Created files:")
-    print("- individual_scores.csv")
-    print("- match_play_results.csv") 
-    print("- team_scores.csv")
-    print("- player_stats.csv")
+    print("Created files:" if write_csv else f"Stored events in {db_path}:")
+    for name, paths in written:
+        if write_csv:
+            for path in paths:
+                print(f"- {path}")
+        else:
+            print(f"- {name}")
+
+def event_directory(output_dir: str, event_number: int) -> str:
+    """Output directory for one tournament of a multi-event export"""
+    return os.path.join(output_dir, f'event_{event_number:03d}')
+
+def output_path(directory: str, filename: str) -> str:
+    """Path of an output file, without a leading './' for the working directory"""
+    return os.path.normpath(os.path.join(directory, filename))
+
+def save_tournament(tournament: Dict[str, Any], directory: Optional[str], conn: Optional[sqlite3.Connection] = None,
+                    event: str = '', source: str = '', courses: Optional[Dict[str, Course]] = None) -> List[str]:
+    """Extract the cleaned tables for one parsed tournament and save them as CSV and/or to the database
+
+    Returns the CSV files written; empty tables get none, and any earlier file of theirs is removed.
+    """
+    extractors = {
+        'individual_scores': lambda: extract_individual_scores(tournament, courses),
+        'match_play_results': lambda: extract_match_play_results(tournament),
+        'team_scores': lambda: extract_team_scores(tournament),
+        'player_stats': lambda: extract_player_stats(tournament),
+        'hole_scores': lambda: extract_hole_scores(tournament)
+    }
+    tables = {}
+    for table, extract in extractors.items():
+        with stage(f'extract_{table}') as profile:
+            tables[table] = extract()
+            profile['rows'] = len(tables[table])
+
+    paths = []
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+        for table, rows in tables.items():
+            path = output_path(directory, f'{table}.csv')
+            with stage(f'write_csv:{path}', len(rows)) as profile:
+                if save_to_csv(rows, path):
+                    profile['bytes'] = os.path.getsize(path)
+                    paths.append(path)
+
+    if conn is not None:
+        with stage(f'write_sqlite:{event}', sum(len(rows) for rows in tables.values())):
+            stats_db.write_tournament(conn, event, source, tables)
+        print(f"Stored {sum(len(rows) for rows in tables.values())} rows for event {event!r}")
+    return paths
+
+def iter_tournaments(rows: Iterable[List[str]]) -> Iterator[Dict[str, Any]]:
+    """Parse raw scorecard export rows, yielding each tournament as it completes
+
+    The export is a sequence of daily round sections (title, Hole, Par and
+    player rows), with side tables for team totals and match play or
+    Stableford points, followed by the solo score and birdie/par/bogey tally
+    tables. A round whose day does not follow the previous one, or any round
+    after the tally tables, starts the next tournament.
+    """
+    tournament = new_tournament()
+    current_round = None
+    summary = None
+
+    for row in rows:
+        label = row[0].strip() if row else ''
+        day_match = DAY_HEADER.match(label)
 
-def extract_individual_scores(lines: List[str]) -> List[Dict[str, Any]]:
+        if day_match:
+            day = int(day_match.group(1))
+            if tournament['summary_seen'] or any(r['day'] >= day for r in tournament['rounds']):
+                yield tournament
+                tournament = new_tournament()
+            current_round = start_round(row, day)
+            tournament['rounds'].append(current_round)
+            summary = None
+        elif label == 'Solo Scores':
+            current_round = None
+            summary = read_summary_header(row)
+            tournament['summary_seen'] = True
+        elif current_round is not None:
+            read_round_row(current_round, tournament, row, label)
+        elif summary is not None and label:
+            read_summary_row(summary, tournament, row, label)
+
+    if tournament['rounds'] or tournament['summary_seen']:
+        yield tournament
+
+def new_tournament() -> Dict[str, Any]:
+    """Empty parse state for one tournament"""
+    return {
+        'rounds': [],
+        'team_totals': {},  # team -> {day: score, 'Total': score}
+        'solo_totals': {},  # player -> final total
+        'tallies': [],      # birdie/par/bogey rows in file order
+        'summary_seen': False
+    }
+
+def start_round(row: List[str], day: int) -> Dict[str, Any]:
+    """Begin a daily round section from its title row"""
+    title = row[0].strip()
+    round_format = next((name for keyword, name in FORMAT_KEYWORDS if keyword.lower() in title.lower()), 'Stroke Play')
+    course = next((cell.strip() for cell in row[1:] if cell.strip()), '')
+
+    return {
+        'day': day,
+        'format': round_format,
+        'course': course,
+        'par': None,
+        'hole_pars': [],
+        'hole_columns': [],
+        'total_column': None,
+        'points_column': None,
+        'team_columns': {},
+        'team_name_column': None,
+        'entries': []
+    }
+
+def read_round_row(current_round: Dict[str, Any], tournament: Dict[str, Any], row: List[str], label: str):
+    """Dispatch one row inside a daily round section"""
+    if label == 'Hole':
+        current_round['hole_columns'] = find_hole_columns(row)
+    elif label == 'Par':
+        read_par_row(current_round, row)
+    elif label and current_round['total_column'] is not None:
+        read_player_row(current_round, tournament, row, label)
+
+def find_hole_columns(row: List[str]) -> List[int]:
+    """Column index of holes 1-18 in a 'Hole' header row"""
+    columns = []
+    for index, cell in enumerate(row[1:], start=1):
+        if cell.strip() == str(len(columns) + 1):
+            columns.append(index)
+            if len(columns) == 18:
+                break
+    return columns
+
+def read_par_row(current_round: Dict[str, Any], row: List[str]):
+    """Read hole pars, the round total column and any side-table headers"""
+    cells = [cell.strip() for cell in row]
+    columns = current_round['hole_columns']
+    current_round['hole_pars'] = [int(cells[index]) for index in columns]
+
+    if 'IN' in cells:
+        total_column = cells.index('IN') + 1
+    else:
+        total_column = columns[-1] + 1
+    current_round['total_column'] = total_column
+    current_round['par'] = parse_number(cells[total_column]) or sum(current_round['hole_pars'])
+
+    for index in range(total_column + 1, len(cells)):
+        cell = cells[index]
+        summary_day = SUMMARY_DAY.match(cell)
+        if summary_day:
+            current_round['team_columns'][index] = int(summary_day.group(1))
+        elif cell == 'Total' and current_round['team_columns']:
+            current_round['team_columns'][index] = 'Total'
+        elif cell.endswith('Score') and current_round['points_column'] is None:
+            current_round['points_column'] = index
+
+    if current_round['team_columns']:
+        current_round['team_name_column'] = min(current_round['team_columns']) - 1
+
+def read_player_row(current_round: Dict[str, Any], tournament: Dict[str, Any], row: List[str], label: str):
+    """Read one player (or team) scorecard row and its side-table cells"""
+    cells = [cell.strip() for cell in row]
+    holes = [parse_number(cells[index]) if index < len(cells) else None for index in current_round['hole_columns']]
+    total = parse_number(cells[current_round['total_column']]) if current_round['total_column'] < len(cells) else None
+
+    if total is not None and all(isinstance(score, int) for score in holes):
+        entry = {'name': player_name(label), 'holes': holes, 'score': total, 'points': None, 'possible_points': 0}
+        points_column = current_round['points_column']
+        if points_column is not None and points_column < len(cells):
+            entry['points'] = parse_number(cells[points_column])
+            entry['possible_points'] = sum(
+                1 for cell in cells[current_round['total_column'] + 1:points_column] if parse_number(cell) is not None
+            )
+        current_round['entries'].append(entry)
+
+    # Team summary table rides along on the right of the first round
+    name_column = current_round['team_name_column']
+    if name_column is not None and name_column < len(cells) and cells[name_column]:
+        team_scores = tournament['team_totals'].setdefault(cells[name_column], {})
+        for index, day in current_round['team_columns'].items():
+            value = parse_number(cells[index]) if index < len(cells) else None
+            if value is not None:
+                team_scores[day] = value
+
+def read_summary_header(row: List[str]) -> Dict[str, Any]:
+    """Locate the solo score and birdie/par/bogey tally tables"""
+    cells = [cell.strip() for cell in row]
+    final_column = cells.index('Final') if 'Final' in cells else None
+    tally_column = cells.index('Birdies') if 'Birdies' in cells else None
+    return {'final_column': final_column, 'tally_column': tally_column}
+
+def read_summary_row(summary: Dict[str, Any], tournament: Dict[str, Any], row: List[str], label: str):
+    """Read one row of the solo score and tally tables"""
+    cells = [cell.strip() for cell in row]
+
+    final_column = summary['final_column']
+    if final_column is not None and final_column < len(cells):
+        final = parse_number(cells[final_column])
+        if final is not None:
+            tournament['solo_totals'][player_name(label)] = final
+
+    tally_column = summary['tally_column']
+    if tally_column is not None and tally_column - 1 < len(cells) and cells[tally_column - 1]:
+        counts = [parse_number(cell) for cell in cells[tally_column:tally_column + len(TALLY_FIELDS)]]
+        counts += [None] * (len(TALLY_FIELDS) - len(counts))
+        tally = {'player': player_name(cells[tally_column - 1])}
+        tally.update({field: count or 0 for field, count in zip(TALLY_FIELDS, counts)})
+        tournament['tallies'].append(tally)
+
+def player_name(raw: str) -> str:
+    """Normalize a player name from the export"""
+    name = raw.strip()
+    return PLAYER_ALIASES.get(name, name)
+
+def parse_number(value: str) -> Optional[Any]:
+    """Parse an int or float cell, returning None for blanks and text"""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+def is_best_ball_team(name: str) -> bool:
+    """Team best ball lines are written as 'Jimbo/Dave best'"""
+    return name.lower().endswith(BEST_BALL_SUFFIX)
+
+def extract_individual_scores(tournament: Dict[str, Any], courses: Optional[Dict[str, Course]] = None) -> List[Dict[str, Any]]:
     """Extract individual player scores for each day and course"""
     scores = []
-    
-    # Day 1 - Scramble (team scores)
-    scores.extend([
-        {"player": "3 Lefties make a Righty", "day": 1, "course": "Myrtle Beach National - South Creek", "score": 73, "par": 72, "format": "Scramble"},
-        {"player": "Banana Boys", "day": 1, "course": "Myrtle Beach National - South Creek", "score": 68, "par": 72, "format": "Scramble"}
-    ])
-    
-    # Day 2 - Individual Match Play scores
-    day2_players = [
-        {"player": "Jimbo", "score": 100, "par": 72},
-        {"player": "Mike", "score": 97, "par": 72},
-        {"player": "Dave", "score": 110, "par": 72},
-        {"player": "Ryan", "score": 114, "par": 72},
-        {"player": "AJ", "score": 136, "par": 72},
-        {"player": "Nixon", "score": 112, "par": 72},
-        {"player": "Todd", "score": 126, "par": 72},
-        {"player": "Doug", "score": 128, "par": 72}
-    ]
-    
-    for player_data in day2_players:
-        scores.append({
-            "player": player_data["player"],
-            "day": 2,
-            "course": "Barefoot Dye",
-            "score": player_data["score"],
-            "par": player_data["par"],
-            "format": "Match Play"
-        })
-    
-    # Day 3 - Best Ball scores (individual and team)
-    day3_individual = [
-        {"player": "Jimbo", "score": 93, "par": 72},
-        {"player": "Dave", "score": 98, "par": 72},
-        {"player": "Mike", "score": 88, "par": 72},
-        {"player": "Ryan", "score": 99, "par": 72},
-        {"player": "AJ", "score": 117, "par": 72},
-        {"player": "Todd", "score": 124, "par": 72},
-        {"player": "Nixon", "score": 114, "par": 72},
-        {"player": "Doug", "score": 133, "par": 72}
-    ]
-    
-    for player_data in day3_individual:
-        scores.append({
-            "player": player_data["player"],
-            "day": 3,
-            "course": "Aberdeen Country Club",
-            "score": player_data["score"],
-            "par": player_data["par"],
-            "format": "Best Ball"
-        })
-    
-    # Day 3 - Team Best Ball scores
-    scores.extend([
-        {"player": "Jimbo/Dave", "day": 3, "course": "Aberdeen Country Club", "score": 88, "par": 72, "format": "Best Ball Team"},
-        {"player": "Mike/Ryan", "day": 3, "course": "Aberdeen Country Club", "score": 82, "par": 72, "format": "Best Ball Team"},
-        {"player": "AJ/Todd", "day": 3, "course": "Aberdeen Country Club", "score": 103, "par": 72, "format": "Best Ball Team"},
-        {"player": "Nixon/Doug", "day": 3, "course": "Aberdeen Country Club", "score": 108, "par": 72, "format": "Best Ball Team"}
-    ])
-    
-    # Day 4 - Stableford individual scores
-    day4_players = [
-        {"player": "Jimbo", "score": 92, "stableford": 19},
-        {"player": "Mike", "score": 84, "stableford": 25},
-        {"player": "Dave", "score": 90, "stableford": 20},
-        {"player": "Nixon", "score": 107, "stableford": 8},
-        {"player": "AJ", "score": 114, "stableford": 4},
-        {"player": "Ryan", "score": 99, "stableford": 10},
-        {"player": "Todd", "score": 121, "stableford": 3},
-        {"player": "Doug", "score": 125, "stableford": 2}
-    ]
-    
-    for player_data in day4_players:
-        scores.append({
-            "player": player_data["player"],
-            "day": 4,
-            "course": "Arcadian Shores",
-            "score": player_data["score"],
-            "par": 72,
-            "format": "Stableford",
-            "stableford_points": player_data["stableford"]
-        })
-    
+    engine = ScoringEngine(courses or {})
+
+    for current_round in tournament['rounds']:
+        course = find_course(courses or {}, current_round['course'])
+        individual = []
+        teams = []
+        for entry in current_round['entries']:
+            row = {
+                "player": entry['name'],
+                "day": current_round['day'],
+                "course": current_round['course'],
+                "score": entry['score'],
+                "par": current_round['par'],
+                "format": current_round['format']
+            }
+            if is_best_ball_team(entry['name']):
+                row["player"] = entry['name'][:-len(BEST_BALL_SUFFIX)].strip()
+                row["format"] = "Best Ball Team"
+                teams.append(row)
+                continue
+            if current_round['format'] == 'Stableford':
+                points = entry['points']
+                if course is not None and len(entry['holes']) == len(course.holes):
+                    # Scratch Stableford from the hole scores; the sheet's column is only a cross-check
+                    points = engine.score_card(entry['holes'], course, 0)['stableford_points']
+                    if entry['points'] is not None and entry['points'] != points:
+                        print(f"Warning: {entry['name']} day {current_round['day']} Stableford points "
+                              f"{entry['points']} on the sheet, {points} from the hole scores")
+                if points is not None:
+                    row["stableford_points"] = points
+            individual.append(row)
+
+        # Individual rounds first, then the day's team best ball scores
+        scores.extend(individual)
+        scores.extend(teams)
+
     return scores
 
-def extract_match_play_results(lines: List[str]) -> List[Dict[str, Any]]:
-    """Extract Day 2 match play head-to-head results"""
+def extract_hole_scores(tournament: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract hole-by-hole strokes for every individual round (long format)"""
+    holes = []
+
+    for current_round in tournament['rounds']:
+        if current_round['format'] in TEAM_ROUND_FORMATS:
+            continue
+        for entry in current_round['entries']:
+            if is_best_ball_team(entry['name']):
+                continue
+            for hole, (strokes, par) in enumerate(zip(entry['holes'], current_round['hole_pars']), start=1):
+                holes.append({
+                    "player": entry['name'],
+                    "day": current_round['day'],
+                    "course": current_round['course'],
+                    "format": current_round['format'],
+                    "hole": hole,
+                    "par": par,
+                    "strokes": strokes
+                })
+
+    return holes
+
+def extract_match_play_results(tournament: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract match play head-to-head results"""
     results = []
-    
-    # Match play points from the data
-    match_data = [
-        {"player": "Jimbo", "points": 7},
-        {"player": "Mike", "points": 11},
-        {"player": "Dave", "points": 10},
-        {"player": "Ryan", "points": 8},
-        {"player": "AJ", "points": 5},
-        {"player": "Nixon", "points": 13},
-        {"player": "Todd", "points": 10.5},
-        {"player": "Doug", "points": 7.5}
-    ]
-    
-    for player_data in match_data:
-        results.append({
-            "player": player_data["player"],
-            "day": 2,
-            "format": "Match Play",
-            "total_points": player_data["points"],
-            "possible_points": 18
-        })
-    
+
+    for current_round in tournament['rounds']:
+        if current_round['format'] != 'Match Play':
+            continue
+        for entry in current_round['entries']:
+            if entry['points'] is None:
+                continue
+            results.append({
+                "player": entry['name'],
+                "day": current_round['day'],
+                "format": "Match Play",
+                "total_points": entry['points'],
+                "possible_points": entry['possible_points']
+            })
+
     return results
 
-def extract_team_scores(lines: List[str]) -> List[Dict[str, Any]]:
+def extract_team_scores(tournament: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Extract daily team totals"""
     teams = []
-    
-    # Team scores from the summary table
-    teams.extend([
-        {"team": "3 Lefties Make a Righty", "day": 1, "score": 28, "format": "Scramble"},
-        {"team": "Banana Boys", "day": 1, "score": 48, "format": "Scramble"},
-        {"team": "3 Lefties Make a Righty", "day": 2, "score": 32.5, "format": "Match Play"},
-        {"team": "Banana Boys", "day": 2, "score": 39.5, "format": "Match Play"},
-        {"team": "3 Lefties Make a Righty", "day": 3, "score": 33, "format": "Best Ball"},
-        {"team": "Banana Boys", "day": 3, "score": 39, "format": "Best Ball"},
-        {"team": "3 Lefties Make a Righty", "day": 4, "score": 46, "format": "Stableford"},
-        {"team": "Banana Boys", "day": 4, "score": 45, "format": "Stableford"}
-    ])
-    
-    # Calculate totals
-    lefties_total = 28 + 32.5 + 33 + 46
-    bananas_total = 48 + 39.5 + 39 + 45
-    
-    teams.extend([
-        {"team": "3 Lefties Make a Righty", "day": "Total", "score": lefties_total, "format": "Tournament Total"},
-        {"team": "Banana Boys", "day": "Total", "score": bananas_total, "format": "Tournament Total"}
-    ])
-    
+
+    day_formats = {current_round['day']: current_round['format'] for current_round in tournament['rounds']}
+    team_totals = tournament['team_totals']
+    days = sorted({day for scores in team_totals.values() for day in scores if day != 'Total'})
+
+    for day in days:
+        for team, scores in team_totals.items():
+            if day in scores:
+                teams.append({"team": team, "day": day, "score": scores[day], "format": day_formats.get(day, '')})
+
+    for team, scores in team_totals.items():
+        total = scores.get('Total', sum(score for day, score in scores.items() if day != 'Total'))
+        teams.append({"team": team, "day": "Total", "score": total, "format": "Tournament Total"})
+
     return teams
 
-def extract_player_stats(lines: List[str]) -> List[Dict[str, Any]]:
+def extract_player_stats(tournament: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Extract player statistics (birdies, pars, bogeys, etc.)"""
     stats = []
-    
-    # Player stats from the bottom of the original file
-    player_data = [
-        {"player": "Mike", "birdies": 0, "pars": 21, "bogeys": 21, "double": 9, "triple": 1, "quadruple": 1, "quintuple_plus": 1, "total_score": 269},
-        {"player": "Jimmy", "birdies": 0, "pars": 8, "bogeys": 30, "double": 11, "triple": 4, "quadruple": 0, "quintuple_plus": 1, "total_score": 285},
-        {"player": "Dave", "birdies": 0, "pars": 12, "bogeys": 18, "double": 14, "triple": 6, "quadruple": 2, "quintuple_plus": 2, "total_score": 298},
-        {"player": "Ryan", "birdies": 1, "pars": 9, "bogeys": 12, "double": 19, "triple": 7, "quadruple": 5, "quintuple_plus": 1, "total_score": 312},
-        {"player": "Nixon", "birdies": 0, "pars": 3, "bogeys": 13, "double": 21, "triple": 8, "quadruple": 7, "quintuple_plus": 2, "total_score": 333},
-        {"player": "AJ", "birdies": 0, "pars": 1, "bogeys": 9, "double": 13, "triple": 16, "quadruple": 9, "quintuple_plus": 6, "total_score": 367},
-        {"player": "Todd", "birdies": 0, "pars": 2, "bogeys": 6, "double": 18, "triple": 17, "quadruple": 4, "quintuple_plus": 7, "total_score": 371},
-        {"player": "Doug", "birdies": 0, "pars": 1, "bogeys": 3, "double": 11, "triple": 19, "quadruple": 16, "quintuple_plus": 4, "total_score": 386}
-    ]
-    
-    for player in player_data:
-        total_holes = 54  # 3 individual rounds of 18 holes each
-        scoring_avg = round(player["total_score"] / total_holes, 2)
-        
+
+    tensor = HoleScoreTensor.from_tournament(tournament)
+    if not tensor.players:
+        # No hole-level scorecards in this export: fall back to the tally table
+        return extract_tallied_player_stats(tournament)
+
+    for player in tensor.players:
+        counts = tensor.category_counts(player)
+        total_holes = tensor.holes_played(player)
+        total_score = tensor.total_score(player)
+        scoring_avg = round(total_score / total_holes, 2) if total_holes else 0
+
+        stats.append({
+            "player": player,
+            "total_score": total_score,
+            "scoring_average": scoring_avg,
+            "birdies": counts[-1],
+            "pars": counts[0],
+            "bogeys": counts[1],
+            "double_bogeys": counts[2],
+            "triple_bogeys": counts[3],
+            "quadruple_bogeys": counts[4],
+            "quintuple_plus": counts[5],
+            "total_holes": total_holes,
+            "under_par_holes": counts[-1],
+            "over_par_holes": total_holes - counts[-1] - counts[0]
+        })
+
+    return stats
+
+def extract_tallied_player_stats(tournament: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Player statistics from the export's own birdie/par/bogey tally table"""
+    stats = []
+
+    for player in tournament['tallies']:
+        total_holes = sum(player[field] for field in TALLY_FIELDS)
+        total_score = tournament['solo_totals'].get(player["player"], 0)
+        scoring_avg = round(total_score / total_holes, 2) if total_holes else 0
+
         stats.append({
             "player": player["player"],
-            "total_score": player["total_score"],
+            "total_score": total_score,
             "scoring_average": scoring_avg,
             "birdies": player["birdies"],
             "pars": player["pars"],
@@ -212,27 +483,129 @@ def extract_player_stats(lines: List[str]) -> List[Dict[str, Any]]:
             "under_par_holes": player["birdies"],
             "over_par_holes": player["bogeys"] + player["double"] + player["triple"] + player["quadruple"] + player["quintuple_plus"]
         })
-    
+
     return stats
 
-def save_to_csv(data: List[Dict[str, Any]], filename: str):
-    """Save data to CSV file"""
+class HoleScoreTensor:
+    """Dense player x round x hole scores with a matching round x hole par array.
+
+    Scores live in one flat signed-byte array laid out player-major, so each
+    player's holes form a contiguous slice with the same layout as ``pars``
+    and per-player work runs as whole-slice operations rather than a Python
+    loop per hole. Unplayed holes are stored as 0.
+    """
+
+    def __init__(self, players: List[str], rounds: List[Dict[str, Any]], pars: Iterable[int]):
+        self.players = list(players)
+        self.rounds = list(rounds)
+        self.holes = HOLES_PER_ROUND
+        self.pars = array('b', pars)
+        self.round_size = len(self.pars)
+        self.scores = array('b', bytes(len(self.players) * self.round_size))
+        self._player_index = {player: index for index, player in enumerate(self.players)}
+
+    @classmethod
+    def from_tournament(cls, tournament: Dict[str, Any]) -> 'HoleScoreTensor':
+        """Individual (non-team) hole scores of one parsed tournament"""
+        rounds = [
+            current_round for current_round in tournament['rounds']
+            if current_round['format'] not in TEAM_ROUND_FORMATS and len(current_round['hole_pars']) == HOLES_PER_ROUND
+        ]
+        players = {}  # ordered set: first appearance order with constant-time membership
+        for current_round in rounds:
+            for entry in current_round['entries']:
+                if not is_best_ball_team(entry['name']):
+                    players.setdefault(entry['name'], None)
+
+        tensor = cls(players, rounds, (par for current_round in rounds for par in current_round['hole_pars']))
+        for round_index, current_round in enumerate(rounds):
+            for entry in current_round['entries']:
+                if not is_best_ball_team(entry['name']):
+                    tensor.set_round(entry['name'], round_index, entry['holes'])
+        return tensor
+
+    def _slice(self, player: str) -> slice:
+        start = self._player_index[player] * self.round_size
+        return slice(start, start + self.round_size)
+
+    def set_round(self, player: str, round_index: int, holes: List[int]):
+        """Store one player's 18 hole scores for a round"""
+        start = self._player_index[player] * self.round_size + round_index * self.holes
+        self.scores[start:start + self.holes] = array('b', holes)
+
+    def player_scores(self, player: str) -> array:
+        """Flat round x hole scores for one player (0 = not played)"""
+        return self.scores[self._slice(player)]
+
+    def played_mask(self, player: str) -> List[bool]:
+        """Whether the player completed each round x hole"""
+        return list(map(bool, self.player_scores(player)))
+
+    def holes_played(self, player: str) -> int:
+        """Holes the player completed"""
+        return sum(self.played_mask(player))
+
+    def total_score(self, player: str) -> int:
+        """Strokes over every hole the player completed"""
+        return sum(self.player_scores(player))
+
+    def relative_to_par(self, player: str) -> List[int]:
+        """Score minus par for every hole the player completed"""
+        scores = self.player_scores(player)
+        return list(compress(map(sub, scores, self.pars), scores))
+
+    def category_counts(self, player: str) -> Counter:
+        """Holes per scoring category, keyed by strokes over par
+
+        Birdie-or-better is folded into -1 and quintuple bogey or worse into 5.
+        """
+        return Counter(map(max, map(min, self.relative_to_par(player), repeat(5)), repeat(-1)))
+
+def save_to_csv(data: List[Dict[str, Any]], filename: str) -> bool:
+    """Save data to CSV file; returns whether a file was written (empty tables are skipped)"""
     if not data:
-        print(f"No data to save for {filename}")
-        return
-    
+        # A file left by an earlier clean would otherwise be read back as this event's table
+        if os.path.exists(filename):
+            os.remove(filename)
+            print(f"No data to save for {filename}; removed the previous file")
+        else:
+            print(f"No data to save for {filename}")
+        return False
+
     # Get all unique fieldnames from all rows
     fieldnames = set()
     for row in data:
         fieldnames.update(row.keys())
     fieldnames = sorted(list(fieldnames))
-    
+
     with open(filename, 'w', newline='') as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(data)
-    
+
     print(f"Created {filename} with {len(data)} rows")
+    return True
 
 if __name__ == "__main__":
-    clean_myrtle_scores()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('source', nargs='?', default='myrtleScores.csv', help='raw scorecard export')
+    parser.add_argument('--output-dir', default='.', help='where to write the cleaned CSV files')
+    parser.add_argument('--sqlite', metavar='PATH', nargs='?', const=stats_db.DEFAULT_DB,
+                        help=f'also store the tables in a SQLite database (default {stats_db.DEFAULT_DB})')
+    parser.add_argument('--event', help='event name in the database (default: source file name)')
+    parser.add_argument('--no-csv', action='store_true', help='only write the database, not the CSV files')
+    parser.add_argument('--courses', default=COURSES_FILE, help='course scorecards used to compute Stableford points')
+    parser.add_argument('--profile', metavar='PATH', nargs='?', const='',
+                        help=f'record time, CPU, peak memory and rows per stage (default {PROFILE_FILE} in the output directory)')
+    parser.add_argument('--profile-stage', metavar='STAGE',
+                        help='also dump cProfile stats and a tracemalloc snapshot for this stage (e.g. extract_hole_scores)')
+    args = parser.parse_args()
+    if args.no_csv and not args.sqlite:
+        parser.error("--no-csv requires --sqlite")
+    if args.profile_stage and args.profile is None:
+        parser.error("--profile-stage requires --profile")
+    profiler = start_profiling(args.profile_stage, args.output_dir) if args.profile is not None else None
+    clean_myrtle_scores(args.source, args.output_dir, args.sqlite, args.event, not args.no_csv, args.courses)
+    if profiler is not None:
+        profiler.save(args.profile or os.path.join(args.output_dir, PROFILE_FILE))
+        stop_profiling()
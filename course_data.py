@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Course ratings and hole-by-hole par, yardage and stroke index from courses.md
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+COURSES_FILE = 'courses.md'
+
+# Words dropped when matching scorecard course names ('Barefoot Dye') to courses.md ('Barefoot Dye Golf Course')
+_NAME_NOISE = re.compile(r'\b(golf|course|club|country|cc|gc)\b')
+
+class Hole(NamedTuple):
+    number: int
+    par: int
+    yardage: int
+    stroke_index: int  # 1 = hardest hole, where handicap strokes are given first
+
+class Course(NamedTuple):
+    name: str
+    par: int
+    yardage: int
+    rating: float
+    slope: int
+    holes: List[Hole]
+
+def load_courses(path: str = COURSES_FILE) -> Dict[str, Course]:
+    """Parse every course section (a '# Name' heading, info bullets and nine-hole tables)"""
+    with open(path, 'r') as file:
+        sections = re.split(r'^# ', file.read(), flags=re.MULTILINE)
+
+    courses = {}
+    for section in sections[1:]:
+        name, _, body = section.partition('\n')
+        rows = {'hole': [], 'yds': [], 'par': [], 'hcp': []}
+        for line in body.splitlines():
+            cells = [cell.strip().strip('*') for cell in line.strip().strip('|').split('|')]
+            if len(cells) < 10 or not line.lstrip().startswith('|'):
+                continue
+            label = cells[0].lower()
+            key = 'hcp' if 'hcp' in label else next((k for k in rows if label.startswith(k)), None)
+            if key is not None:
+                rows[key].extend(int(cell.replace(',', '')) for cell in cells[1:10])
+
+        holes = [Hole(*values) for values in zip(rows['hole'], rows['par'], rows['yds'], rows['hcp'])]
+        courses[name.strip()] = Course(
+            name=name.strip(),
+            par=int(_info(body, 'Par') or sum(hole.par for hole in holes)),
+            yardage=int(_info(body, 'Total Yardage') or sum(hole.yardage for hole in holes)),
+            rating=float(_info(body, 'Course Rating')),
+            slope=int(_info(body, 'Slope Rating')),
+            holes=holes
+        )
+    return courses
+
+def _info(body: str, label: str) -> Optional[str]:
+    match = re.search(rf'\*\*{label}:\*\*\s*([\d,.]+)', body)
+    return match.group(1).replace(',', '') if match else None
+
+def _name_key(name: str) -> str:
+    return ' '.join(_NAME_NOISE.sub(' ', name.lower()).split())
+
+def find_course(courses: Dict[str, Course], name: str) -> Optional[Course]:
+    """Look up a course by its scorecard name, tolerating 'Golf Course'/'Country Club' suffixes"""
+    if name in courses:
+        return courses[name]
+    key = _name_key(name)
+    return next((course for course_name, course in courses.items() if _name_key(course_name) == key), None)
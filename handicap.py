@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+World Handicap System score differentials and rolling handicap indexes
+"""
+
+import argparse
+import csv
+import json
+import os
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from course_data import COURSES_FILE, Course, find_course, load_courses
+from scoring import course_handicap, strokes_by_index
+
+WINDOW = 20                      # most recent differentials considered
+MAX_INDEX = 54.0
+SOFT_CAP = 3.0                   # increase above the low index beyond which half is kept
+HARD_CAP = 5.0                   # maximum increase above the low index
+LOW_INDEX_LOOKBACK = timedelta(days=365)
+NO_INDEX_HOLE_LIMIT = 5          # par + 5 per hole until a player has an index
+EXCEPTIONAL_SCORES = [(10.0, 2.0), (7.0, 1.0)]  # differential this far below the index -> reduction
+
+# differentials available -> (how many of the lowest to average, adjustment)
+DIFFERENTIALS_USED = {
+    3: (1, -2.0), 4: (1, -1.0), 5: (1, 0.0), 6: (2, -1.0), 7: (2, 0.0), 8: (2, 0.0),
+    9: (3, 0.0), 10: (3, 0.0), 11: (3, 0.0), 12: (4, 0.0), 13: (4, 0.0), 14: (4, 0.0),
+    15: (5, 0.0), 16: (5, 0.0), 17: (6, 0.0), 18: (6, 0.0), 19: (7, 0.0), 20: (8, 0.0)
+}
+
+def adjusted_gross_score(holes: Sequence[int], course: Course, handicap_index: Optional[float]) -> int:
+    """Gross score with each hole capped at net double bogey (par + 5 without an index)"""
+    if handicap_index is None:
+        return sum(min(strokes, hole.par + NO_INDEX_HOLE_LIMIT) for strokes, hole in zip(holes, course.holes))
+    received = strokes_by_index(course_handicap(handicap_index, course), len(course.holes))
+    return sum(
+        min(strokes, hole.par + 2 + received[hole.stroke_index - 1])
+        for strokes, hole in zip(holes, course.holes)
+    )
+
+def _tenths(value: float) -> float:
+    """Round to one decimal with halves going up, as WHS does (round() sends 12.25 to 12.2)"""
+    # Rounding to 9 places first drops float noise, so 85 - 72.45 = 12.549999999999997 counts as 12.55
+    return float(Decimal(repr(round(value, 9))).quantize(Decimal('0.1'), rounding=ROUND_HALF_UP))
+
+def score_differential(adjusted_gross: int, course: Course, pcc: float = 0.0) -> float:
+    """(113 / slope) x (adjusted gross - course rating - playing conditions), to one decimal"""
+    return _tenths(113 / course.slope * (adjusted_gross - course.rating - pcc))
+
+class HandicapRecord:
+    """One player's scoring record, updated one round at a time.
+
+    The last 20 differentials are kept both in posting order (to drop the
+    oldest) and in a sorted list maintained with bisect, so the lowest N
+    are always the list's head and no window is ever re-sorted. The low
+    index over the lookback period uses a monotonic deque (amortized O(1)).
+    """
+
+    def __init__(self):
+        self.window: Deque[List[Any]] = deque()       # [sequence, differential] in posting order
+        self.ranked: List[Tuple[float, int]] = []     # (differential, sequence), ascending
+        self.sequence = 0
+        self.index: Optional[float] = None
+        self.low_index: Optional[float] = None
+        self._lows: Deque[Tuple[Optional[date], int, float]] = deque()  # (date, sequence, index), increasing index
+        self.history: List[Dict[str, Any]] = []
+
+    def post(self, differential: float, played: Optional[date] = None) -> Optional[float]:
+        """Add one score differential and return the revised handicap index"""
+        prior_index = self.index
+        self.low_index = self._low_index(played)
+
+        self.sequence += 1
+        entry = [self.sequence, differential]
+        self.window.append(entry)
+        insort(self.ranked, (differential, self.sequence))
+        if len(self.window) > WINDOW:
+            sequence, value = self.window.popleft()
+            del self.ranked[bisect_left(self.ranked, (value, sequence))]
+
+        adjustment = self._exceptional_adjustment(differential, prior_index)
+        if adjustment:
+            # Applied to every differential in the window; their order is unchanged
+            for item in self.window:
+                item[1] = _tenths(item[1] - adjustment)
+            self.ranked = [(_tenths(value - adjustment), sequence) for value, sequence in self.ranked]
+
+        self.index = self._calculate()
+        if self.index is not None:
+            self._remember(played, self.index)
+        self.history.append({
+            'differential': differential,
+            'exceptional_reduction': adjustment,
+            'handicap_index': self.index,
+            'low_handicap_index': self.low_index
+        })
+        return self.index
+
+    def _exceptional_adjustment(self, differential: float, prior_index: Optional[float]) -> float:
+        if prior_index is None:
+            return 0.0
+        for margin, reduction in EXCEPTIONAL_SCORES:
+            if prior_index - differential >= margin:
+                return reduction
+        return 0.0
+
+    def _calculate(self) -> Optional[float]:
+        used = DIFFERENTIALS_USED.get(len(self.ranked))
+        if used is None:
+            return None
+        count, adjustment = used
+        raw = sum(value for value, _ in self.ranked[:count]) / count + adjustment
+
+        # Caps only apply once a low index exists (an established record of 20 scores)
+        if self.low_index is not None and len(self.ranked) == WINDOW:
+            increase = raw - self.low_index
+            if increase > SOFT_CAP:
+                raw = self.low_index + SOFT_CAP + (increase - SOFT_CAP) / 2
+            raw = min(raw, self.low_index + HARD_CAP)
+        return _tenths(min(raw, MAX_INDEX))
+
+    def _remember(self, played: Optional[date], index: float):
+        # Monotonic deque: later, lower indexes make earlier, higher ones irrelevant
+        while self._lows and self._lows[-1][2] >= index:
+            self._lows.pop()
+        self._lows.append((played, self.sequence, index))
+
+    def _low_index(self, played: Optional[date]) -> Optional[float]:
+        """Lowest index in the year before this round (the whole history when rounds are undated)"""
+        if len(self.ranked) < WINDOW - 1:
+            return None
+        if played is not None:
+            while self._lows and self._lows[0][0] is not None and played - self._lows[0][0] > LOW_INDEX_LOOKBACK:
+                self._lows.popleft()
+        return self._lows[0][2] if self._lows else None
+
+class HandicapIndex:
+    """Handicap records for a whole membership"""
+
+    def __init__(self, courses: Dict[str, Course]):
+        self.courses = courses
+        self.records: Dict[str, HandicapRecord] = {}
+        self._course_names: Dict[str, Optional[Course]] = {}
+
+    def course(self, name: str) -> Optional[Course]:
+        """Course for a scorecard name, resolved once per name"""
+        if name not in self._course_names:
+            self._course_names[name] = find_course(self.courses, name)
+        return self._course_names[name]
+
+    def post_round(self, player: str, course_name: str, holes: Optional[Sequence[int]] = None,
+                   score: Optional[int] = None, played: Optional[date] = None, pcc: float = 0.0) -> Optional[float]:
+        """Post one round, hole by hole (adjusted to net double bogey) or as a gross score"""
+        course = self.course(course_name)
+        if course is None:
+            raise ValueError(f"no course data for {course_name!r}")
+        record = self.records.get(player)
+        if record is None:
+            record = self.records[player] = HandicapRecord()
+        if holes is not None and len(holes) == len(course.holes):
+            adjusted = adjusted_gross_score(holes, course, record.index)
+        elif score is not None:
+            adjusted = score
+        else:
+            raise ValueError(f"round for {player} at {course_name} has neither hole scores nor a total")
+        return record.post(score_differential(adjusted, course, pcc), played)
+
+    def summary(self, player: str) -> Dict[str, Any]:
+        record = self.records.get(player)
+        if record is None:
+            return {}
+        return {
+            'handicap_index': record.index,
+            'low_handicap_index': record.low_index,
+            'rounds_posted': record.sequence,
+            'differentials': [value for _, value in record.window],
+            'counting_differentials': [value for value, _ in record.ranked[:DIFFERENTIALS_USED.get(len(record.ranked), (0, 0))[0]]],
+            'history': record.history
+        }
+
+def index_rounds(rounds: Iterable[Mapping], courses: Dict[str, Course]) -> HandicapIndex:
+    """Post rounds in the order given; each needs player, course and holes or score (date optional)"""
+    membership = HandicapIndex(courses)
+    for round_data in rounds:
+        if membership.course(round_data['course']) is None:
+            continue
+        played = round_data.get('date')
+        membership.post_round(round_data['player'], round_data['course'], round_data.get('holes'),
+                              round_data.get('score'), date.fromisoformat(played) if isinstance(played, str) else played)
+    return membership
+
+def player_handicap(rounds: Iterable[Mapping], hole_cards: Mapping[Any, Sequence[int]],
+                    courses: Dict[str, Course]) -> Dict[str, Any]:
+    """Index from one player's rounds in the order played; hole_cards maps day -> strokes per hole"""
+    membership = HandicapIndex(courses)
+    for round_data in rounds:
+        if membership.course(round_data['course']) is not None:
+            membership.post_round('player', round_data['course'], hole_cards.get(round_data['day']), round_data['score'])
+    summary = membership.summary('player')
+    summary.pop('history', None)
+    return summary or {'handicap_index': None, 'low_handicap_index': None, 'rounds_posted': 0,
+                       'differentials': [], 'counting_differentials': []}
+
+def read_rounds(filename: str) -> List[Dict[str, Any]]:
+    """Round history CSV: player, course, score and optional date, in posting order"""
+    with open(filename, 'r', newline='') as file:
+        return [dict(row, score=int(row['score'])) for row in csv.DictReader(file)]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('rounds', help='round history CSV (player, course, score[, date]) in posting order')
+    parser.add_argument('--courses', default=COURSES_FILE, help='course ratings and scorecards')
+    parser.add_argument('--output', default='handicaps.json', help='where to write every player\'s index')
+    args = parser.parse_args()
+
+    membership = index_rounds(read_rounds(args.rounds), load_courses(args.courses))
+    results = {player: membership.summary(player) for player in membership.records}
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f"Handicap indexes for {len(results)} players saved to {os.path.normpath(args.output)}")
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Per-course hole analytics (difficulty, scoring index, player tendencies, risk/reward) as compact matrices
+"""
+
+import math
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from course_data import Course, find_course
+
+# Thresholds (percent of hole scores) shared with the dashboard's former in-browser analysis
+BIRDIE_OPPORTUNITY_RATE = 10
+SCORING_HOLE_RATE = 15
+TROUBLE_SPOT_RATE = 20
+AGGRESSIVE_PENALTY_RATE = 30
+DAMAGE_CONTROL_RATE = 40
+PAR_PROTECTION_RATE = 40
+TOUGH_HOLE_OVER_PAR = 1.5
+LISTED_HOLES = 5
+HOLES_PER_ROUND = 18   # matrices widen for longer cards
+
+def hole_type(par: int, yardage: Optional[int]) -> Optional[str]:
+    if yardage is None:
+        return None
+    if par == 3:
+        return 'short-par-3' if yardage < 160 else 'long-par-3'
+    if par == 4:
+        return 'short-par-4' if yardage < 350 else 'medium-par-4' if yardage < 400 else 'long-par-4'
+    return 'short-par-5' if yardage < 500 else 'long-par-5'
+
+def risk_reward_level(handicap: Optional[int], par: int) -> Optional[str]:
+    if handicap is None:
+        return None
+    if handicap <= 6 and par >= 4:
+        return 'Aggressive'
+    return 'Conservative' if handicap >= 14 else 'Moderate'
+
+def difficulty_label(over_par: float) -> str:
+    if over_par <= 0.3:
+        return 'Easy'
+    if over_par <= 0.8:
+        return 'Moderate'
+    return 'Hard' if over_par <= 1.5 else 'Very Hard'
+
+def _half_up(value: float) -> int:
+    # JavaScript's Math.round, which the dashboard used
+    return math.floor(value + 0.5)
+
+def _cell(total: int, count: int) -> Optional[float]:
+    # Whole numbers (a single round) stay integers to keep the matrix compact
+    if not count:
+        return None
+    return total // count if total % count == 0 else round(total / count, 2)
+
+class CourseMatrix:
+    """Stroke sums and counts per (player, hole) cell plus outcome counts per hole for one course.
+
+    Cells live in flat arrays indexed player * holes + hole, filled in one
+    pass over the hole scores; every per-hole and per-player figure is then
+    a reduction over a row or column of these matrices.
+    """
+
+    def __init__(self, holes: int = HOLES_PER_ROUND):
+        self.holes = holes
+        self.players: Dict[str, int] = {}
+        self.sums = array('l')
+        self.squares = array('l')
+        self.counts = array('l')
+        self.par = [0] * holes
+        # Per hole: birdie or better, par, bogey, double bogey or worse
+        self.outcomes = [array('l', [0] * holes) for _ in range(4)]
+
+    def _widen(self, holes: int):
+        """Re-lay the matrices for a course with more holes than assumed"""
+        for name in ('sums', 'squares', 'counts'):
+            old = getattr(self, name)
+            new = array('l', [0] * (len(self.players) * holes))
+            for row in range(len(self.players)):
+                new[row * holes:row * holes + self.holes] = old[row * self.holes:(row + 1) * self.holes]
+            setattr(self, name, new)
+        self.par.extend([0] * (holes - self.holes))
+        for outcome in self.outcomes:
+            outcome.extend([0] * (holes - self.holes))
+        self.holes = holes
+
+    def add(self, player: str, hole: int, par: int, strokes: int):
+        if hole >= self.holes:
+            self._widen(hole + 1)
+        row = self.players.get(player)
+        if row is None:
+            row = self.players[player] = len(self.players)
+            for column in (self.sums, self.squares, self.counts):
+                column.extend([0] * self.holes)
+        cell = row * self.holes + hole
+        relative = strokes - par
+        self.sums[cell] += relative
+        self.squares[cell] += relative * relative
+        self.counts[cell] += 1
+        self.par[hole] = par
+        self.outcomes[min(max(relative, -1), 2) + 1][hole] += 1
+
+HOLE_FIELDS = ('course', 'player', 'hole', 'par', 'strokes')
+
+def _hole_rows(hole_scores: Iterable[Mapping]) -> Iterable[tuple]:
+    # A ColumnTable hands over whole decoded columns, far cheaper than row-by-row lookups
+    if hasattr(hole_scores, 'column'):
+        return zip(*(hole_scores.column(name) for name in HOLE_FIELDS))
+    return ((row['course'], row['player'], row['hole'], row['par'], row['strokes']) for row in hole_scores)
+
+def _course_matrices(hole_scores: Iterable[Mapping]) -> Dict[str, CourseMatrix]:
+    """One pass over every hole score, into per-course matrices"""
+    matrices: Dict[str, CourseMatrix] = {}
+    for course, player, hole, par, strokes in _hole_rows(hole_scores):
+        matrix = matrices.get(course)
+        if matrix is None:
+            matrix = matrices[course] = CourseMatrix()
+        matrix.add(player, hole - 1, par, strokes)
+    return matrices
+
+def calculate_hole_analysis(hole_scores: Iterable[Mapping], players: List[str],
+                            courses: Dict[str, Course]) -> Dict[str, Any]:
+    """Hole analytics for every course in the hole-by-hole scores, keyed by course"""
+    order = {player: index for index, player in enumerate(players)}
+    analysis = {}
+    for course, matrix in _course_matrices(hole_scores).items():
+        layout = find_course(courses, course)
+        holes = {hole.number: hole for hole in layout.holes} if layout else {}
+        analysis[course] = _analyze_course(matrix, holes, sorted(matrix.players, key=lambda p: order.get(p, len(order))))
+    return analysis
+
+def _analyze_course(matrix: CourseMatrix, layout: Dict[int, Any], players: List[str]) -> Dict[str, Any]:
+    n = matrix.holes
+    numbers = list(range(1, n + 1))
+    yardage = [layout[number].yardage if number in layout else None for number in numbers]
+    handicap = [layout[number].stroke_index if number in layout else None for number in numbers]
+    par = [layout[number].par if number in layout else matrix.par[number - 1] for number in numbers]
+    types = [hole_type(p, y) for p, y in zip(par, yardage)]
+
+    # Column reductions: every player's strokes on each hole
+    played = [sum(matrix.counts[hole::n]) for hole in range(n)]
+    over_par = [sum(matrix.sums[hole::n]) / played[hole] if played[hole] else 0.0 for hole in range(n)]
+    rates = [[count / played[hole] * 100 if played[hole] else 0.0 for hole, count in enumerate(outcome)]
+             for outcome in matrix.outcomes]
+    birdie_rate, par_rate, bogey_rate, double_rate = rates
+
+    difficulty_rating = [max(1, min(18, _half_up(h + (o - 1) * 5))) if h is not None else None
+                         for h, o in zip(handicap, over_par)]
+    scoring_index = [round(o - h / 18 * 1.2, 2) if h is not None else None for h, o in zip(handicap, over_par)]
+    # Hardest first; a stable sort keeps hole order among equals
+    by_difficulty = sorted(range(n), key=lambda hole: -over_par[hole])
+    difficulty_rank = [0] * n
+    for rank, hole in enumerate(by_difficulty, start=1):
+        difficulty_rank[hole] = rank
+
+    # Heatmap cells: each player's average strokes over par per hole (None where not played)
+    heatmap = []
+    for player in players:
+        start = matrix.players[player] * n
+        heatmap.append([_cell(matrix.sums[cell], matrix.counts[cell]) for cell in range(start, start + n)])
+
+    def listed(hole: int, **values) -> Dict[str, Any]:
+        return {'hole': hole + 1, **values}
+
+    return {
+        'holes': numbers,
+        'par': par,
+        'yardage': yardage,
+        'handicap': handicap,
+        'hole_type': types,
+        'risk_reward_level': [risk_reward_level(h, p) for h, p in zip(handicap, par)],
+        'average_score': [round(p + o, 2) for p, o in zip(par, over_par)],
+        'average_over_par': [round(o, 2) for o in over_par],
+        'birdie_rate': [round(rate, 1) for rate in birdie_rate],
+        'par_rate': [round(rate, 1) for rate in par_rate],
+        'bogey_rate': [round(rate, 1) for rate in bogey_rate],
+        'double_bogey_plus_rate': [round(rate, 1) for rate in double_rate],
+        'difficulty': [difficulty_label(o) for o in over_par],
+        'difficulty_rank': difficulty_rank,
+        'difficulty_rating': difficulty_rating,
+        'scoring_index': scoring_index,
+        'players': players,
+        'heatmap': heatmap,
+        'course_difficulty': {
+            'hardest_holes': [listed(h, avg_over_par=round(over_par[h], 2), handicap=handicap[h])
+                              for h in by_difficulty[:LISTED_HOLES]],
+            'easiest_holes': [listed(h, avg_over_par=round(over_par[h], 2), handicap=handicap[h])
+                              for h in reversed(by_difficulty[-LISTED_HOLES:])],
+            'birdie_opportunities': [listed(h, birdie_rate=round(birdie_rate[h], 1), par=par[h])
+                                     for h in by_difficulty if birdie_rate[h] > BIRDIE_OPPORTUNITY_RATE],
+            'trouble_spots': [listed(h, bogey_plus_rate=round(double_rate[h], 1), par=par[h])
+                              for h in by_difficulty if double_rate[h] > TROUBLE_SPOT_RATE]
+        },
+        'player_performance': {player: _player_tendencies(matrix, matrix.players[player], types) for player in players},
+        'strategic_insights': [_strategic_insight(birdie_rate[h], double_rate[h], over_par[h]) for h in range(n)],
+        'risk_reward': {
+            'aggressive_holes': [listed(h, risk_level=round(double_rate[h] / 10, 2), avg_reward=round(birdie_rate[h], 1),
+                                        avg_penalty=round(double_rate[h], 1))
+                                 for h in range(n) if birdie_rate[h] > BIRDIE_OPPORTUNITY_RATE
+                                 and double_rate[h] > AGGRESSIVE_PENALTY_RATE],
+            'conservative_holes': [listed(h, par_protection_rate=round(par_rate[h], 1))
+                                   for h in range(n) if par_rate[h] > PAR_PROTECTION_RATE],
+            'scoring_opportunities': [listed(h, birdie_rate=round(birdie_rate[h], 1))
+                                      for h in range(n) if birdie_rate[h] > BIRDIE_OPPORTUNITY_RATE]
+        }
+    }
+
+def _player_tendencies(matrix: CourseMatrix, row: int, types: List[Optional[str]]) -> Dict[str, Any]:
+    """Average and consistency over par by hole type, from one row of the matrices"""
+    totals: Dict[str, List[int]] = {}
+    start = row * matrix.holes
+    for hole, kind in enumerate(types):
+        cell = start + hole
+        if kind is None or not matrix.counts[cell]:
+            continue
+        total = totals.setdefault(kind, [0, 0, 0])
+        total[0] += matrix.counts[cell]
+        total[1] += matrix.sums[cell]
+        total[2] += matrix.squares[cell]
+
+    average = {}
+    consistency = {}
+    for kind, (count, relative, squares) in totals.items():
+        mean = relative / count
+        deviation = math.sqrt(max(squares / count - mean * mean, 0.0))  # population, as the dashboard computed it
+        average[kind] = round(mean, 2)
+        consistency[kind] = _half_up(max(1, 10 - deviation * 2) * 10) / 10
+    ranked = sorted(average, key=average.get)
+    return {
+        'average_by_hole_type': average,
+        'consistency_by_hole_type': consistency,
+        'strengths': ranked[:2],
+        'weaknesses': ranked[-2:]
+    }
+
+def _strategic_insight(birdie_rate: float, double_rate: float, over_par: float) -> Dict[str, str]:
+    if birdie_rate > SCORING_HOLE_RATE:
+        return {'category': 'scoring-opportunity', 'insight': f"Birdie rate ({birdie_rate:.1f}%) makes this a scoring hole",
+                'strategy': 'Attack when in good position'}
+    if double_rate > DAMAGE_CONTROL_RATE:
+        return {'category': 'damage-control',
+                'insight': f"High big number rate ({double_rate:.1f}%) requires careful play",
+                'strategy': 'Play conservatively to avoid trouble'}
+    if over_par > TOUGH_HOLE_OVER_PAR:
+        return {'category': 'damage-control', 'insight': f"Averaging {over_par:.1f} over par - one of the toughest holes",
+                'strategy': 'Focus on making bogey or better'}
+    return {'category': 'course-management', 'insight': 'Solid par opportunity with good management',
+            'strategy': 'Play smart and avoid trouble'}
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Declarative superlatives: every award is a rule, and all rules are fed in one scan of each table
+"""
+
+import heapq
+import math
+from abc import ABC, abstractmethod
+from fractions import Fraction
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+AWARD_PLACES = 3   # entries per award, plus anyone tied with the last of them
+
+class TopK:
+    """The k best values seen so far, keeping every entry tied with the k-th.
+
+    A bounded heap holds the current k best with the worst on top; entries
+    equal to that cutoff wait in a tie list, which is dropped as soon as the
+    cutoff improves. Among equal values the earliest pushed ranks first, as
+    min()/max() would pick it.
+    """
+
+    def __init__(self, k: int, largest: bool = False):
+        self.k = k
+        self.sign = 1 if largest else -1
+        self.heap: List[Tuple[Any, int, Any]] = []
+        self.ties: List[Tuple[Any, int, Any]] = []
+        self.count = 0
+
+    def push(self, value: Any, item: Any):
+        # Heap order puts the worst value, and the latest among equals, on top
+        entry = (self.sign * value, -self.count, item)
+        self.count += 1
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+            return
+        cutoff = self.heap[0][0]
+        if entry[0] > cutoff:
+            dropped = heapq.heapreplace(self.heap, entry)
+            if self.heap[0][0] == cutoff:
+                self.ties.append(dropped)
+            else:
+                self.ties = []
+        elif entry[0] == cutoff:
+            self.ties.append(entry)
+
+    def ranked(self) -> List[Tuple[int, Any, Any]]:
+        """(rank, value, item) best first; tied values share a rank"""
+        entries = sorted(self.heap + self.ties, reverse=True)
+        ranked = []
+        for position, (key, _, item) in enumerate(entries):
+            rank = ranked[-1][0] if ranked and key == entries[position - 1][0] else position + 1
+            ranked.append((rank, self.sign * key, item))
+        return ranked
+
+class Rule(ABC):
+    """One award or fact computed from a single table ('rounds', 'player_stats' or 'match_play').
+
+    Rules are declarations: start() makes the accumulator for one
+    evaluation, feed() folds a row into it and ranked() reads it out.
+    """
+
+    def __init__(self, name: str, stream: str, label: str = 'player'):
+        self.name = name
+        self.stream = stream
+        self.label = label  # what a plain (non-dict) entry names, for award listings
+
+    @abstractmethod
+    def start(self, places: int) -> Any:
+        raise NotImplementedError
+
+    def shared_key(self) -> Optional[tuple]:
+        """Rules returning the same key accumulate identically and can share one state (None: never share)"""
+        return None
+
+    @abstractmethod
+    def feed(self, state: Any, row: Mapping):
+        raise NotImplementedError
+
+    @abstractmethod
+    def ranked(self, state: Any, places: int) -> List[Tuple[int, Any, Any]]:
+        raise NotImplementedError
+
+class RowRule(Rule):
+    """Best rows by a per-row value (None skips the row); entries are built from the row"""
+
+    def __init__(self, name: str, stream: str, value: Callable[[Mapping], Any],
+                 entry: Callable[[Mapping], Any], largest: bool = False, label: str = 'player'):
+        super().__init__(name, stream, label)
+        self.value = value
+        self.entry = entry
+        self.largest = largest
+
+    def start(self, places: int) -> TopK:
+        return TopK(places, self.largest)
+
+    def feed(self, state: TopK, row: Mapping):
+        value = self.value(row)
+        if value is not None:
+            state.push(value, self.entry(row))
+
+    def ranked(self, state: TopK, places: int) -> List[Tuple[int, Any, Any]]:
+        return state.ranked()
+
+class Running:
+    """Count, sum, sum of squares, first and last of one group's values"""
+    __slots__ = ('count', 'total', 'squares', 'first', 'last')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.squares = 0
+        self.first = None
+        self.last = None
+
+    def add(self, value: Any):
+        if self.count == 0:
+            self.first = value
+        self.count += 1
+        # Floats are summed as exact fractions, like statistics.stdev does, so the variance never cancels
+        # rounding error; integer scores stay plain ints
+        exact = Fraction(value) if isinstance(value, float) else value
+        self.total += exact
+        self.squares += exact * exact
+        self.last = value
+
+    def sum(self) -> Any:
+        return float(self.total) if isinstance(self.total, Fraction) else self.total
+
+    def mean(self) -> float:
+        return float(self.total / self.count)
+
+    def stdev(self) -> float:
+        variance = Fraction(self.count * self.squares - self.total * self.total, self.count * (self.count - 1))
+        return math.sqrt(variance)
+
+REDUCERS: Dict[str, Callable[[Running], Any]] = {
+    'sum': Running.sum,
+    'mean': Running.mean,
+    'stdev': Running.stdev,
+    'improvement': lambda running: running.first - running.last
+}
+
+class GroupRule(Rule):
+    """Best groups (players, courses...) by a running aggregate of a per-row value"""
+
+    def __init__(self, name: str, stream: str, group: Callable[[Mapping], Any], value: Callable[[Mapping], Any],
+                 reduce: str = 'sum', largest: bool = False, min_count: int = 1, label: str = 'player'):
+        super().__init__(name, stream, label)
+        self.group = group
+        self.value = value
+        self.reduce = REDUCERS[reduce]
+        self.largest = largest
+        self.min_count = min_count
+
+    def start(self, places: int) -> Dict[Any, Running]:
+        return {}
+
+    def shared_key(self) -> Optional[tuple]:
+        # Reduce, direction and min_count only apply when ranking, so any grouping of the same values can share
+        return (self.stream, self.group, self.value)
+
+    def feed(self, state: Dict[Any, Running], row: Mapping):
+        value = self.value(row)
+        if value is None:
+            return
+        key = self.group(row)
+        running = state.get(key)
+        if running is None:
+            running = state[key] = Running()
+        running.add(value)
+
+    def ranked(self, state: Dict[Any, Running], places: int) -> List[Tuple[int, Any, Any]]:
+        top = TopK(places, self.largest)
+        for key, running in state.items():  # first-appearance order breaks ties
+            if running.count >= self.min_count:
+                top.push(self.reduce(running), key)
+        return top.ranked()
+
+class TotalRule(Rule):
+    """A plain running total, e.g. for fun facts"""
+
+    def __init__(self, name: str, stream: str, value: Callable[[Mapping], Any]):
+        super().__init__(name, stream)
+        self.value = value
+
+    def start(self, places: int) -> List[Any]:
+        return [0]
+
+    def feed(self, state: List[Any], row: Mapping):
+        state[0] += self.value(row)
+
+    def ranked(self, state: List[Any], places: int) -> List[Tuple[int, Any, Any]]:
+        return [(1, state[0], None)]
+
+def evaluate_rules(rules: List[Rule], streams: Dict[str, Iterable[Mapping]], places: int = AWARD_PLACES
+                   ) -> Dict[str, List[Tuple[int, Any, Any]]]:
+    """Feed every row of each stream to all rules on it in one pass; returns each rule's ranked entries"""
+    states = []
+    shared: Dict[tuple, Any] = {}
+    by_stream: Dict[str, List[Tuple[Callable[[Any, Mapping], None], Any]]] = {}
+    for rule in rules:
+        key = rule.shared_key()
+        if key in shared:
+            states.append(shared[key])
+            continue
+        state = rule.start(places)
+        if key is not None:
+            shared[key] = state
+        states.append(state)
+        by_stream.setdefault(rule.stream, []).append((rule.feed, state))
+    for stream, feeds in by_stream.items():
+        # Each row is decoded once (table rows may be lazy views), then read by every rule
+        for row in map(dict, streams[stream]):
+            for feed, state in feeds:
+                feed(state, row)
+    return {rule.name: rule.ranked(state, places) for rule, state in zip(rules, states)}
+
+def _round_entry(row: Mapping) -> Dict[str, Any]:
+    return {'player': row['player'], 'score': row['score'], 'course': row['course'], 'day': row['day']}
+
+def _player(row: Mapping) -> str:
+    return row['player']
+
+def _course(row: Mapping) -> str:
+    return row['course']
+
+def _score(row: Mapping) -> int:
+    return row['score']
+
+def _to_par(row: Mapping) -> int:
+    return row['score'] - row['par']
+
+def _stableford(row: Mapping) -> Optional[int]:
+    return row.get('stableford_points')
+
+def _stat(column: str) -> Callable[[Mapping], int]:
+    return lambda row: int(row.get(column) or 0)
+
+# The awards behind tournament_insights. 'rounds' streams individual rounds; 'player_stats' and
+# 'match_play' the cleaned tables of the same names
+INSIGHT_RULES: List[Rule] = [
+    GroupRule('tournament_champion', 'rounds', _player, _score, 'sum'),
+    RowRule('lowest_single_round', 'rounds', _score, _round_entry),
+    RowRule('highest_single_round', 'rounds', _score, _round_entry, largest=True),
+    RowRule('best_round_to_par', 'rounds', _to_par, _round_entry),
+    RowRule('best_stableford_round', 'rounds', _stableford, _round_entry, largest=True),
+    GroupRule('most_consistent_player', 'rounds', _player, _score, 'stdev', min_count=2),
+    GroupRule('most_improved', 'rounds', _player, _score, 'improvement', largest=True, min_count=2),
+    GroupRule('easiest_course', 'rounds', _course, _to_par, 'mean', label='course'),
+    GroupRule('hardest_course', 'rounds', _course, _to_par, 'mean', largest=True, label='course'),
+    TotalRule('total_strokes', 'rounds', _score),
+    RowRule('match_play_dominator', 'match_play', lambda row: row['total_points'], lambda row: row['player'],
+            largest=True),
+    TotalRule('match_play_points', 'match_play', lambda row: float(row['total_points'])),
+    TotalRule('match_play_possible', 'match_play', _stat('possible_points')),
+    RowRule('birdie_machine', 'player_stats', _stat('birdies'), _player, largest=True),
+    RowRule('steady_eddie', 'player_stats', _stat('pars'), _player, largest=True),
+    RowRule('big_number_specialist', 'player_stats',
+            lambda row: int(row.get('quadruple_bogeys') or 0) + int(row.get('quintuple_plus') or 0), _player,
+            largest=True),
+    TotalRule('total_birdies', 'player_stats', _stat('birdies')),
+    TotalRule('total_holes', 'player_stats', _stat('total_holes'))
+]
+
+# Rules ranked as awards (name -> what their entries name); the rest are totals for the fun facts
+AWARD_LABELS = {rule.name: rule.label for rule in INSIGHT_RULES if not isinstance(rule, TotalRule)}
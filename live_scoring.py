@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Live scoring: apply hole-by-hole or round score events and emit only what changed
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from calculate_stats import (TEAM_FORMATS, SqliteSource, consistency_rating, find_best_improvement,
+                             load_tournament_frame)
+from rank_index import RankIndex
+
+HOLES_PER_ROUND = 18
+
+class RunningStats:
+    """Count, mean and sample variance updated one value at a time (Welford)"""
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float):
+        """Undo a previous add(), e.g. when a posted round is corrected"""
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        delta = value - self.mean
+        self.count -= 1
+        self.mean -= delta / self.count
+        self.m2 = max(self.m2 - delta * (value - self.mean), 0.0)
+
+    def stdev(self) -> float:
+        """Sample standard deviation, 0 until there are two values (like the batch stats)"""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0
+
+class LiveRound:
+    """One player's round for one day, built from hole events or posted whole"""
+
+    __slots__ = ('day', 'course', 'format', 'holes', 'strokes', 'par', 'posted')
+
+    def __init__(self, day: int, course: str, round_format: str):
+        self.day = day
+        self.course = course
+        self.format = round_format
+        self.holes: Dict[int, Tuple[int, int]] = {}  # hole -> (strokes, par)
+        self.strokes = 0
+        self.par = 0
+        self.posted = False  # counted in the player's round statistics
+
+    @property
+    def thru(self) -> int:
+        return len(self.holes) if self.holes else (HOLES_PER_ROUND if self.posted else 0)
+
+    def set_hole(self, hole: int, strokes: int, par: int):
+        old_strokes, old_par = self.holes.get(hole, (0, 0))
+        self.holes[hole] = (strokes, par)
+        self.strokes += strokes - old_strokes
+        self.par += par - old_par
+
+class LivePlayer:
+    """Running totals for one player; every update is O(1) apart from corrections"""
+
+    def __init__(self, name: str, order: int):
+        self.name = name
+        self.order = order  # tie-break: order of first appearance, like the batch leaderboard
+        self.rounds: Dict[int, LiveRound] = {}
+        self.open_rounds: Dict[int, LiveRound] = {}  # started but not yet posted
+        self.scores = RunningStats()
+        self.relative = RunningStats()
+        self.total_score = 0
+        self.total_relative = 0
+        self.best_round: Optional[int] = None
+        self.worst_round: Optional[int] = None
+        self.best_relative: Optional[int] = None
+        self.worst_relative: Optional[int] = None
+        self.daily_scores: List[int] = []  # posted scores in day order
+        self.last_posted_day: Optional[int] = None
+        self.best_improvement = 0
+        self.most_improved_day = 'N/A'
+
+    def to_par(self) -> int:
+        """Posted rounds plus any round in progress"""
+        in_progress = sum(r.strokes - r.par for r in self.open_rounds.values())
+        return self.total_relative + in_progress
+
+    def current_round(self) -> Optional[LiveRound]:
+        in_progress = [r for r in self.open_rounds.values() if r.holes]
+        return max(in_progress, key=lambda r: r.day) if in_progress else None
+
+    def post(self, live_round: LiveRound):
+        """Count a finished round in the running statistics"""
+        score, relative = live_round.strokes, live_round.strokes - live_round.par
+        live_round.posted = True
+        self.open_rounds.pop(live_round.day, None)
+        self.scores.add(score)
+        self.relative.add(relative)
+        self.total_score += score
+        self.total_relative += relative
+        self.best_round = score if self.best_round is None else min(self.best_round, score)
+        self.worst_round = score if self.worst_round is None else max(self.worst_round, score)
+        self.best_relative = relative if self.best_relative is None else min(self.best_relative, relative)
+        self.worst_relative = relative if self.worst_relative is None else max(self.worst_relative, relative)
+
+        if self.last_posted_day is None or live_round.day > self.last_posted_day:
+            # Rounds normally arrive in day order: compare with the previous day only
+            self.daily_scores.append(score)
+            self.last_posted_day = live_round.day
+            if len(self.daily_scores) > 1:
+                improvement = self.daily_scores[-2] - score
+                if improvement > self.best_improvement:
+                    self.best_improvement = improvement
+                    self.most_improved_day = f'Day {len(self.daily_scores)}'
+            self._label_improvement()
+        else:
+            self._rescan()
+
+    def unpost(self, live_round: LiveRound):
+        """Withdraw a posted round before it is corrected"""
+        score, relative = live_round.strokes, live_round.strokes - live_round.par
+        live_round.posted = False
+        self.open_rounds[live_round.day] = live_round
+        self.scores.remove(score)
+        self.relative.remove(relative)
+        self.total_score -= score
+        self.total_relative -= relative
+        self._rescan()
+
+    def _rescan(self):
+        # Corrections and out-of-order rounds are rare; rebuild the order-dependent fields
+        posted = sorted((r for r in self.rounds.values() if r.posted), key=lambda r: r.day)
+        scores = [r.strokes for r in posted]
+        relatives = [r.strokes - r.par for r in posted]
+        self.best_round = min(scores) if scores else None
+        self.worst_round = max(scores) if scores else None
+        self.best_relative = min(relatives) if relatives else None
+        self.worst_relative = max(relatives) if relatives else None
+        self.daily_scores = scores
+        self.last_posted_day = posted[-1].day if posted else None
+        self.best_improvement = max([a - b for a, b in zip(scores, scores[1:])] + [0])
+        self.most_improved_day = find_best_improvement(scores)
+
+    def _label_improvement(self):
+        if len(self.daily_scores) < 2:
+            self.most_improved_day = 'N/A'
+        elif self.best_improvement <= 0:
+            self.most_improved_day = 'No significant improvement'
+
+    def summary(self) -> Dict[str, Any]:
+        """Flat live stats, named like the batch player statistics"""
+        rounds_played = self.scores.count
+        score_sd = round(self.scores.stdev(), 2)
+        current = self.current_round()
+        return {
+            'total_score': self.total_score,
+            'rounds_played': rounds_played,
+            'scoring_average': round(self.total_score / rounds_played, 2) if rounds_played else None,
+            'average_relative_to_par': round(self.total_relative / rounds_played, 2) if rounds_played else None,
+            'best_round': self.best_round,
+            'worst_round': self.worst_round,
+            'best_relative_round': self.best_relative,
+            'worst_relative_round': self.worst_relative,
+            'score_standard_deviation': score_sd,
+            'relative_par_standard_deviation': round(self.relative.stdev(), 2),
+            'consistency_rating': consistency_rating(score_sd),
+            'most_improved_day': self.most_improved_day,
+            'to_par': self.to_par(),
+            'current_round': {
+                'day': current.day,
+                'course': current.course,
+                'thru': current.thru,
+                'score': current.strokes,
+                'relative_to_par': current.strokes - current.par
+            } if current else None
+        }
+
+EVENT_FIELDS = {
+    'hole': ('day', 'hole', 'strokes', 'par'),
+    'round': ('day', 'score', 'par')
+}
+
+def parse_event(event: Any) -> Tuple[str, Dict[str, int]]:
+    """An event's type and its whole-number fields, or ValueError naming what is missing or malformed"""
+    if not isinstance(event, dict):
+        raise ValueError(f"an event must be a JSON object, got {type(event).__name__}")
+    event_type = event.get('type', 'hole' if 'hole' in event else 'round')
+    if event_type not in EVENT_FIELDS:
+        raise ValueError(f"unknown event type {event_type!r}")
+    if event.get('format') in TEAM_FORMATS:
+        return event_type, {}
+    if not isinstance(event.get('player'), str) or not event['player']:
+        raise ValueError(f"{event_type} event has no player")
+    fields = {}
+    for name in EVENT_FIELDS[event_type]:
+        value = event.get(name)
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            raise ValueError(f"{event_type} event for {event['player']} has no {name}")
+        try:
+            fields[name] = int(value)
+        except ValueError:
+            raise ValueError(f"{event_type} event for {event['player']} has {name} {value!r}, not a whole number") from None
+    return event_type, fields
+
+class LiveTournament:
+    """Incrementally maintained player stats and leaderboard.
+
+    The leaderboard is a RankIndex of to-par totals with ties in entry
+    order; an event moves one player in O(log n), and only players whose
+    rank can have changed (those between the old and new scores, plus ties)
+    are re-ranked. Each apply() returns just the changed fields.
+    """
+
+    def __init__(self):
+        self.players: Dict[str, LivePlayer] = {}
+        self.board = RankIndex()
+        self.emitted: Dict[str, Dict[str, Any]] = {}  # last summary sent per player
+        self.standings: Dict[str, Dict[str, int]] = {}  # last rank and to-par sent per player
+        self.sequence = 0
+
+    @classmethod
+    def from_frame(cls, frame) -> 'LiveTournament':
+        """Seed the live state with the rounds already in the cleaned tables"""
+        live = cls()
+        for round_data in frame.rounds:
+            live.apply({'type': 'round', 'player': round_data['player'], 'day': round_data['day'],
+                        'score': round_data['score'], 'par': round_data['par'],
+                        'course': round_data['course'], 'format': round_data['format']})
+        live.sequence = 0
+        return live
+
+    def _player(self, name: str) -> Tuple[LivePlayer, bool]:
+        player = self.players.get(name)
+        if player is None:
+            player = self.players[name] = LivePlayer(name, len(self.players))
+            return player, True
+        return player, False
+
+    def rank(self, to_par: int) -> int:
+        """Golf rank: tied players share the best position"""
+        return self.board.rank_of(to_par)
+
+    def apply(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply one score event and return the changed stats
+
+        A malformed event raises ValueError before any state changes.
+        """
+        event_type, fields = parse_event(event)
+        if event.get('format') in TEAM_FORMATS:
+            # Team rounds are not part of anyone's individual stats
+            self.sequence += 1
+            return {'event': self.sequence, 'players': {}, 'leaderboard': {}}
+
+        player, is_new = self._player(event['player'])
+        old_to_par = None if is_new else player.to_par()
+        day = fields['day']
+        live_round = player.rounds.get(day)
+        if live_round is None:
+            live_round = player.rounds[day] = LiveRound(day, event.get('course', ''), event.get('format', ''))
+            player.open_rounds[day] = live_round
+        if live_round.posted:
+            player.unpost(live_round)
+
+        if event_type == 'hole':
+            if not live_round.holes:
+                # A round posted whole is being rescored hole by hole
+                live_round.strokes = live_round.par = 0
+            live_round.set_hole(fields['hole'], fields['strokes'], fields['par'])
+            if len(live_round.holes) == HOLES_PER_ROUND or event.get('final'):
+                player.post(live_round)
+        else:
+            live_round.holes = {}
+            live_round.strokes, live_round.par = fields['score'], fields['par']
+            player.post(live_round)
+
+        self.sequence += 1
+        return {
+            'event': self.sequence,
+            'players': self._player_changes(player),
+            'leaderboard': self._move(player, old_to_par)
+        }
+
+    def _player_changes(self, player: LivePlayer) -> Dict[str, Any]:
+        previous = self.emitted.get(player.name, {})
+        current = player.summary()
+        self.emitted[player.name] = current
+        changed = {key: value for key, value in current.items() if previous.get(key, object()) != value}
+        return {player.name: changed} if changed else {}
+
+    def _move(self, player: LivePlayer, old_to_par: Optional[int]) -> Dict[str, Any]:
+        new_to_par = player.to_par()
+        self.board.update(player.name, new_to_par, player.order)
+
+        # Only players between the old and new score (inclusive) can change rank;
+        # a new entry can push back everyone behind it
+        if old_to_par is None:
+            affected = self.board.between(new_to_par)
+        else:
+            affected = self.board.between(old_to_par, new_to_par)
+        changes = {}
+        for name, to_par in affected:
+            standing = {'rank': self.rank(to_par), 'to_par': to_par}
+            if self.standings.get(name) != standing:
+                self.standings[name] = standing
+                changes[name] = standing
+        return changes
+
+    def leaderboard(self) -> List[Dict[str, Any]]:
+        """Full standings, e.g. for a snapshot"""
+        return [{'player': name, 'rank': self.rank(to_par), 'to_par': to_par,
+                 'thru': self.emitted[name]['current_round']['thru'] if self.emitted[name]['current_round'] else None}
+                for name, to_par in self.board]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'event': self.sequence,
+            'leaderboard': self.leaderboard(),
+            'players': {name: self.emitted[name] for name in self.players}
+        }
+
+def read_events(file: TextIO, errors: Optional[TextIO] = None) -> Iterator[Dict[str, Any]]:
+    """One JSON object per line; blank lines are skipped and lines that are not JSON reported and skipped"""
+    for number, line in enumerate(file, 1):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as error:
+                (errors or sys.stderr).write(f"Skipped line {number} ({error}): {line.strip()}\n")
+
+def write_snapshot(live: LiveTournament, filename: str):
+    temp_path = filename + '.tmp'
+    with open(temp_path, 'w') as file:
+        json.dump(live.snapshot(), file, indent=2)
+    os.replace(temp_path, filename)
+
+def run(events: Iterable[Dict[str, Any]], live: LiveTournament, out: TextIO, snapshot: Optional[str] = None,
+        errors: Optional[TextIO] = None):
+    """Apply events as they arrive, writing one line of changes per event; a bad event is reported and skipped"""
+    for event in events:
+        try:
+            changes = live.apply(event)
+        except ValueError as error:
+            (errors or sys.stderr).write(f"Skipped event {json.dumps(event)}: {error}\n")
+            continue
+        out.write(json.dumps(changes) + '\n')
+        out.flush()
+        if snapshot:
+            write_snapshot(live, snapshot)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('events', nargs='?', default='-', help='JSON-lines score events (default: stdin)')
+    parser.add_argument('--data-dir', help='seed with the rounds in this directory of cleaned CSV files')
+    parser.add_argument('--db', help='seed from this SQLite database instead (requires --event)')
+    parser.add_argument('--event', help='database event to seed from')
+    parser.add_argument('--snapshot', metavar='FILE', help='rewrite the full live standings to FILE after every event')
+    args = parser.parse_args()
+
+    if args.db and not args.event:
+        parser.error("--db requires --event")
+    if args.db:
+        live = LiveTournament.from_frame(load_tournament_frame(SqliteSource(args.db, args.event)))
+    elif args.data_dir:
+        live = LiveTournament.from_frame(load_tournament_frame(args.data_dir))
+    else:
+        live = LiveTournament()
+
+    source = sys.stdin if args.events == '-' else open(args.events, 'r')
+    try:
+        run(read_events(source), live, sys.stdout, args.snapshot)
+    finally:
+        if source is not sys.stdin:
+            source.close()
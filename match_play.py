@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Pairwise match play: every player against every other player, hole by hole
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+MATCH_PLAY_FORMATS = ('Match Play',)
+
+# Packed comparisons keep each value in 7 bits; no real hole score comes close
+MAX_STROKES = 99
+
+def round_scorecards(hole_scores: Iterable[Mapping], formats: Optional[Sequence[str]] = MATCH_PLAY_FORMATS
+                     ) -> Dict[Tuple[int, str], Dict[str, List[int]]]:
+    """(day, course) -> player -> strokes in hole order, for rounds in the given formats (None = all)"""
+    rounds = defaultdict(dict)
+    for row in hole_scores:
+        if formats is not None and row['format'] not in formats:
+            continue
+        card = rounds[(row['day'], row['course'])].setdefault(row['player'], {})
+        card[row['hole']] = row['strokes']
+
+    scorecards = {}
+    for key, cards in rounds.items():
+        # Only players with a complete card can be matched hole for hole
+        holes = max(len(card) for card in cards.values())
+        scorecards[key] = {
+            player: [card[hole] for hole in sorted(card)]
+            for player, card in cards.items() if len(card) == holes
+        }
+    return scorecards
+
+def play_match(a: Sequence[int], b: Sequence[int]) -> Dict[str, Any]:
+    """Result of one match from a's point of view (lower strokes win the hole)"""
+    return next(play_field([a, b]))[1][0]
+
+def play_field(cards: List[Sequence[int]]) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """Play each card against every later card, yielding (index, results vs index+1..n-1)
+
+    The opponents' strokes on each hole are packed one byte per player into
+    a single integer, so one subtraction compares a player with the whole
+    rest of the field on that hole (SWAR: the top bit of each byte is a
+    guard that survives only where the field is >= the value subtracted).
+    Holes won/lost, the running lead and the closing hole are all kept in
+    packed form and unpacked once per player with int.to_bytes.
+
+    Every hole is counted for holes won/halved/lost and hole points, as the
+    tournament's match play table scores them; the match itself is decided
+    when the lead exceeds the holes remaining.
+    """
+    players = len(cards)
+    holes = len(cards[0]) if cards else 0
+    columns = [int.from_bytes(bytes(min(card[hole], MAX_STROKES) for card in cards), 'little') for hole in range(holes)]
+
+    for index in range(players - 1):
+        opponents = players - index - 1
+        ones = int.from_bytes(b'\x01' * opponents, 'little')
+        guards = ones << 7
+        shift = 8 * (index + 1)
+
+        won = lost = closing_lead = closing_remaining = 0
+        lead = holes * ones  # lead offset by +holes so every byte stays non-negative
+        still_open = guards
+
+        for hole in range(holes):
+            strokes = min(cards[index][hole], MAX_STROKES) * ones
+            others = columns[hole] >> shift
+            wins = (((others | guards) - strokes - ones) & guards) >> 7    # other >= strokes + 1
+            losses = (((strokes | guards) - others - ones) & guards) >> 7  # strokes >= other + 1
+            won += wins
+            lost += losses
+            lead += wins - losses
+
+            # A match closes the first time the lead exceeds the holes left
+            remaining = holes - 1 - hole
+            ahead = ((lead | guards) - (holes + remaining + 1) * ones) & guards
+            not_behind = ((lead | guards) - (holes - remaining) * ones) & guards
+            closes = (ahead | (guards ^ not_behind)) & still_open
+            still_open ^= closes
+            field_mask = closes - (closes >> 7)
+            closing_lead |= lead & field_mask
+            closing_remaining |= (remaining * ones) & field_mask
+
+        # Matches never closed finish all square
+        closing_lead |= (holes * ones) & (still_open - (still_open >> 7))
+
+        yield index, [
+            _result(w, holes - w - l, l, holes, final_lead - holes, final_remaining)
+            for w, l, final_lead, final_remaining in zip(
+                won.to_bytes(opponents, 'little'), lost.to_bytes(opponents, 'little'),
+                closing_lead.to_bytes(opponents, 'little'), closing_remaining.to_bytes(opponents, 'little')
+            )
+        ]
+
+def _result(won: int, halved: int, lost: int, holes: int, lead: int, remaining: int) -> Dict[str, Any]:
+    if lead == 0:
+        margin = 'AS'
+    elif remaining:
+        margin = f'{abs(lead)}&{remaining}'
+    else:
+        margin = f'{abs(lead)} up'
+    return {
+        'holes_won': won,
+        'holes_halved': halved,
+        'holes_lost': lost,
+        'hole_points': won + halved / 2,
+        'possible_points': holes,
+        'result': 'W' if lead > 0 else 'L' if lead < 0 else 'H',
+        'margin': margin
+    }
+
+def _flip(match: Dict[str, Any]) -> Dict[str, Any]:
+    """The same match from the other player's point of view"""
+    return {
+        'holes_won': match['holes_lost'],
+        'holes_halved': match['holes_halved'],
+        'holes_lost': match['holes_won'],
+        'hole_points': match['possible_points'] - match['hole_points'],
+        'possible_points': match['possible_points'],
+        'result': {'W': 'L', 'L': 'W', 'H': 'H'}[match['result']],
+        'margin': match['margin']
+    }
+
+MATCH_POINTS = {'W': 1, 'H': 0.5, 'L': 0}
+MATCH_COUNTS = {'W': 'won', 'H': 'halved', 'L': 'lost'}
+
+def _tally(matches: Dict[str, Dict[str, Dict[str, Any]]], player: str, opponent: str, result: Dict[str, Any], day: int):
+    outcome = result['result']
+    margin = f"Day {day}: {outcome} {result['margin']}"
+    total = matches[player].get(opponent)
+    if total is None:
+        matches[player][opponent] = {
+            'matches': 1,
+            'won': int(outcome == 'W'),
+            'halved': int(outcome == 'H'),
+            'lost': int(outcome == 'L'),
+            'points': MATCH_POINTS[outcome],
+            'holes_won': result['holes_won'],
+            'holes_halved': result['holes_halved'],
+            'holes_lost': result['holes_lost'],
+            'hole_points': result['hole_points'],
+            'possible_points': result['possible_points'],
+            'margins': [margin]
+        }
+        return
+    # The same two players met again in another round
+    total['matches'] += 1
+    total[MATCH_COUNTS[outcome]] += 1
+    total['points'] += MATCH_POINTS[outcome]
+    for key in ('holes_won', 'holes_halved', 'holes_lost', 'hole_points', 'possible_points'):
+        total[key] += result[key]
+    total['margins'].append(margin)
+
+def pairwise_results(hole_scores: Iterable[Mapping], players: Optional[List[str]] = None,
+                     formats: Optional[Sequence[str]] = MATCH_PLAY_FORMATS) -> Dict[str, Any]:
+    """Play every pairing in every matching round and summarize the N x N results.
+
+    'matrix' holds match points (win 1, halve 0.5) in the shape the
+    MatchPlayMatrix chart reads; 'matches' has the hole-level detail.
+    """
+    scorecards = round_scorecards(hole_scores, formats)
+    order = {player: index for index, player in enumerate(players or [])}
+
+    matches: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+    for (day, course), cards in sorted(scorecards.items()):
+        field = sorted(cards, key=lambda p: (order.get(p, len(order)), p))
+        for index, results in play_field([cards[player] for player in field]):
+            a = field[index]
+            for b, match in zip(field[index + 1:], results):
+                _tally(matches, a, b, match, day)
+                _tally(matches, b, a, _flip(match), day)
+
+    records = []
+    for player, opponents in matches.items():
+        played = sum(m['matches'] for m in opponents.values())
+        points = sum(m['points'] for m in opponents.values())
+        records.append({
+            'player': player,
+            'matches': played,
+            'won': sum(m['won'] for m in opponents.values()),
+            'halved': sum(m['halved'] for m in opponents.values()),
+            'lost': sum(m['lost'] for m in opponents.values()),
+            'points': points,
+            'win_percentage': round(points / played * 100, 1) if played else 0,
+            'hole_points': sum(m['hole_points'] for m in opponents.values()),
+            'possible_points': sum(m['possible_points'] for m in opponents.values())
+        })
+    records.sort(key=lambda r: (-r['points'], -r['hole_points']))
+
+    return {
+        'rounds': [{'day': day, 'course': course, 'players': len(cards)} for (day, course), cards in sorted(scorecards.items())],
+        'records': records,
+        'matrix': {player: {opponent: m['points'] for opponent, m in opponents.items()} for player, opponents in matches.items()},
+        'matches': {player: dict(opponents) for player, opponents in matches.items()}
+    }
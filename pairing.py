@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Balanced best ball pairings and team splits from historical hole-by-hole scoring
+"""
+
+import argparse
+import json
+import os
+from collections import deque
+from itertools import combinations
+from typing import Any, Dict, List, Sequence, Tuple
+
+from calculate_stats import SqliteSource, load_tournament_frame
+from course_data import COURSES_FILE, find_course, load_courses
+from simulate import ScoreModel, event_rounds
+
+SCALE = 100  # team strengths are balanced in hundredths of a stroke
+
+def expected_hole(model: ScoreModel, players: Sequence[str], par: int) -> float:
+    """Expected strokes relative to par of the best of `players`' balls on one hole
+
+    Holes are drawn independently, so P(best > v) is the product of each
+    player's P(score > v), and E[best] = lowest value + sum of P(best > v).
+    """
+    values, _ = model.distributions[(players[0], par)]
+    expected = values[0]
+    for position, value in enumerate(values[:-1]):
+        beaten = 1.0
+        for player in players:
+            beaten *= 1 - model.distributions[(player, par)][1][position]
+        expected += beaten * (values[position + 1] - value)
+    return expected
+
+def expected_score(model: ScoreModel, players: Sequence[str], pars: Sequence[int]) -> float:
+    """Expected round score of one player, or of a best ball side when given several"""
+    per_par = {par: expected_hole(model, players, par) for par in set(pars)}
+    return sum(pars) + sum(per_par[par] for par in pars)
+
+def pair_scores(model: ScoreModel, players: Sequence[str], pars: Sequence[int]) -> Dict[Tuple[str, str], float]:
+    """Expected best ball score of every possible pair"""
+    return {(a, b): expected_score(model, [a, b], pars) for a, b in combinations(players, 2)}
+
+def _augment(root: int, adjacency: List[int], match: List[int]) -> bool:
+    """Grow the matching by one along an augmenting path from the unpaired player root (Edmonds' blossom)
+
+    Breadth-first over alternating paths; an odd cycle (blossom) is
+    contracted onto its base so the search can continue through it.
+    Returns False when no augmenting path starts at root.
+    """
+    size = len(match)
+    parent = [-1] * size
+    base = list(range(size))
+    used = [False] * size
+    used[root] = True
+    queue = deque([root])
+
+    def common_base(a: int, b: int) -> int:
+        seen = [False] * size
+        while True:
+            a = base[a]
+            seen[a] = True
+            if match[a] == -1:
+                break
+            a = parent[match[a]]
+        while True:
+            b = base[b]
+            if seen[b]:
+                return b
+            b = parent[match[b]]
+
+    def mark_path(v: int, top: int, child: int, blossom: List[bool]):
+        while base[v] != top:
+            blossom[base[v]] = blossom[base[match[v]]] = True
+            parent[v] = child
+            child = match[v]
+            v = parent[match[v]]
+
+    while queue:
+        v = queue.popleft()
+        neighbours = adjacency[v]
+        while neighbours:
+            bit = neighbours & -neighbours
+            neighbours ^= bit
+            to = bit.bit_length() - 1
+            if base[v] == base[to] or match[v] == to:
+                continue
+            if to == root or (match[to] != -1 and parent[match[to]] != -1):
+                top = common_base(v, to)
+                blossom = [False] * size
+                mark_path(v, top, to, blossom)
+                mark_path(to, top, v, blossom)
+                for player in range(size):
+                    if blossom[base[player]]:
+                        base[player] = top
+                        if not used[player]:
+                            used[player] = True
+                            queue.append(player)
+            elif parent[to] == -1:
+                parent[to] = v
+                if match[to] == -1:
+                    # Flip the path back to root
+                    while to != -1:
+                        previous = parent[to]
+                        following = match[previous]
+                        match[to], match[previous] = previous, to
+                        to = following
+                    return True
+                used[match[to]] = True
+                queue.append(match[to])
+    return False
+
+def balanced_pairs(players: Sequence[str], scores: Dict[Tuple[str, str], float]) -> Dict[str, Any]:
+    """Pairings whose expected best ball scores span the narrowest range
+
+    Candidate pairs are sorted by expected score and a window slides over
+    them (two pointers): for each lowest allowed score the window grows
+    until every player can be paired inside it. The narrowest such window
+    is optimal. A maximum matching of the allowed pairs is kept up to date
+    as pairs enter and leave the window, so each step costs one augmenting
+    path search per unpaired player instead of enumerating (n-1)!!
+    partitions.
+    """
+    if len(players) % 2:
+        raise ValueError(f"best ball pairings need an even number of players, got {len(players)}")
+    index = {player: position for position, player in enumerate(players)}
+    ranked = sorted((score, index[a], index[b]) for (a, b), score in scores.items())
+    adjacency = [0] * len(players)
+    match = [-1] * len(players)
+
+    def allow(position: int):
+        """Toggle one pair in or out of the window and restore a maximum matching"""
+        _, a, b = ranked[position]
+        adjacency[a] ^= 1 << b
+        adjacency[b] ^= 1 << a
+        if match[a] == b:
+            match[a] = match[b] = -1
+        # A player with no augmenting path never gains one from other augmentations
+        for player in range(len(players)):
+            if match[player] == -1:
+                _augment(player, adjacency, match)
+
+    best, best_spread = None, None
+    end = 0  # window is ranked[start:end]
+    for start in range(len(ranked)):
+        while -1 in match and end < len(ranked):
+            allow(end)
+            end += 1
+        if -1 in match:
+            break
+        spread = ranked[end - 1][0] - ranked[start][0]
+        if best_spread is None or spread < best_spread:
+            best = [(a, b) for a, b in enumerate(match) if a < b]
+            best_spread = spread
+        allow(start)
+
+    teams = []
+    for a, b in best or []:
+        pair = tuple(sorted((players[a], players[b]), key=index.get))
+        teams.append({'team': '/'.join(pair), 'players': list(pair), 'expected_score': round(scores[pair], 2)})
+    teams.sort(key=lambda team: team['expected_score'])
+    return {'teams': teams, 'spread': round(best_spread or 0.0, 2)}
+
+def balanced_split(strengths: Dict[str, float]) -> Dict[str, Any]:
+    """Two equal-sized sides whose summed expected scores are as close as possible
+
+    Subset-sum dynamic programming with the reachable totals for each side
+    size held as bits of one integer, so adding a player is a single shift
+    and or per size. The states after each player are kept to walk back
+    to the players of the best side. Strengths are balanced in hundredths
+    of a stroke, so the split is optimal up to about n x 0.005 strokes of
+    rounding; the reported difference is that of the real strengths.
+    """
+    players = list(strengths)
+    if len(players) % 2:
+        raise ValueError(f"an even split needs an even number of players, got {len(players)}")
+    weights = [round(strengths[player] * SCALE) for player in players]
+    size = len(players) // 2
+    reachable = [1] + [0] * size  # reachable[k] bit s: some k players total s
+    history = []
+    for weight in weights:
+        history.append(reachable)
+        reachable = [reachable[0]] + [reachable[k] | (reachable[k - 1] << weight) for k in range(1, size + 1)]
+
+    total = sum(weights)
+    # The other side holds the rest, so the closest total at or below half is optimal
+    target = reachable[size] & ((1 << (total // 2 + 1)) - 1)
+    side_total = target.bit_length() - 1
+
+    side, remaining, count = [], side_total, size
+    for position in range(len(players) - 1, -1, -1):
+        if (history[position][count] >> remaining) & 1:
+            continue  # reachable without this player
+        side.append(players[position])
+        remaining -= weights[position]
+        count -= 1
+
+    sides = [[p for p in players if p in side], [p for p in players if p not in side]]
+    totals = [sum(strengths[p] for p in members) for members in sides]
+    return {
+        'sides': [
+            {'players': members, 'expected_total': round(side_strength, 2)}
+            for members, side_strength in zip(sides, totals)
+        ],
+        'difference': round(abs(totals[0] - totals[1]), 2)
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data-dir', default='.', help='directory holding the cleaned CSV files (incl. hole_scores.csv)')
+    parser.add_argument('--db', help='read the tables from this SQLite database instead (requires --event)')
+    parser.add_argument('--event', help='database event to draw from')
+    parser.add_argument('--format', choices=['best-ball', 'split'], default='best-ball',
+                        help='best ball pairs, or two sides for scramble and team totals')
+    parser.add_argument('--players', nargs='+', help='players to draw (default: everyone in the event)')
+    parser.add_argument('--course', help='course the round is played on (default: the event\'s best ball course)')
+    parser.add_argument('--courses', default=COURSES_FILE, help='course ratings and scorecards')
+    parser.add_argument('--output', default='pairings.json', help='where to write the draw')
+    args = parser.parse_args()
+
+    if args.db and not args.event:
+        parser.error("--db requires --event")
+    frame = load_tournament_frame(SqliteSource(args.db, args.event) if args.db else args.data_dir)
+    if not len(frame.hole_scores):
+        parser.error("no hole-by-hole scores found; rerun clean_data.py to create hole_scores.csv")
+
+    players = args.players or frame.players
+    # Players without history are modelled on the field
+    model = ScoreModel(frame.hole_scores, players)
+    if args.course:
+        course = find_course(load_courses(args.courses), args.course)
+        if course is None:
+            parser.error(f"no course data for {args.course!r}")
+        pars = [hole.par for hole in course.holes]
+    else:
+        rounds = event_rounds(frame)
+        pars = next((r['pars'] for r in rounds if r['format'] == 'Best Ball'), rounds[0]['pars'])
+
+    try:
+        if args.format == 'best-ball':
+            draw = balanced_pairs(players, pair_scores(model, players, pars))
+        else:
+            draw = balanced_split({player: expected_score(model, [player], pars) for player in players})
+    except ValueError as error:
+        parser.error(str(error))
+
+    with open(args.output, 'w') as file:
+        json.dump({'format': args.format, 'players': list(players), **draw}, file, indent=2)
+    print(f"Draw saved to {os.path.normpath(args.output)}")
+    if args.format == 'best-ball':
+        for team in draw['teams']:
+            print(f"  {team['team']}: expected {team['expected_score']}")
+        print(f"  spread {draw['spread']} strokes")
+    else:
+        for side in draw['sides']:
+            print(f"  {', '.join(side['players'])}: expected {side['expected_total']}")
+        print(f"  difference {draw['difference']} strokes")
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Order-statistic leaderboard index: O(log n) updates, ranks, percentiles and range queries over score buckets
+"""
+
+import math
+from bisect import bisect_left, insort
+from fractions import Fraction
+from itertools import groupby
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+MAX_SCALE = 100   # finest bucket bucket_scale() will pick: hundredths of a point
+
+class FenwickTree:
+    """Prefix sums over a row of counters, with O(log n) point updates and k-th element search"""
+
+    def __init__(self, counts: List[int]):
+        self.size = len(counts)
+        self.tree = [0] + counts
+        for index in range(1, self.size + 1):
+            parent = index + (index & -index)
+            if parent <= self.size:
+                self.tree[parent] += self.tree[index]
+
+    def add(self, position: int, delta: int):
+        index = position + 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefix(self, position: int) -> int:
+        """Sum of the counters before position"""
+        total = 0
+        index = position
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+    def search(self, k: int) -> int:
+        """Position holding the k-th counted element (1-based k)"""
+        position = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            if position + step <= self.size and self.tree[position + step] < k:
+                position += step
+                k -= self.tree[position]
+            step >>= 1
+        return position
+
+class RankIndex:
+    """A leaderboard kept ranked as scores change: gross, net, Stableford or match play points.
+
+    Scores are bucketed (score x scale, so half points get their own
+    bucket) with the best bucket first, and a Fenwick tree counts the
+    entries per bucket; the occupied buckets are also kept in order.
+    Inserting, moving or removing an entry, a golf rank (ties share the
+    best position), a percentile and "how many within N of the lead" are
+    all O(log n); listing a range or the whole board costs its length. Ties
+    are listed by tiebreak, which defaults to insertion order, as a stable
+    sort would leave them. The bucket range grows as needed.
+    """
+
+    def __init__(self, lower_is_better: bool = True, scale: int = 1):
+        self.sign = 1 if lower_is_better else -1
+        self.scale = scale
+        self.low = 0   # bucket of the first counter
+        self.tree = FenwickTree([0])
+        self.buckets: Dict[int, List[Hashable]] = {}  # keys in tiebreak order
+        self.occupied: List[int] = []  # buckets holding anyone, best first
+        self.entries: Dict[Hashable, Tuple[Any, int, Any]] = {}  # key -> (score, bucket, tiebreak)
+        self.sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def _bucket(self, score: Any) -> int:
+        scaled = score * self.scale * self.sign
+        if not math.isfinite(scaled):
+            raise ValueError(f"score {score} is not a finite number")
+        bucket = round(scaled)
+        if abs(bucket - scaled) > 1e-9:
+            raise ValueError(f"score {score} is not a multiple of 1/{self.scale}")
+        return bucket
+
+    def _grow(self, bucket: int):
+        """Re-lay the counters over a range that covers bucket, doubled towards it so growth is amortized"""
+        if not self.buckets:
+            low, high = bucket, bucket + 1
+        else:
+            low, high = min(self.low, bucket), max(self.low + self.tree.size, bucket + 1)
+            if bucket < self.low:
+                low -= high - low
+            else:
+                high += high - low
+        counts = [0] * (high - low)
+        for existing, members in self.buckets.items():
+            counts[existing - low] = len(members)
+        self.low = low
+        self.tree = FenwickTree(counts)
+
+    def _position(self, bucket: int) -> int:
+        if not self.low <= bucket < self.low + self.tree.size:
+            self._grow(bucket)
+        return bucket - self.low
+
+    def insert(self, key: Hashable, score: Any, tiebreak: Any = None):
+        """Add key with score, or move it there if already ranked"""
+        if key in self.entries:
+            self.remove(key)
+        if tiebreak is None:
+            tiebreak = self.sequence
+        self.sequence += 1
+        bucket = self._bucket(score)
+        position = self._position(bucket)  # growing replaces the tree, so resolve the position first
+        self.tree.add(position, 1)
+        members = self.buckets.get(bucket)
+        if members is None:
+            members = self.buckets[bucket] = []
+            insort(self.occupied, bucket)
+        if members and tiebreak < self.entries[members[-1]][2]:
+            members.insert(self._tiebreak_position(members, tiebreak, after=True), key)
+        else:
+            members.append(key)  # the usual case: default tiebreaks only grow
+        self.entries[key] = (score, bucket, tiebreak)
+
+    update = insert
+
+    def remove(self, key: Hashable):
+        _, bucket, tiebreak = self.entries[key]
+        members = self.buckets[bucket]
+        position = self._tiebreak_position(members, tiebreak)
+        while members[position] != key:  # past anyone sharing the tiebreak
+            position += 1
+        del members[position]
+        del self.entries[key]
+        if not members:
+            del self.buckets[bucket]
+            del self.occupied[bisect_left(self.occupied, bucket)]
+        self.tree.add(bucket - self.low, -1)
+
+    def _tiebreak_position(self, members: List[Hashable], tiebreak: Any, after: bool = False) -> int:
+        """Binary search of a bucket by tiebreak: before (or after) the members sharing it"""
+        low, high = 0, len(members)
+        while low < high:
+            middle = (low + high) // 2
+            other = self.entries[members[middle]][2]
+            if other < tiebreak or (after and other == tiebreak):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def score(self, key: Hashable) -> Any:
+        return self.entries[key][0]
+
+    def _better_than(self, bucket: int) -> int:
+        position = bucket - self.low
+        if position <= 0:
+            return 0
+        return self.tree.prefix(min(position, self.tree.size))
+
+    def rank_of(self, score: Any) -> int:
+        """Golf rank a score holds (or would hold): one plus everyone strictly better"""
+        return self._better_than(self._bucket(score)) + 1
+
+    def rank(self, key: Hashable) -> int:
+        return self._better_than(self.entries[key][1]) + 1
+
+    def percentile(self, key: Hashable) -> float:
+        """Share of the rest of the field this entry beats outright, 0-100"""
+        if len(self.entries) < 2:
+            return 100.0
+        bucket = self.entries[key][1]
+        behind = len(self.entries) - self._better_than(bucket + 1)
+        return round(behind / (len(self.entries) - 1) * 100, 1)
+
+    def leader(self) -> Optional[Any]:
+        """The best score, or None for an empty board"""
+        if not self.entries:
+            return None
+        bucket = self.tree.search(1) + self.low
+        return self.entries[self.buckets[bucket][0]][0]
+
+    def between(self, first: Any = None, last: Any = None) -> List[Tuple[Hashable, Any]]:
+        """(key, score) of every entry scoring from first to last inclusive, best first
+
+        The bounds may come in either order; without first the range starts at
+        the lead, without last it runs through last place.
+        """
+        if first is not None and last is not None:
+            first, last = sorted((first, last), key=self._bucket)
+        count = self._better_than(self._bucket(first)) if first is not None else 0
+        end = self._better_than(self._bucket(last) + 1) if last is not None else len(self.entries)
+        # Walk only occupied buckets, found by rank: each step skips past a whole bucket
+        found = []
+        while count < end:
+            bucket = self.tree.search(count + 1) + self.low
+            members = self.buckets[bucket]
+            found.extend((key, self.entries[key][0]) for key in members)
+            count += len(members)
+        return found
+
+    def within(self, margin: Any) -> List[Tuple[Hashable, Any]]:
+        """Everyone within margin of the lead, e.g. 3 strokes back or 2 points behind
+
+        The margin is snapped down to whole buckets (0.5 strokes means level
+        with the leader); it must be finite and not negative.
+        """
+        if not math.isfinite(margin) or margin < 0:
+            raise ValueError(f"margin {margin} must be a finite number, at least 0")
+        lead = self.leader()
+        if lead is None:
+            return []
+        return self.between(lead, lead + self.sign * Fraction(math.floor(margin * self.scale), self.scale))
+
+    def __iter__(self) -> Iterator[Tuple[Hashable, Any]]:
+        """(key, score) best first"""
+        for bucket in self.occupied:
+            for key in self.buckets[bucket]:
+                yield key, self.entries[key][0]
+
+    def ranked(self) -> Iterator[Tuple[int, Hashable, Any, float]]:
+        """(rank, key, score, percentile) best first, without re-sorting the entries or a tree query per entry"""
+        position = 0
+        others = len(self.entries) - 1
+        for bucket in self.occupied:
+            members = self.buckets[bucket]
+            behind = others + 1 - position - len(members)
+            percentile = round(behind / others * 100, 1) if others else 100.0
+            for key in members:
+                yield position + 1, key, self.entries[key][0], percentile
+            position += len(members)
+
+def rank_entries(entries: Iterable[Any], key: Callable[[Any], Any],
+                 lower_is_better: bool = True) -> Iterator[Tuple[int, Any, float]]:
+    """(rank, entry, percentile) best first for a fixed set of entries scored by key, as RankIndex.ranked ranks them
+
+    One stable sort, so ties share the best rank and keep their order. For
+    leaderboards built once; a RankIndex only pays off while scores change.
+    """
+    ordered = sorted(entries, key=key, reverse=not lower_is_better)
+    place = 0
+    others = len(ordered) - 1
+    for _, group in groupby(ordered, key=key):
+        tied = list(group)
+        behind = others + 1 - place - len(tied)
+        percentile = round(behind / others * 100, 1) if others else 100.0
+        for entry in tied:
+            yield place + 1, entry, percentile
+        place += len(tied)
+
+def bucket_scale(scores: Iterable[Any]) -> int:
+    """Smallest buckets-per-point that gives every score its own whole bucket (2 for half points)"""
+    scale = 1
+    for score in scores:
+        fraction = Fraction(score).limit_denominator(MAX_SCALE)
+        if abs(fraction - score) > 1e-9:
+            raise ValueError(f"score {score} is finer than 1/{MAX_SCALE}")
+        scale = math.lcm(scale, fraction.denominator)
+    return scale
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Handicap-aware net and Stableford scoring from hole-by-hole scores
+"""
+
+import argparse
+import csv
+import math
+import os
+from collections import defaultdict
+from functools import lru_cache
+from itertools import repeat
+from operator import add, sub
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from course_data import COURSES_FILE, Course, find_course, load_courses
+
+HOLES_PER_ROUND = 18
+STABLEFORD_PAR_POINTS = 2  # net par scores 2, each stroke better +1, each worse -1, never below 0
+
+def course_handicap(handicap_index: float, course: Course) -> int:
+    """WHS course handicap: index x slope / 113 + (course rating - par), with halves rounded up"""
+    # round() would send halves to the even neighbour (10.5 -> 10); WHS rounds them up
+    return math.floor(handicap_index * course.slope / 113 + (course.rating - course.par) + 0.5)
+
+@lru_cache(maxsize=None)
+def strokes_by_index(handicap: int, holes: int = HOLES_PER_ROUND) -> Tuple[int, ...]:
+    """Strokes received on the holes with stroke index 1..holes for a course handicap
+
+    Every hole gets handicap // holes strokes, and the remainder goes to the
+    hardest holes. A plus handicap gives strokes back, easiest holes first.
+    """
+    if handicap < 0:
+        return tuple(-strokes for strokes in reversed(strokes_by_index(-handicap, holes)))
+    base, extra = divmod(handicap, holes)
+    return tuple(base + (index <= extra) for index in range(1, holes + 1))
+
+class ScoringEngine:
+    """Net scores and Stableford points for whole fields of rounds at once.
+
+    Hole pars and stroke indexes come from courses.md; each player's course
+    handicap is looked up per round (so history can be re-scored after a
+    revision simply by scoring again with the new handicaps). Per-course,
+    per-handicap stroke allocations are computed once and reused, and each
+    round is scored with element-wise map() over its 18 holes.
+    """
+
+    def __init__(self, courses: Dict[str, Course], handicaps: Optional[Mapping[Any, int]] = None):
+        self.courses = courses
+        self.handicaps = handicaps or {}
+        self._allocations: Dict[Tuple[str, int], Tuple[int, ...]] = {}
+
+    def handicap_for(self, player: str, day: Any) -> int:
+        """Course handicap for a round: a (player, day) entry wins over a player-wide one; default scratch"""
+        return int(self.handicaps.get((player, day), self.handicaps.get(player, 0)))
+
+    def strokes_received(self, course: Course, handicap: int) -> Tuple[int, ...]:
+        """Handicap strokes per hole in hole order"""
+        key = (course.name, handicap)
+        allocation = self._allocations.get(key)
+        if allocation is None:
+            by_index = strokes_by_index(handicap, len(course.holes))
+            allocation = self._allocations[key] = tuple(by_index[hole.stroke_index - 1] for hole in course.holes)
+        return allocation
+
+    def score_card(self, gross: Sequence[int], course: Course, handicap: int) -> Dict[str, Any]:
+        """Net strokes and Stableford points for one 18-hole card"""
+        received = self.strokes_received(course, handicap)
+        pars = [hole.par for hole in course.holes]
+        net = list(map(sub, gross, received))
+        # points = max(0, 2 + par - net)
+        points = list(map(max, repeat(0), map(sub, map(add, pars, repeat(STABLEFORD_PAR_POINTS)), net)))
+        return {
+            'course_handicap': handicap,
+            'gross_score': sum(gross),
+            'net_score': sum(net),
+            'net_relative_to_par': sum(net) - sum(pars),
+            'stableford_points': sum(points),
+            'net_holes': net,
+            'hole_points': points
+        }
+
+    def score_rounds(self, hole_scores: Iterable[Mapping]) -> List[Dict[str, Any]]:
+        """Score every complete round in hole_scores rows (player, day, course, format, hole, strokes)"""
+        cards: Dict[Tuple, Dict[int, int]] = defaultdict(dict)
+        for row in hole_scores:
+            cards[(row['player'], row['day'], row['course'], row['format'])][row['hole']] = row['strokes']
+
+        scored = []
+        for (player, day, course_name, round_format), holes in cards.items():
+            course = find_course(self.courses, course_name)
+            if course is None or len(holes) != len(course.holes):
+                continue
+            gross = [holes[hole.number] for hole in course.holes]
+            result = self.score_card(gross, course, self.handicap_for(player, day))
+            scored.append({
+                'player': player,
+                'day': day,
+                'course': course_name,
+                'format': round_format,
+                **{key: value for key, value in result.items() if key not in ('net_holes', 'hole_points')}
+            })
+        return scored
+
+def load_handicaps(filename: str, courses: Dict[str, Course], hole_scores: Iterable[Mapping] = ()) -> Dict[Any, int]:
+    """Read course handicaps from CSV: player plus course_handicap, or handicap_index (converted per round's course)
+
+    An optional day column gives a handicap for that round only.
+    """
+    # Player -> day -> course, so each row only visits its own player's rounds
+    rounds = defaultdict(dict)
+    for row in hole_scores:
+        rounds[row['player']][row['day']] = row['course']
+    handicaps = {}
+    with open(filename, 'r', newline='') as file:
+        for row in csv.DictReader(file):
+            player = row['player'].strip()
+            day = int(row['day']) if row.get('day') else None
+            if row.get('course_handicap'):
+                value = int(row['course_handicap'])
+                handicaps[(player, day) if day is not None else player] = value
+                continue
+            index = float(row['handicap_index'])
+            # A handicap index becomes a course handicap per round, from that course's slope and rating
+            for round_day, course_name in rounds.get(player, {}).items():
+                course = find_course(courses, course_name)
+                if course is not None and day in (None, round_day):
+                    handicaps[(player, round_day)] = course_handicap(index, course)
+    return handicaps
+
+def save_net_scores(rounds: List[Dict[str, Any]], filename: str):
+    """Write one row per scored round"""
+    fieldnames = ['player', 'day', 'course', 'format', 'course_handicap', 'gross_score',
+                  'net_score', 'net_relative_to_par', 'stableford_points']
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rounds)
+    print(f"Created {filename} with {len(rounds)} rows")
+
+if __name__ == "__main__":
+    # calculate_stats imports this module (through handicap), so its typed CSV loader is only imported to run
+    from calculate_stats import load_optional_csv
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data-dir', default='.', help='directory holding hole_scores.csv')
+    parser.add_argument('--courses', default=COURSES_FILE, help='course ratings and scorecards')
+    parser.add_argument('--handicaps', metavar='CSV',
+                        help='player,course_handicap or player,handicap_index (optional day column); default scratch')
+    parser.add_argument('--output', help='where to write the scored rounds (default <data-dir>/net_scores.csv)')
+    args = parser.parse_args()
+
+    courses = load_courses(args.courses)
+    hole_scores = load_optional_csv(os.path.join(args.data_dir, 'hole_scores.csv'))
+    if hole_scores is None:
+        parser.error("no hole-by-hole scores found; rerun clean_data.py to create hole_scores.csv")
+    handicaps = load_handicaps(args.handicaps, courses, hole_scores) if args.handicaps else {}
+    rounds = ScoringEngine(courses, handicaps).score_rounds(hole_scores)
+    save_net_scores(rounds, args.output or os.path.normpath(os.path.join(args.data_dir, 'net_scores.csv')))
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo tournament simulator: win probabilities, expected finishes and team odds
+"""
+
+import argparse
+import json
+import os
+import random
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, combinations
+from operator import add, gt, lt, sub
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from calculate_stats import TEAM_FORMATS, SqliteSource, load_tournament_frame
+from match_play import MATCH_PLAY_FORMATS
+
+PRIOR_WEIGHT = 6        # pseudo-holes of the field's distribution mixed into each player's
+CHUNK_SIMULATIONS = 1000  # simulations per task; fixed so results do not depend on the worker count
+STABLEFORD_PAR_POINTS = 2
+
+# Stableford points by strokes relative to par: birdie 3, par 2, bogey 1, worse 0
+STABLEFORD_POINTS = {relative: max(0, STABLEFORD_PAR_POINTS - relative) for relative in range(-5, 50)}
+
+class ScoreModel:
+    """Per-player distributions of strokes relative to par, by hole par.
+
+    Each player's observed holes on par 3s, 4s and 5s are smoothed toward
+    the whole field's distribution for that par (PRIOR_WEIGHT pseudo-holes),
+    so a handful of holes never gives zero probability to a bogey or birdie.
+    """
+
+    def __init__(self, hole_scores: Iterable[Mapping], players: Sequence[str]):
+        field = defaultdict(Counter)
+        own = defaultdict(Counter)
+        for row in hole_scores:
+            relative = row['strokes'] - row['par']
+            field[row['par']][relative] += 1
+            own[(row['player'], row['par'])][relative] += 1
+
+        self.players = list(players)
+        self.distributions: Dict[Tuple[str, int], Tuple[List[int], List[float]]] = {}
+        for par, field_counts in field.items():
+            field_total = sum(field_counts.values())
+            values = sorted(field_counts)
+            for player in self.players:
+                counts = own[(player, par)]
+                total = sum(counts.values())
+                weights = [
+                    (counts[value] + PRIOR_WEIGHT * field_counts[value] / field_total) / (total + PRIOR_WEIGHT)
+                    for value in values
+                ]
+                self.distributions[(player, par)] = (values, list(accumulate(weights)))
+
+    def draw(self, rng: random.Random, player: str, par: int, count: int) -> List[int]:
+        """count independent hole results (strokes relative to par) in one call"""
+        values, cum_weights = self.distributions[(player, par)]
+        return rng.choices(values, cum_weights=cum_weights, k=count)
+
+def event_rounds(frame) -> List[Dict[str, Any]]:
+    """Individual rounds of the event in day order: day, course, format and hole pars"""
+    pars = defaultdict(dict)
+    formats = {}
+    for row in frame.hole_scores:
+        pars[row['day']][row['hole']] = row['par']
+        formats[row['day']] = (row['format'], row['course'])
+    return [
+        {'day': day, 'format': formats[day][0], 'course': formats[day][1],
+         'pars': [pars[day][hole] for hole in sorted(pars[day])]}
+        for day in sorted(pars) if formats[day][0] not in TEAM_FORMATS
+    ]
+
+def best_ball_teams(frame) -> List[List[str]]:
+    """Pairs that played as best ball teams ('Jimbo/Dave' rows)"""
+    teams = []
+    for row in frame.individual_scores:
+        if row['format'] != 'Best Ball Team':
+            continue
+        members = [name.strip() for name in row['player'].split('/')]
+        if all(member in frame.players for member in members) and members not in teams:
+            teams.append(members)
+    return teams
+
+def simulate_chunk(model: ScoreModel, rounds: List[Dict[str, Any]], teams: Dict[str, List[str]],
+                   simulations: int, seed: str) -> Dict[str, Any]:
+    """Play `simulations` tournaments and return summed tallies (merged by the caller)"""
+    rng = random.Random(seed)
+    players = model.players
+    tally = new_tally(players, teams)
+    stroke_totals = {player: [0] * simulations for player in players}
+    stableford_totals = {player: [0] * simulations for player in players}
+    match_points = {player: [0] * simulations for player in players}
+    best_ball_totals = defaultdict(lambda: [0] * simulations)
+
+    for current_round in rounds:
+        pars = current_round['pars']
+        # columns[player][hole] = that hole's result in every simulation
+        columns = {
+            player: [model.draw(rng, player, par, simulations) for par in pars]
+            for player in players
+        }
+        par_total = sum(pars)
+        for player in players:
+            relative = [sum(card) for card in zip(*columns[player])]
+            stroke_totals[player] = list(map(add, stroke_totals[player], (par_total + r for r in relative)))
+
+        if current_round['format'] == 'Stableford':
+            for player in players:
+                points = [sum(map(STABLEFORD_POINTS.__getitem__, card)) for card in zip(*columns[player])]
+                stableford_totals[player] = list(map(add, stableford_totals[player], points))
+
+        elif current_round['format'] in MATCH_PLAY_FORMATS:
+            for a, b in combinations(players, 2):
+                lead = [0] * simulations
+                for col_a, col_b in zip(columns[a], columns[b]):
+                    lead = list(map(add, lead, map(sub, map(lt, col_a, col_b), map(gt, col_a, col_b))))
+                a_points = [1 if l > 0 else 0.5 if l == 0 else 0 for l in lead]
+                match_points[a] = list(map(add, match_points[a], a_points))
+                match_points[b] = list(map(add, match_points[b], (1 - p for p in a_points)))
+                tally['match_play']['pairwise'][a][b] += sum(a_points)
+                tally['match_play']['pairwise'][b][a] += simulations - sum(a_points)
+
+        elif current_round['format'] == 'Best Ball':
+            for team, members in teams.items():
+                best = [list(map(min, *(columns[m][hole] for m in members))) for hole in range(len(pars))]
+                totals = [par_total + sum(card) for card in zip(*best)]
+                best_ball_totals[team] = list(map(add, best_ball_totals[team], totals))
+
+    _rank(tally['stroke_play'], stroke_totals, lower_wins=True)
+    if any(r['format'] == 'Stableford' for r in rounds):
+        _rank(tally['stableford'], stableford_totals, lower_wins=False)
+    if any(r['format'] in MATCH_PLAY_FORMATS for r in rounds):
+        _rank(tally['match_play'], match_points, lower_wins=False)
+    if best_ball_totals:
+        _rank(tally['best_ball'], dict(best_ball_totals), lower_wins=True)
+    if teams:
+        team_totals = {team: list(map(sum, zip(*(stroke_totals[m] for m in members)))) for team, members in teams.items()}
+        _rank(tally['teams'], team_totals, lower_wins=True)
+    tally['simulations'] = simulations
+    return tally
+
+def new_tally(players: Sequence[str], teams: Mapping[str, Sequence[str]]) -> Dict[str, Any]:
+    def competition(entries):
+        return {'wins': {e: 0.0 for e in entries}, 'position_sum': {e: 0 for e in entries}, 'score_sum': {e: 0 for e in entries}}
+    tally = {
+        'simulations': 0,
+        'stroke_play': competition(players),
+        'stableford': competition(players),
+        'match_play': competition(players),
+        'best_ball': competition(teams),
+        'teams': competition(teams)
+    }
+    tally['match_play']['pairwise'] = {a: {b: 0.0 for b in players if b != a} for a in players}
+    return tally
+
+def _rank(competition: Dict[str, Any], totals: Dict[str, List[float]], lower_wins: bool):
+    """Add win shares (ties split), finishing positions and scores for every simulation"""
+    entries = list(totals)
+    for scores in zip(*(totals[e] for e in entries)):
+        best = min(scores) if lower_wins else max(scores)
+        winners = scores.count(best)
+        ordered = sorted(scores)
+        for entry, score in zip(entries, scores):
+            if score == best:
+                competition['wins'][entry] += 1 / winners
+            # Tied entries share the better position
+            better = bisect_left(ordered, score) if lower_wins else len(ordered) - bisect_right(ordered, score)
+            competition['position_sum'][entry] += 1 + better
+            competition['score_sum'][entry] += score
+
+def merge_tallies(total: Dict[str, Any], part: Dict[str, Any]):
+    total['simulations'] += part['simulations']
+    for name in ('stroke_play', 'stableford', 'match_play', 'best_ball', 'teams'):
+        for key in ('wins', 'position_sum', 'score_sum'):
+            for entry, value in part[name][key].items():
+                total[name][key][entry] += value
+    for a, opponents in part['match_play']['pairwise'].items():
+        for b, value in opponents.items():
+            total['match_play']['pairwise'][a][b] += value
+
+def summarize(tally: Dict[str, Any], rounds: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Probabilities and expectations from merged tallies"""
+    n = tally['simulations']
+
+    def table(competition, score_name):
+        rows = [{
+            'entry': entry,
+            'win_probability': round(competition['wins'][entry] / n, 4),
+            'expected_position': round(competition['position_sum'][entry] / n, 2),
+            score_name: round(competition['score_sum'][entry] / n, 2)
+        } for entry in competition['wins']]
+        return sorted(rows, key=lambda row: (-row['win_probability'], row['expected_position']))
+
+    formats = {r['format'] for r in rounds}
+    results = {
+        'simulations': n,
+        'rounds': [{'day': r['day'], 'course': r['course'], 'format': r['format']} for r in rounds],
+        'stroke_play': table(tally['stroke_play'], 'expected_total')
+    }
+    if 'Stableford' in formats:
+        results['stableford'] = table(tally['stableford'], 'expected_points')
+    if formats & set(MATCH_PLAY_FORMATS):
+        results['match_play'] = table(tally['match_play'], 'expected_match_points')
+        results['match_play_head_to_head'] = {
+            a: {b: round(value / n, 4) for b, value in opponents.items()}
+            for a, opponents in tally['match_play']['pairwise'].items()
+        }
+    if 'Best Ball' in formats and tally['best_ball']['wins']:
+        results['best_ball'] = table(tally['best_ball'], 'expected_score')
+    if tally['teams']['wins']:
+        results['teams'] = table(tally['teams'], 'expected_total')
+    return results
+
+def run_simulations(model: ScoreModel, rounds: List[Dict[str, Any]], teams: Dict[str, List[str]],
+                    simulations: int, seed: int = 0, workers: int = 1) -> Dict[str, Any]:
+    """Split the simulations into fixed-size, individually seeded chunks and merge their tallies"""
+    if simulations < 1:
+        raise ValueError(f"need at least one simulation, got {simulations}")
+    chunks = [(min(CHUNK_SIMULATIONS, simulations - start), f'{seed}:{index}')
+              for index, start in enumerate(range(0, simulations, CHUNK_SIMULATIONS))]
+    total = new_tally(model.players, teams)
+    if workers == 1:
+        parts = (simulate_chunk(model, rounds, teams, size, chunk_seed) for size, chunk_seed in chunks)
+        for part in parts:
+            merge_tallies(total, part)
+    else:
+        with ProcessPoolExecutor(max_workers=workers or None) as executor:
+            futures = [executor.submit(simulate_chunk, model, rounds, teams, size, chunk_seed) for size, chunk_seed in chunks]
+            for future in futures:
+                merge_tallies(total, future.result())
+    return summarize(total, rounds)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data-dir', default='.', help='directory holding the cleaned CSV files (incl. hole_scores.csv)')
+    parser.add_argument('--db', help='read the tables from this SQLite database instead (requires --event)')
+    parser.add_argument('--event', help='database event to simulate')
+    parser.add_argument('--simulations', type=int, default=10000, help='number of simulated tournaments')
+    parser.add_argument('--seed', type=int, default=0, help='random seed; the same seed gives the same results')
+    parser.add_argument('--workers', type=int, default=1, help='worker processes (0 = one per CPU)')
+    parser.add_argument('--teams', metavar='JSON', help='{"team": ["player", ...]} (default: the best ball pairs)')
+    parser.add_argument('--output', default='simulation.json', help='where to write the results')
+    args = parser.parse_args()
+
+    if args.db and not args.event:
+        parser.error("--db requires --event")
+    if args.simulations < 1:
+        parser.error(f"--simulations must be at least 1, got {args.simulations}")
+    frame = load_tournament_frame(SqliteSource(args.db, args.event) if args.db else args.data_dir)
+    if not len(frame.hole_scores):
+        parser.error("no hole-by-hole scores found; rerun clean_data.py to create hole_scores.csv")
+
+    if args.teams:
+        with open(args.teams, 'r') as file:
+            teams = json.load(file)
+    else:
+        teams = {'/'.join(members): members for members in best_ball_teams(frame)}
+
+    rounds = event_rounds(frame)
+    model = ScoreModel(frame.hole_scores, frame.players)
+    print(f"Simulating {args.simulations} tournaments ({len(rounds)} rounds, {len(frame.players)} players)...")
+    results = run_simulations(model, rounds, teams, args.simulations, args.seed, args.workers)
+
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f"Simulation results saved to {os.path.normpath(args.output)}")
+    for row in results['stroke_play'][:3]:
+        print(f"  {row['entry']}: {row['win_probability']:.1%} to win, expected finish {row['expected_position']}")
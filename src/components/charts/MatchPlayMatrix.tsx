@@ -1,5 +1,5 @@
 import React, { useState } from 'react'
-import { getMatchPlayMatrix, getPlayerList } from '../../utils/data'
+import { getMatchPlayMatrix, getPairwiseMatch, getPlayerList } from '../../utils/data'
 import { Trophy, Target, Zap } from 'lucide-react'
 
 interface MatchPlayMatrixProps {
@@ -12,6 +12,7 @@ const MatchPlayMatrix: React.FC<MatchPlayMatrixProps> = ({
   const matrix = getMatchPlayMatrix()
   const players = getPlayerList()
   const [hoveredCell, setHoveredCell] = useState<{player1: string, player2: string} | null>(null)
+  const hoveredMatch = hoveredCell ? getPairwiseMatch(hoveredCell.player1, hoveredCell.player2) : null
 
   // Calculate totals for each player
   const playerTotals = React.useMemo(() => {
@@ -184,9 +185,15 @@ const MatchPlayMatrix: React.FC<MatchPlayMatrixProps> = ({
             <p><strong>{hoveredCell.player1}</strong> earned <strong>
               {formatPoints(matrix[hoveredCell.player1]?.[hoveredCell.player2] || 0)}
             </strong> points against <strong>{hoveredCell.player2}</strong></p>
-            <p className="mt-1 hidden md:block">
-              In a head-to-head match play format, this represents the number of holes won or halved
-            </p>
+            {hoveredMatch ? (
+              <p className="mt-1">
+                Holes {hoveredMatch.holes_won}-{hoveredMatch.holes_halved}-{hoveredMatch.holes_lost} (won-halved-lost), {formatPoints(hoveredMatch.hole_points)} of {hoveredMatch.possible_points} hole points &middot; {hoveredMatch.margins.join(', ')}
+              </p>
+            ) : (
+              <p className="mt-1 hidden md:block">
+                In a head-to-head match play format, this represents the number of holes won or halved
+              </p>
+            )}
           </div>
         </div>
       )}
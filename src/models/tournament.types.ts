@@ -273,6 +273,7 @@ export interface RawTournamentData {
   performance_trends: Record<PlayerName, any>
   course_analysis: any
   tournament_insights: any
+  hole_analysis?: Record<CourseName, any>
 }
 
 // Hole-by-hole analysis interfaces
@@ -9,6 +9,8 @@ export interface TournamentData {
       total_score: number
       rounds_played: number
       scoring_average: number
+      rank?: number
+      percentile?: number
     }>
     total_rounds: number
     courses_played: number
@@ -26,10 +28,13 @@ export interface TournamentData {
       player: string
       points: number
       percentage: number
+      rank?: number
+      percentile?: number
     }>
     match_play_champion: string
     dominant_performers: Array<any>
     struggled_performers: Array<any>
+    pairwise?: PairwiseMatchPlay
   }
   performance_trends: Record<string, PerformanceTrend>
   tournament_insights: {
@@ -67,7 +72,100 @@ export interface TournamentData {
       big_numbers: number
     }
     fun_facts: string[]
+    // Top places per award (ties share a rank); round awards carry score, course and day
+    awards?: Record<string, AwardPlace[]>
   }
+  // Per-course hole analytics precomputed by hole_analysis.py
+  hole_analysis?: Record<string, CourseHoleAnalysis>
+}
+
+export interface AwardPlace {
+  rank: number
+  value: number
+  player?: string
+  course?: string
+  score?: number
+  day?: number
+}
+
+// Column-oriented: every per-hole array is indexed like `holes`, and
+// heatmap[i] holds players[i]'s average strokes over par on each hole
+export interface CourseHoleAnalysis {
+  holes: number[]
+  par: number[]
+  yardage: (number | null)[]
+  handicap: (number | null)[]
+  hole_type: (string | null)[]
+  risk_reward_level: ('Conservative' | 'Moderate' | 'Aggressive' | null)[]
+  average_score: number[]
+  average_over_par: number[]
+  birdie_rate: number[]
+  par_rate: number[]
+  bogey_rate: number[]
+  double_bogey_plus_rate: number[]
+  difficulty: ('Easy' | 'Moderate' | 'Hard' | 'Very Hard')[]
+  difficulty_rank: number[]
+  difficulty_rating: (number | null)[]
+  scoring_index: (number | null)[]
+  players: string[]
+  heatmap: (number | null)[][]
+  course_difficulty: {
+    hardest_holes: { hole: number, avg_over_par: number, handicap: number | null }[]
+    easiest_holes: { hole: number, avg_over_par: number, handicap: number | null }[]
+    birdie_opportunities: { hole: number, birdie_rate: number, par: number }[]
+    trouble_spots: { hole: number, bogey_plus_rate: number, par: number }[]
+  }
+  player_performance: Record<string, {
+    average_by_hole_type: Record<string, number>
+    consistency_by_hole_type: Record<string, number>
+    strengths: string[]
+    weaknesses: string[]
+  }>
+  strategic_insights: {
+    category: 'risk-reward' | 'course-management' | 'scoring-opportunity' | 'damage-control'
+    insight: string
+    strategy: string
+  }[]
+  risk_reward: {
+    aggressive_holes: { hole: number, risk_level: number, avg_reward: number, avg_penalty: number }[]
+    conservative_holes: { hole: number, par_protection_rate: number }[]
+    scoring_opportunities: { hole: number, birdie_rate: number }[]
+  }
+}
+
+export interface PairwiseMatch {
+  matches: number
+  won: number
+  halved: number
+  lost: number
+  points: number
+  holes_won: number
+  holes_halved: number
+  holes_lost: number
+  hole_points: number
+  possible_points: number
+  margins: string[]
+}
+
+export interface PairwiseMatchPlay {
+  rounds: Array<{
+    day: number
+    course: string
+    players: number
+  }>
+  records: Array<{
+    player: string
+    matches: number
+    won: number
+    halved: number
+    lost: number
+    points: number
+    win_percentage: number
+    hole_points: number
+    possible_points: number
+  }>
+  matrix: Record<string, Record<string, number>>
+  matches: Record<string, Record<string, PairwiseMatch>>
 }
 
 export interface PlayerStats {
@@ -115,6 +213,13 @@ export interface PlayerStats {
     best_round: number
     performance_rating: string
   }>
+  handicap?: {
+    handicap_index: number | null
+    low_handicap_index: number | null
+    rounds_posted: number
+    differentials: number[]
+    counting_differentials: number[]
+  }
 }
 
 export interface PerformanceTrend {
@@ -125,6 +230,9 @@ export interface PerformanceTrend {
   trend_direction: string
   most_improved_day: string
   consistency_across_days: number
+  slope_per_round?: number | null
+  current_form?: number | null
+  change_point?: { round: number, shift: number } | null
 }
 
 export interface CourseStats {
@@ -309,7 +417,13 @@ export const getScoreDistribution = (playerName: string) => {
 }
 
 export const getMatchPlayMatrix = () => {
-  // Since we don't have individual hole-by-hole data, we'll simulate a match play matrix
+  // Real head-to-head results, played out hole by hole by the stats pipeline
+  const pairwise = data.head_to_head.pairwise
+  if (pairwise?.matrix) {
+    return pairwise.matrix
+  }
+
+  // Older stats files have no hole-by-hole data, so simulate a match play matrix
   // based on the match play points earned
   const players = getPlayerList()
   const matrix: Record<string, Record<string, number>> = {}
@@ -348,6 +462,11 @@ export const getMatchPlayMatrix = () => {
   return matrix
 }
 
+export const getPairwiseMatch = (player: string, opponent: string): PairwiseMatch | null => {
+  const pairwise = data.head_to_head.pairwise
+  return pairwise?.matches[player]?.[opponent] ?? null
+}
+
 export const getCourseData = () => {
   if (!data.course_analysis?.course_stats) {
     return []
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Per-stage wall time, CPU time, peak memory and row counts for the data pipeline
+"""
+
+import cProfile
+import json
+import os
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+class StageProfiler:
+    """Collects one record per pipeline stage, in the order stages start.
+
+    Stages nest (each section computed while the output is streamed, say),
+    so every record names its parent and the report adds self time, the
+    time not spent in child stages. Peak memory comes from tracemalloc: its
+    peak is reset at each stage boundary and folded back into the enclosing
+    stages, so each stage reports its own high-water mark. CPU time is this
+    process's only; with a worker pool a section's time is the wait for it.
+
+    The detail stage (a stage name, or the kind before its ':') also gets
+    a cProfile dump and a tracemalloc snapshot of what it left allocated.
+    """
+
+    def __init__(self, detail_stage: Optional[str] = None, dump_dir: str = '.'):
+        self.detail_stage = detail_stage
+        self.dump_dir = dump_dir
+        self.records: List[Dict[str, Any]] = []
+        self._open: List[Dict[str, Any]] = []
+        self._peaks: List[int] = []  # highest traced memory so far in each open stage
+        self.started = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Measure the enclosed block; set record['rows'] inside it once the count is known"""
+        record = {
+            'id': len(self.records),
+            'stage': name,
+            'parent': self._open[-1]['id'] if self._open else None,
+            'rows': rows
+        }
+        self.records.append(record)
+        memory_before, peak = tracemalloc.get_traced_memory()
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], peak)
+        tracemalloc.reset_peak()
+        self._open.append(record)
+        self._peaks.append(memory_before)
+
+        detailed = self.detail_stage in (name, name.partition(':')[0])
+        profile = cProfile.Profile() if detailed else None
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield record
+        finally:
+            if profile is not None:
+                profile.disable()
+            record['wall_seconds'] = round(time.perf_counter() - wall, 6)
+            record['cpu_seconds'] = round(time.process_time() - cpu, 6)
+            memory_after, peak = tracemalloc.get_traced_memory()
+            stage_peak = max(self._peaks.pop(), peak)
+            self._open.pop()
+            record['peak_memory_bytes'] = stage_peak
+            record['memory_change_bytes'] = memory_after - memory_before
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], stage_peak)
+            tracemalloc.reset_peak()
+            if detailed:
+                record.update(self._dump(record, profile))
+
+    def _dump(self, record: Dict[str, Any], profile: cProfile.Profile) -> Dict[str, str]:
+        os.makedirs(self.dump_dir, exist_ok=True)
+        base = os.path.join(self.dump_dir, f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', record['stage'])}.{record['id']}")
+        profile.dump_stats(base + '.prof')
+        tracemalloc.take_snapshot().dump(base + '.tracemalloc')
+        return {'cprofile': os.path.normpath(base + '.prof'), 'tracemalloc': os.path.normpath(base + '.tracemalloc')}
+
+    def report(self) -> Dict[str, Any]:
+        """Every stage plus totals per stage kind (the part of the name before ':')"""
+        child_wall = [0.0] * len(self.records)
+        for record in self.records:
+            if record['parent'] is not None and 'wall_seconds' in record:
+                child_wall[record['parent']] += record['wall_seconds']
+
+        stages = []
+        totals: Dict[str, Dict[str, Any]] = {}
+        for record in self.records:
+            if 'wall_seconds' not in record:
+                continue  # still open
+            entry = dict(record, self_wall_seconds=round(record['wall_seconds'] - child_wall[record['id']], 6))
+            stages.append(entry)
+            kind = record['stage'].partition(':')[0]
+            total = totals.setdefault(kind, {'count': 0, 'wall_seconds': 0.0, 'self_wall_seconds': 0.0,
+                                             'cpu_seconds': 0.0, 'peak_memory_bytes': 0, 'rows': 0})
+            total['count'] += 1
+            for key in ('wall_seconds', 'self_wall_seconds', 'cpu_seconds'):
+                total[key] = round(total[key] + entry[key], 6)
+            total['peak_memory_bytes'] = max(total['peak_memory_bytes'], entry['peak_memory_bytes'])
+            total['rows'] += entry['rows'] or 0
+
+        return {
+            'started': self.started,
+            'wall_seconds': round(time.perf_counter() - self._wall, 6),
+            'cpu_seconds': round(time.process_time() - self._cpu, 6),
+            'peak_memory_bytes': max((s['peak_memory_bytes'] for s in stages if s['parent'] is None), default=0),
+            'totals': totals,
+            'stages': stages
+        }
+
+    def save(self, filename: str):
+        """Write the report atomically and print the stages that took the longest"""
+        report = self.report()
+        temp_path = filename + '.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump(report, file, indent=2)
+        os.replace(temp_path, filename)
+
+        print(f"Profile saved to {os.path.normpath(filename)} ({report['wall_seconds']:.3f}s, "
+              f"peak {report['peak_memory_bytes'] / 1024 / 1024:.1f} MiB traced)")
+        for kind, total in sorted(report['totals'].items(), key=lambda item: -item[1]['self_wall_seconds'])[:5]:
+            print(f"  {kind}: {total['self_wall_seconds']:.3f}s self over {total['count']} stage(s)")
+
+_active: Optional[StageProfiler] = None
+
+def start_profiling(detail_stage: Optional[str] = None, dump_dir: str = '.') -> StageProfiler:
+    """Start recording stages for this process"""
+    global _active
+    _active = StageProfiler(detail_stage, dump_dir)
+    return _active
+
+def stop_profiling():
+    global _active
+    _active = None
+    tracemalloc.stop()
+
+def stage(name: str, rows: Optional[int] = None) -> ContextManager[Dict[str, Any]]:
+    """Profile a block when profiling is on; otherwise a no-op yielding a throwaway record"""
+    if _active is None:
+        return nullcontext({})
+    return _active.stage(name, rows)
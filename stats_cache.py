@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Content-hashed on-disk cache for advanced_stats.json sections
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Any, Callable, List, Tuple
+
+CACHE_DIR = '.stats_cache'
+
+def fingerprint_files(*paths: str) -> str:
+    """Hash of source files, so code changes invalidate cached sections"""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+def content_hash(*parts: Any) -> str:
+    """Stable hash of JSON-serializable inputs"""
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class SectionCache:
+    """One cache file per results section, keyed by a hash of its inputs.
+
+    A section whose input rows (and the code fingerprint) hash to the stored
+    key is read back from disk; anything else is recomputed and rewritten.
+    Files for sections that were not requested in this run are stale and
+    removed by prune().
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, fingerprint: str = ''):
+        self.directory = directory
+        self.fingerprint = fingerprint
+        self.hits: List[str] = []
+        self.misses: List[str] = []
+        self.pruned: List[str] = []
+        self._live = set()
+        os.makedirs(directory, exist_ok=True)
+
+    def _filename(self, name: str) -> str:
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '_', name)
+        return f"{slug}-{hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]}.json"
+
+    def lookup(self, name: str, inputs: Any) -> Tuple[bool, Any, str]:
+        """Return (hit, cached value, key) for a section and its current inputs"""
+        key = content_hash(self.fingerprint, name, inputs)
+        filename = self._filename(name)
+        self._live.add(filename)
+
+        try:
+            with open(os.path.join(self.directory, filename), 'r') as file:
+                entry = json.load(file)
+            if entry.get('key') == key:
+                self.hits.append(name)
+                return True, entry['value'], key
+        except (OSError, ValueError):
+            pass
+        return False, None, key
+
+    def store(self, name: str, key: str, value: Any):
+        """Write a freshly computed section under its input key"""
+        path = os.path.join(self.directory, self._filename(name))
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump({'section': name, 'key': key, 'value': value}, file)
+        os.replace(temp_path, path)
+        self.misses.append(name)
+
+    def get_or_compute(self, name: str, inputs: Any, compute: Callable[[], Any]) -> Any:
+        """Return the cached section if its inputs are unchanged, else compute it"""
+        hit, value, key = self.lookup(name, inputs)
+        if hit:
+            return value
+        value = compute()
+        self.store(name, key, value)
+        return value
+
+    def prune(self):
+        """Remove cache files for sections not used in this run"""
+        for filename in sorted(os.listdir(self.directory)):
+            if filename.endswith('.json') and filename not in self._live:
+                os.remove(os.path.join(self.directory, filename))
+                self.pruned.append(filename)
+
+    def report(self) -> str:
+        """One-line summary of cache hits and misses"""
+        summary = f"Section cache: {len(self.hits)} hits, {len(self.misses)} misses"
+        if self.pruned:
+            summary += f", {len(self.pruned)} stale entries removed"
+        if self.misses and self.hits:
+            summary += f" (recomputed: {', '.join(self.misses)})"
+        return summary
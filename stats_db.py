@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+SQLite store for cleaned tournament tables and SQL-backed aggregate queries
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_DB = 'golf_stats.db'
+
+# Formats that are not an individual's own round
+TEAM_FORMATS = ('Scramble', 'Best Ball Team')
+
+# Cleaned table -> column definitions, in the same order as the CSV headers
+TABLES = {
+    'individual_scores': [
+        ('course', 'TEXT'), ('day', 'INTEGER'), ('format', 'TEXT'), ('par', 'INTEGER'),
+        ('player', 'TEXT'), ('score', 'INTEGER'), ('stableford_points', 'INTEGER')
+    ],
+    'match_play_results': [
+        ('day', 'INTEGER'), ('format', 'TEXT'), ('player', 'TEXT'),
+        ('possible_points', 'INTEGER'), ('total_points', 'REAL')
+    ],
+    'player_stats': [
+        ('birdies', 'INTEGER'), ('bogeys', 'INTEGER'), ('double_bogeys', 'INTEGER'), ('over_par_holes', 'INTEGER'),
+        ('pars', 'INTEGER'), ('player', 'TEXT'), ('quadruple_bogeys', 'INTEGER'), ('quintuple_plus', 'INTEGER'),
+        ('scoring_average', 'REAL'), ('total_holes', 'INTEGER'), ('total_score', 'INTEGER'),
+        ('triple_bogeys', 'INTEGER'), ('under_par_holes', 'INTEGER')
+    ],
+    'team_scores': [
+        ('day', 'INTEGER'), ('format', 'TEXT'), ('score', 'REAL'), ('team', 'TEXT')
+    ],
+    'hole_scores': [
+        ('course', 'TEXT'), ('day', 'INTEGER'), ('format', 'TEXT'), ('hole', 'INTEGER'),
+        ('par', 'INTEGER'), ('player', 'TEXT'), ('strokes', 'INTEGER')
+    ]
+}
+
+INDEXES = [
+    ('individual_scores', 'player'),
+    ('individual_scores', 'course'),
+    ('individual_scores', 'day'),
+    ('individual_scores', 'format'),
+    ('match_play_results', 'player'),
+    ('player_stats', 'player'),
+    ('team_scores', 'day'),
+    ('hole_scores', 'day'),
+    ('hole_scores', 'player')
+]
+
+def connect(path: str = DEFAULT_DB) -> sqlite3.Connection:
+    """Open (and if needed create) the stats database"""
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('CREATE TABLE IF NOT EXISTS events (event TEXT PRIMARY KEY, source TEXT, loaded_at TEXT)')
+    for table, columns in TABLES.items():
+        column_sql = ', '.join(f'{name} {sql_type}' for name, sql_type in columns)
+        conn.execute(f'CREATE TABLE IF NOT EXISTS {table} (event TEXT NOT NULL, {column_sql})')
+    for table, column in INDEXES:
+        conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} (event, {column})')
+    conn.commit()
+    return conn
+
+def write_tournament(conn: sqlite3.Connection, event: str, source: str, tables: Dict[str, List[Dict[str, Any]]]):
+    """Replace one event's rows with freshly extracted tables, leaving other events untouched"""
+    with conn:
+        conn.execute('INSERT OR REPLACE INTO events VALUES (?, ?, ?)',
+                     (event, source, datetime.now(timezone.utc).isoformat(timespec='seconds')))
+        for table, columns in TABLES.items():
+            names = [name for name, _ in columns]
+            conn.execute(f'DELETE FROM {table} WHERE event = ?', (event,))
+            conn.executemany(
+                f'INSERT INTO {table} (event, {", ".join(names)}) VALUES ({", ".join("?" * (len(names) + 1))})',
+                ([event] + [_to_sql(row.get(name)) for name in names] for row in tables.get(table, []))
+            )
+
+def _to_sql(value: Any) -> Any:
+    # team_scores marks the tournament total row with day 'Total'; store it as NULL
+    return None if value in ('Total', '') else value
+
+def list_events(conn: sqlite3.Connection) -> List[str]:
+    return [row[0] for row in conn.execute('SELECT event FROM events ORDER BY event')]
+
+class StatsStore:
+    """Aggregate queries over one event in the stats database.
+
+    sqlite3 connections only work on the thread that opened them, so each
+    thread querying the store (e.g. the stats server's workers) gets its own.
+    """
+
+    def __init__(self, path: str, event: str):
+        self.path = path
+        self.event = event
+        self._local = threading.local()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = connect(self.path)
+        return conn
+
+    def fetch_table(self, table: str) -> Tuple[List[str], Iterator[Tuple]]:
+        """Column names and rows of one cleaned table, in insertion order"""
+        names = [name for name, _ in TABLES[table]]
+        rows = self.conn.execute(f'SELECT {", ".join(names)} FROM {table} WHERE event = ? ORDER BY rowid', (self.event,))
+        return names, rows
+
+    def _individual(self, select: str, where: str = '', group_by: str = '', params: Tuple = ()) -> List[Tuple]:
+        placeholders = ', '.join('?' * len(TEAM_FORMATS))
+        sql = f'SELECT {select} FROM individual_scores WHERE event = ? AND format NOT IN ({placeholders}) {where}'
+        if group_by:
+            sql += f' GROUP BY {group_by} ORDER BY MIN(rowid)'
+        return self.conn.execute(sql, (self.event,) + TEAM_FORMATS + params).fetchall()
+
+    def player_totals(self) -> List[Tuple[str, int, int]]:
+        """(player, total score, rounds played) in order of first appearance"""
+        return self._individual('player, SUM(score), COUNT(*)', group_by='player')
+
+    def round_counts(self) -> Tuple[int, int]:
+        """(individual rounds, distinct courses)"""
+        return self._individual('COUNT(*), COUNT(DISTINCT course)')[0]
+
+    def course_aggregates(self, player: Optional[str] = None) -> List[Tuple[str, int, int, int, int, int]]:
+        """(course, rounds, score sum, over-par sum, best, worst) per course, optionally for one player"""
+        if player is None:
+            return self._individual('course, COUNT(*), SUM(score), SUM(score - par), MIN(score), MAX(score)',
+                                    group_by='course')
+        return self._individual('course, COUNT(*), SUM(score), SUM(score - par), MIN(score), MAX(score)',
+                                where='AND player = ?', group_by='course', params=(player,))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON output of calculated statistics
+"""
+
+import json
+from typing import Any, Iterable, Iterator, Optional, TextIO, Tuple
+
+class EncodedJSON(str):
+    """A value already encoded by encode_json; write_json_stream writes it as is"""
+
+def _json_chunks(value: Any, indent: Optional[int], level: int) -> Iterator[str]:
+    """value's JSON as written at nesting level (1 inside the top-level object), chunk by chunk"""
+    if indent is None:
+        return json.JSONEncoder(separators=(',', ':')).iterencode(value)
+    chunks = json.JSONEncoder(indent=indent).iterencode(value)
+    inner = ' ' * (indent * level)
+    if not inner:
+        return chunks
+    # The encoder escapes newlines inside strings, so every newline in a chunk is layout
+    return (chunk.replace('\n', '\n' + inner) for chunk in chunks)
+
+def encode_json(value: Any, indent: Optional[int] = 2, level: int = 1) -> EncodedJSON:
+    """Encode a value once for write_json_stream, e.g. to keep an unchanged section's text between writes"""
+    return EncodedJSON(''.join(_json_chunks(value, indent, level)))
+
+def write_json_stream(items: Iterable[Tuple[str, Any]], file: TextIO, indent: Optional[int] = 2, level: int = 0):
+    """Write a JSON object from (key, value) pairs as they arrive
+
+    A value that is itself an iterator of (key, value) pairs is streamed as a
+    nested object, and an EncodedJSON value (encoded at the level it is
+    written) is copied through. The output is byte-for-byte what json.dump
+    would produce for the equivalent dict with the same indent (or compact
+    separators when indent is None).
+    """
+    if indent is None:
+        item_separator, key_separator, newline, inner, outer = ',', ':', '', '', ''
+    else:
+        item_separator, key_separator = ',', ': '
+        newline = '\n'
+        inner = ' ' * (indent * (level + 1))
+        outer = ' ' * (indent * level)
+
+    file.write('{')
+    first = True
+    for key, value in items:
+        file.write(('' if first else item_separator) + newline + inner + json.dumps(key) + key_separator)
+        first = False
+        if isinstance(value, Iterator):
+            write_json_stream(value, file, indent, level + 1)
+        elif isinstance(value, EncodedJSON):
+            file.write(value)
+        else:
+            # Chunk by chunk, so no section is ever held as one string
+            for chunk in _json_chunks(value, indent, level + 1):
+                file.write(chunk)
+    file.write('}' if first else newline + outer + '}')
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Local asyncio HTTP API over the tournament stats, with an LRU result cache and ETag revalidation
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import sys
+import threading
+import traceback
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from calculate_stats import (SECTIONS, SqliteSource, TournamentFrame, calculate_course_difficulty,
+                             calculate_course_performance, calculate_individual_player_stats, compute_section,
+                             find_tournament_dirs, frame_key, load_tournament_frame)
+from course_data import find_course
+from handicap import player_handicap
+from rank_index import RankIndex, bucket_scale
+from scoring import course_handicap
+from stats_db import DEFAULT_DB, connect, list_events
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+CACHE_SIZE = 256
+MAX_HEADER_BYTES = 16384
+# Leaderboard kinds: whether lower is better (buckets per point come from the scores themselves)
+LEADERBOARDS = {'gross': True, 'net': True, 'stableford': False, 'match_play': False}
+# Answers that depend on the service's own state rather than any event's files are never cached
+UNCACHED = {(), ('status',)}
+
+class NotFound(Exception):
+    pass
+
+class BadRequest(Exception):
+    pass
+
+class StatsService:
+    """Answers stats queries for one or more events, computing only what each query needs.
+
+    Frames are loaded lazily and reloaded when their files change (see
+    frame_key). A query computes just its slice - one section, one
+    player, one course or one day - never the whole document. Results are
+    kept in an LRU cache keyed by the query plus the versions of the events
+    it read, so a rewritten tournament simply stops matching its old
+    entries, which then age out. Cache lookups are cheap and may run on
+    the event loop; compute() runs on worker threads, so the cache, frames
+    and leaderboards are each guarded by a lock.
+    """
+
+    def __init__(self, sources: Dict[str, Union[str, SqliteSource]], cache_size: int = CACHE_SIZE):
+        self.sources = sources
+        self.cache_size = cache_size
+        self.cache: 'OrderedDict[Tuple, Tuple[bytes, str]]' = OrderedDict()
+        self.frames: Dict[str, Tuple[Tuple, TournamentFrame]] = {}
+        self.boards: Dict[Tuple[str, str], Tuple[Tuple, RankIndex]] = {}
+        self.hits = self.misses = self.evictions = 0
+        self.cache_lock = threading.Lock()
+        self.load_lock = threading.RLock()  # frames and boards: concurrent misses load each only once
+
+    def frame(self, event: str) -> TournamentFrame:
+        key = frame_key(self.sources[event])
+        with self.load_lock:
+            loaded = self.frames.get(event)
+            if loaded is None or loaded[0] != key:
+                loaded = self.frames[event] = (key, load_tournament_frame(self.sources[event]))
+        return loaded[1]
+
+    def _event(self, query: Dict[str, List[str]]) -> str:
+        event = query.get('event', [None])[0]
+        if event is None:
+            if len(self.sources) == 1:
+                return next(iter(self.sources))
+            raise BadRequest(f"several events are loaded; add ?event= (one of {', '.join(self.sources)})")
+        if event not in self.sources:
+            raise NotFound(f"no event {event!r}")
+        return event
+
+    def respond(self, path: str, query: Dict[str, List[str]]) -> Tuple[bytes, str]:
+        """(compact JSON body, ETag) for a GET, from the cache when the events read are unchanged"""
+        request, cached = self.lookup(path, query)
+        return cached if cached is not None else self.compute(request)
+
+    def lookup(self, path: str, query: Dict[str, List[str]]) -> Tuple[Tuple, Optional[Tuple[bytes, str]]]:
+        """The resolved request, and its cached (body, ETag) if the events it reads are unchanged"""
+        parts = [unquote(part) for part in path.strip('/').split('/') if part]
+        if tuple(parts) in UNCACHED:
+            return (None, parts, query, []), None
+        events = list(self.sources) if self._spans_events(parts) else [self._event(query)] if self._needs_event(parts) else []
+        key = (tuple(parts), tuple(sorted((k, tuple(v)) for k, v in query.items())),
+               tuple(frame_key(self.sources[event]) for event in events))
+        with self.cache_lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache.move_to_end(key)
+                self.hits += 1
+        return (key, parts, query, events), cached
+
+    def compute(self, request: Tuple) -> Tuple[bytes, str]:
+        """Answer a request lookup() missed and cache it; safe to call from a worker thread"""
+        key, parts, query, events = request
+        if key is not None:
+            with self.cache_lock:
+                self.misses += 1
+        body = json.dumps(self._answer(parts, query, events), separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        entry = (body, '"' + hashlib.sha256(body).hexdigest()[:20] + '"')
+        if key is None:
+            return entry
+        with self.cache_lock:
+            self.cache[key] = entry
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    @staticmethod
+    def _spans_events(parts: List[str]) -> bool:
+        # /players/<name>/courses reads every event
+        return len(parts) == 3 and parts[0] == 'players' and parts[2] == 'courses'
+
+    @staticmethod
+    def _needs_event(parts: List[str]) -> bool:
+        return bool(parts) and parts[0] in ('sections', 'players', 'courses', 'days', 'leaderboards')
+
+    def _answer(self, parts: List[str], query: Dict[str, List[str]], events: List[str]) -> Any:
+        if not parts:
+            return {'endpoints': ['/events', '/sections', '/sections/<name>', '/players', '/players/<name>',
+                                  '/players/<name>/courses', '/courses', '/courses/<name>', '/days', '/days/<day>',
+                                  '/leaderboards', '/leaderboards/<kind>', '/status'],
+                    'events': list(self.sources)}
+        if parts == ['events']:
+            return list(self.sources)
+        if parts == ['status']:
+            return {'cached_queries': len(self.cache), 'cache_size': self.cache_size, 'hits': self.hits,
+                    'misses': self.misses, 'evictions': self.evictions, 'loaded_events': list(self.frames)}
+
+        if self._spans_events(parts):
+            return self._player_courses(parts[1], query.get('course', [None])[0], events)
+        if not self._needs_event(parts) or len(parts) > 2:
+            raise NotFound(f"no endpoint /{'/'.join(parts)}")
+        frame = self.frame(events[0])
+        kind, name = parts[0], parts[1] if len(parts) == 2 else None
+
+        if kind == 'sections':
+            if name is None:
+                return SECTIONS
+            if name not in SECTIONS:
+                raise NotFound(f"no section {name!r} (one of {', '.join(SECTIONS)})")
+            return compute_section(frame, name)
+        if kind == 'players':
+            if name is None:
+                return frame.players
+            if name not in frame.players:
+                raise NotFound(f"no player {name!r} in {events[0]}")
+            return calculate_individual_player_stats(name, frame)
+        if kind == 'courses':
+            if name is None:
+                return sorted(frame.by_course)
+            return self._course(frame, name)
+        if kind == 'leaderboards':
+            if name is None:
+                return list(LEADERBOARDS)
+            return self._leaderboard(events[0], name, query)
+        if name is None:
+            return sorted(frame.by_day)
+        return self._day(frame, name)
+
+    def _course(self, frame: TournamentFrame, course: str) -> Dict[str, Any]:
+        """A course's difficulty numbers plus how each player fared there"""
+        if course not in frame.by_course:
+            raise NotFound(f"no course {course!r}")
+        performance = {}
+        for player in frame.players:
+            rounds = [r for r in frame.player_rounds(player) if r['course'] == course]
+            if rounds:
+                performance[player] = calculate_course_performance(player, rounds, frame.store)[course]
+        return {
+            'course': course,
+            'course_stats': calculate_course_difficulty(frame)['course_stats'][course],
+            'player_performance': performance
+        }
+
+    def board(self, event: str, kind: str) -> RankIndex:
+        """The rank index of one leaderboard, rebuilt only when the event's files change"""
+        key = frame_key(self.sources[event])
+        with self.load_lock:
+            built = self.boards.get((event, kind))
+            if built is None or built[0] != key:
+                scores = leaderboard_scores(self.frame(event), kind)
+                board = RankIndex(LEADERBOARDS[kind], bucket_scale(scores.values()))
+                for player, score in scores.items():
+                    board.insert(player, score)
+                built = self.boards[(event, kind)] = (key, board)
+        return built[1]
+
+    def _leaderboard(self, event: str, kind: str, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Standings (optionally only those within ?within= of the lead) and ?player='s rank and percentile"""
+        if kind not in LEADERBOARDS:
+            raise NotFound(f"no leaderboard {kind!r} (one of {', '.join(LEADERBOARDS)})")
+        board = self.board(event, kind)
+        within = query.get('within', [None])[0]
+        if within is None:
+            entries = list(board)
+        else:
+            try:
+                margin = float(within)
+            except ValueError:
+                margin = math.nan
+            if not math.isfinite(margin) or margin < 0:
+                raise BadRequest(f"within must be a finite number, at least 0, got {within!r}")
+            entries = board.within(margin)
+        result = {
+            'leaderboard': kind,
+            'players': len(board),
+            'leader': board.leader(),
+            'standings': [{'player': player, 'rank': board.rank(player), 'score': score} for player, score in entries]
+        }
+        player = query.get('player', [None])[0]
+        if player is not None:
+            if player not in board:
+                raise NotFound(f"{player!r} is not on the {kind} leaderboard")
+            score = board.score(player)
+            result['player'] = {'player': player, 'rank': board.rank(player), 'score': score,
+                                'percentile': board.percentile(player), 'behind_leader': abs(score - board.leader())}
+        return result
+
+    def _day(self, frame: TournamentFrame, day: str) -> Dict[str, Any]:
+        """Every individual round of one day, best first"""
+        try:
+            rounds = frame.by_day.get(int(day))
+        except ValueError:
+            raise BadRequest(f"day must be a number, got {day!r}")
+        if not rounds:
+            raise NotFound(f"no individual rounds on day {day}")
+        results = sorted(({'player': r['player'], 'course': r['course'], 'format': r['format'], 'score': r['score'],
+                           'relative_to_par': r['score'] - r['par']} for r in rounds), key=lambda r: r['score'])
+        return {
+            'day': int(day),
+            'courses': sorted({r['course'] for r in rounds}),
+            'formats': sorted({r['format'] for r in rounds}),
+            'field_average': round(sum(r['score'] for r in results) / len(results), 2),
+            'rounds': results
+        }
+
+    def _player_courses(self, player: str, course: Optional[str], events: List[str]) -> Dict[str, Any]:
+        """One player's course performance in every event they played (optionally a single course)"""
+        found = {}
+        for event in events:
+            frame = self.frame(event)
+            rounds = frame.player_rounds(player)
+            if course is not None:
+                rounds = [r for r in rounds if r['course'] == course]
+            if rounds:
+                found[event] = calculate_course_performance(player, rounds, frame.store)
+                if course is not None:
+                    found[event] = {course: found[event][course]}
+        if not found:
+            raise NotFound(f"no rounds for {player!r}" + (f" at {course!r}" if course else ''))
+        return {'player': player, 'events': found}
+
+def leaderboard_scores(frame: TournamentFrame, kind: str) -> Dict[str, Any]:
+    """Each player's tournament score on one leaderboard kind"""
+    if kind == 'match_play':
+        return {result['player']: result['total_points'] for result in frame.match_play_results}
+    scores = {}
+    for player in frame.players:
+        rounds = frame.player_rounds(player)
+        if kind == 'stableford':
+            points = [r['stableford_points'] for r in rounds if r.get('stableford_points') is not None]
+            if points:
+                scores[player] = sum(points)
+        elif rounds:
+            scores[player] = sum(r['score'] for r in rounds)
+            if kind == 'net':
+                # Course handicaps from the index the tournament's own rounds establish; scratch without one
+                index = player_handicap(sorted(rounds, key=lambda r: r['day']), frame.player_hole_cards(player),
+                                        frame.courses)['handicap_index']
+                if index is not None:
+                    scores[player] -= sum(course_handicap(index, course) for course in
+                                          (find_course(frame.courses, r['course']) for r in rounds) if course)
+    return scores
+
+STATUS_TEXT = {200: 'OK', 204: 'No Content', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               500: 'Internal Server Error'}
+
+async def handle_connection(service: StatsService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Serve HTTP/1.1 requests on one connection (kept alive unless the client closes it)"""
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                break
+            lines = head.decode('latin-1').split('\r\n')
+            try:
+                method, target, version = lines[0].split(' ', 2)
+            except ValueError:
+                break
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(':')
+                if name:
+                    headers[name.strip().lower()] = value.strip()
+
+            status, body, etag = await _dispatch(service, method, target, headers)
+            # Bodies are never read, so a request that might carry one ends the connection
+            keep_alive = (version == 'HTTP/1.1' and method in ('GET', 'HEAD', 'OPTIONS')
+                          and headers.get('connection', '').lower() != 'close')
+            response_headers = [
+                f'HTTP/1.1 {status} {STATUS_TEXT[status]}',
+                'Content-Type: application/json; charset=utf-8',
+                f'Content-Length: {len(body)}',
+                'Cache-Control: no-cache',  # always revalidate; unchanged results come back as 304
+                f"Connection: {'keep-alive' if keep_alive else 'close'}",
+                # The dashboard's dev server is another origin; If-None-Match needs a preflight
+                'Access-Control-Allow-Origin: *',
+                'Access-Control-Allow-Headers: If-None-Match',
+                'Access-Control-Expose-Headers: ETag'
+            ]
+            if etag:
+                response_headers.append(f'ETag: {etag}')
+            writer.write(('\r\n'.join(response_headers) + '\r\n\r\n').encode('latin-1'))
+            if method != 'HEAD':
+                writer.write(body)
+            await writer.drain()
+            if not keep_alive:
+                break
+    finally:
+        writer.close()
+
+async def _dispatch(service: StatsService, method: str, target: str, headers: Dict[str, str]
+                    ) -> Tuple[int, bytes, Optional[str]]:
+    if method == 'OPTIONS':
+        return 204, b'', None
+    if method not in ('GET', 'HEAD'):
+        return 405, _error(f"{method} not supported"), None
+    url = urlsplit(target)
+    try:
+        request, cached = service.lookup(url.path, parse_qs(url.query))
+        # Hits and 304 revalidations answer on the loop; misses compute off it so other connections keep moving
+        body, etag = cached if cached is not None else await asyncio.to_thread(service.compute, request)
+    except NotFound as error:
+        return 404, _error(str(error)), None
+    except BadRequest as error:
+        return 400, _error(str(error)), None
+    except Exception:
+        # A bug in one endpoint still gets an answer, and the connection stays usable
+        traceback.print_exc(file=sys.stderr)
+        return 500, _error(f"internal error serving {url.path}"), None
+    # Weak comparison, as RFC 9110 asks for If-None-Match
+    candidates = {tag.strip().removeprefix('W/') for tag in headers.get('if-none-match', '').split(',')}
+    if etag in candidates or '*' in candidates:
+        return 304, b'', etag
+    return 200, body, etag
+
+def _error(message: str) -> bytes:
+    return json.dumps({'error': message}).encode('utf-8')
+
+def resolve_sources(data_dir: str = '.', batch: Optional[str] = None, db_path: Optional[str] = None
+                    ) -> Dict[str, Union[str, SqliteSource]]:
+    """Event name -> source for a CSV directory, every tournament under a batch root, or every database event"""
+    if db_path:
+        conn = connect(db_path)
+        events = list_events(conn)
+        conn.close()
+        return {event: SqliteSource(db_path, event) for event in events}
+    if batch:
+        return {os.path.relpath(directory, batch): directory for directory in find_tournament_dirs(batch)}
+    return {os.path.basename(os.path.abspath(data_dir)): data_dir}
+
+async def serve(service: StatsService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+    server = await asyncio.start_server(lambda r, w: handle_connection(service, r, w), host, port,
+                                        limit=MAX_HEADER_BYTES)
+    print(f"Serving {len(service.sources)} event(s) on http://{host}:{port}/ (Ctrl+C to stop)")
+    async with server:
+        await server.serve_forever()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data-dir', default='.', help='directory holding the cleaned CSV files')
+    parser.add_argument('--batch', metavar='DIR', help='serve every tournament directory under DIR')
+    parser.add_argument('--db', metavar='PATH', nargs='?', const=DEFAULT_DB, help='serve every event in this SQLite database')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='interface to bind (local only by default)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='port to listen on')
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE, help='query results kept in the LRU cache')
+    args = parser.parse_args()
+
+    if args.db and not os.path.exists(args.db):
+        parser.error(f"database {args.db} not found; create it with clean_data.py --sqlite")
+    sources = resolve_sources(args.data_dir, args.batch, args.db)
+    if not sources:
+        parser.error("no tournaments found")
+    try:
+        asyncio.run(serve(StatsService(sources, args.cache_size), args.host, args.port))
+    except KeyboardInterrupt:
+        print("Server stopped")
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Strokes gained against baseline expected scores by hole type, par, yardage and handicap, fitted from the archive
+"""
+
+import argparse
+import json
+import os
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from archive import ARCHIVE_DIR, Archive
+from course_data import COURSES_FILE, find_course, load_courses
+from hole_analysis import hole_type
+from stats_cache import content_hash, fingerprint_files
+
+BASELINE_FILE = 'baseline.json'
+YARDAGE_BAND = 25       # yards per yardage bucket
+HANDICAP_BAND = 6       # stroke indexes per handicap band: 1-6, 7-12, 13-18
+MIN_SAMPLES = 30        # hole scores a cell needs before it is trusted over a coarser one
+
+# Baseline cells from finest to coarsest; a hole is scored against the finest
+# cell with at least MIN_SAMPLES scores, with par alone as the last resort
+LEVELS = [('hole_type', 'par', 'yardage', 'handicap'), ('hole_type', 'par'), ('par',)]
+
+def _features(par: int, yardage: Optional[int], stroke_index: Optional[int]) -> Dict[str, Any]:
+    band = (stroke_index - 1) // HANDICAP_BAND * HANDICAP_BAND + 1 if stroke_index else None
+    return {
+        'hole_type': hole_type(par, yardage),
+        'par': par,
+        'yardage': yardage // YARDAGE_BAND * YARDAGE_BAND if yardage is not None else None,
+        'handicap': f'{band}-{band + HANDICAP_BAND - 1}' if band else None
+    }
+
+def _cell(features: Dict[str, Any], level: Tuple[str, ...]) -> Optional[tuple]:
+    """A hole's cell at one level, or None if the layout lacks a feature it needs"""
+    values = tuple(features[name] for name in level)
+    return None if None in values else values
+
+class Slots:
+    """Dense (course, hole) numbering for an archive: slot = course code * width + hole - 1.
+
+    Per-slot arrays turn every per-hole lookup into one index; the features
+    of each slot come from courses.md (par alone when a course is missing).
+    """
+
+    def __init__(self, archive: Archive, courses_path: str = COURSES_FILE):
+        self.width = max(archive.holes['hole'], default=18)
+        self.size = len(archive.meta['courses']) * self.width
+        layouts = load_courses(courses_path) if os.path.exists(courses_path) else {}
+        self.layouts = [find_course(layouts, name) for name in archive.meta['courses']]
+        self.par = array('B', bytes(self.size))
+
+    def features(self, slot: int) -> Dict[str, Any]:
+        layout = self.layouts[slot // self.width]
+        hole = next((h for h in layout.holes if h.number == slot % self.width + 1), None) if layout else None
+        if hole is None:
+            return _features(self.par[slot], None, None)
+        return _features(hole.par, hole.yardage, hole.stroke_index)
+
+def _hole_pass(archive: Archive, slots: Slots, rows: Iterable[int], visit):
+    """Walk the holes of the given rounds, calling visit(row, slot offset, hole numbers, strokes) once per round"""
+    course, start, count = archive.rounds['course'], archive.rounds['hole_start'], archive.rounds['hole_count']
+    numbers, strokes = archive.holes['hole'], archive.holes['strokes']
+    for row in rows:
+        first = start[row]
+        last = first + count[row]
+        visit(row, course[row] * slots.width - 1, numbers[first:last], strokes[first:last])
+
+def fit_baseline(archive: Archive, slots: Slots) -> Dict[str, Any]:
+    """Mean strokes per baseline cell at every level, from one pass over all archived holes"""
+    sums = array('l', bytes(array('l').itemsize * slots.size))
+    counts = array('l', bytes(array('l').itemsize * slots.size))
+    pars = archive.holes['par']
+    start = archive.rounds['hole_start']
+
+    def visit(row, base, numbers, strokes):
+        first = start[row]
+        for offset, (hole, score) in enumerate(zip(numbers, strokes)):
+            slot = base + hole
+            sums[slot] += score
+            counts[slot] += 1
+            slots.par[slot] = pars[first + offset]
+
+    _hole_pass(archive, slots, range(archive.meta['rows']['rounds']), visit)
+
+    # Roll the per-slot totals up into cells; only played slots carry weight
+    totals: List[Dict[tuple, List[int]]] = [{} for _ in LEVELS]
+    for slot in range(slots.size):
+        if not counts[slot]:
+            continue
+        features = slots.features(slot)
+        for level, cells in zip(LEVELS, totals):
+            cell = _cell(features, level)
+            if cell is not None:
+                total = cells.setdefault(cell, [0, 0])
+                total[0] += sums[slot]
+                total[1] += counts[slot]
+    return {
+        'holes': sum(counts),
+        'par': slots.par.tolist(),  # per slot, so a cached baseline needs no pass to recover it
+        'levels': [{'fields': list(level),
+                    'cells': [{'key': list(cell), 'holes': count, 'expected': round(total / count, 4)}
+                              for cell, (total, count) in sorted(cells.items(), key=lambda item: str(item[0]))]}
+                   for level, cells in zip(LEVELS, totals)]
+    }
+
+def load_baseline(archive: Archive, slots: Slots, courses_path: str = COURSES_FILE,
+                  refit: bool = False) -> Tuple[Dict[str, Any], bool]:
+    """The baseline tables, refitted only when the archive, courses.md or this module changed; returns (baseline, fitted)"""
+    meta = archive.meta
+    paths = [__file__] + ([courses_path] if os.path.exists(courses_path) else [])
+    key = content_hash(meta['generation'], meta['rows'], meta['courses'], fingerprint_files(*paths))
+    path = os.path.join(archive.directory, BASELINE_FILE)
+    if not refit:
+        try:
+            with open(path, 'r') as file:
+                cached = json.load(file)
+            if cached.get('key') == key:
+                return cached['baseline'], False
+        except (OSError, ValueError):
+            pass
+
+    baseline = fit_baseline(archive, slots)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as file:
+        json.dump({'key': key, 'baseline': baseline}, file)
+    os.replace(temp_path, path)
+    return baseline, True
+
+def expected_table(baseline: Dict[str, Any], slots: Slots) -> array:
+    """Expected strokes for every slot: the lookup table strokes gained is scored against"""
+    levels = [(tuple(level['fields']), {tuple(cell['key']): cell for cell in level['cells']})
+              for level in baseline['levels']]
+    expected = array('d', bytes(array('d').itemsize * slots.size))
+    for slot in range(slots.size):
+        features = slots.features(slot)
+        for position, (fields, cells) in enumerate(levels):
+            cell = cells.get(_cell(features, fields))
+            if cell and (cell['holes'] >= MIN_SAMPLES or position == len(levels) - 1):
+                expected[slot] = cell['expected']
+                break
+        else:
+            expected[slot] = features['par']
+    return expected
+
+def _summary(rounds: int, cells: Dict[int, List[int]], expected: array, types: List[Optional[str]],
+             pars: array) -> Dict[str, Any]:
+    """Holes played and strokes gained, in total and by hole type and par, from per-slot [holes, strokes] totals"""
+    by_type: Dict[str, List[float]] = {}
+    by_par: Dict[int, List[float]] = {}
+    holes = 0
+    gained = 0.0
+    for slot, (count, strokes) in cells.items():
+        slot_gained = count * expected[slot] - strokes
+        holes += count
+        gained += slot_gained
+        for groups, key in ((by_type, types[slot]), (by_par, pars[slot])):
+            if key is not None:
+                total = groups.setdefault(key, [0, 0.0])
+                total[0] += count
+                total[1] += slot_gained
+
+    def split(groups):
+        return {key: {'holes': count, 'strokes_gained': round(total, 2), 'per_hole': round(total / count, 3)}
+                for key, (count, total) in sorted(groups.items())}
+    return {
+        'rounds': rounds,
+        'holes': holes,
+        'strokes_gained': round(gained, 2),
+        'per_round': round(gained / holes * 18, 2) if holes else 0,
+        'by_hole_type': split(by_type),
+        'by_par': split(by_par)
+    }
+
+def score_strokes_gained(archive: Archive, slots: Slots, expected: array,
+                         rows: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+    """Strokes gained per player and per course hole over the given rounds (default: every round) in one pass
+
+    The pass only counts holes and strokes per (player, slot); strokes
+    gained is linear in those, so every figure is then a lookup into the
+    expected table times a count.
+    """
+    if rows is None:
+        rows = range(archive.meta['rows']['rounds'])
+    player_column = archive.rounds['player']
+    players: Dict[int, Tuple[List[int], Dict[int, List[int]]]] = {}
+
+    def visit(row, base, numbers, strokes):
+        code = player_column[row]
+        player = players.get(code)
+        if player is None:
+            player = players[code] = ([0], {})
+        player[0][0] += 1
+        cells = player[1]
+        for hole, score in zip(numbers, strokes):
+            cell = cells.get(base + hole)
+            if cell is None:
+                cell = cells[base + hole] = [0, 0]
+            cell[0] += 1
+            cell[1] += score
+
+    _hole_pass(archive, slots, rows, visit)
+
+    types = [slots.features(slot)['hole_type'] for slot in range(slots.size)]
+    field: Dict[int, List[int]] = {}
+    for _, cells in players.values():
+        for slot, (count, strokes) in cells.items():
+            total = field.setdefault(slot, [0, 0])
+            total[0] += count
+            total[1] += strokes
+    holes: Dict[str, List[Dict[str, Any]]] = {}
+    for slot, (count, strokes) in sorted(field.items()):
+        average = strokes / count
+        holes.setdefault(archive.meta['courses'][slot // slots.width], []).append({
+            'hole': slot % slots.width + 1,
+            'par': slots.par[slot],
+            'hole_type': types[slot],
+            'scores': count,
+            'expected': round(expected[slot], 2),
+            'average': round(average, 2),
+            'strokes_gained': round(expected[slot] - average, 2)  # the field against similar holes; negative plays hard
+        })
+    summaries = {archive.meta['players'][code]: _summary(rounds[0], cells, expected, types, slots.par)
+                 for code, (rounds, cells) in players.items()}
+    return {
+        'players': dict(sorted(summaries.items(), key=lambda item: -item[1]['per_round'])),
+        'holes': holes
+    }
+
+def strokes_gained(archive: Archive, player: Optional[str] = None, courses_path: str = COURSES_FILE,
+                   refit: bool = False) -> Dict[str, Any]:
+    """Strokes gained for every archived round, or one player's (read through the player index)"""
+    if not archive.meta['rows']['rounds']:
+        raise KeyError(f"no rounds archived in {os.path.normpath(archive.directory)}; add events with archive.py add")
+    slots = Slots(archive, courses_path)
+    baseline, fitted = load_baseline(archive, slots, courses_path, refit)
+    if not fitted:
+        slots.par = array('B', baseline['par'])
+    expected = expected_table(baseline, slots)
+    rows = archive.rows_by('player', player) if player else None
+    result = score_strokes_gained(archive, slots, expected, rows)
+    result['baseline'] = {'holes': baseline['holes'], 'refitted': fitted,
+                          'cells': {' x '.join(level['fields']): len(level['cells']) for level in baseline['levels']}}
+    return result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--archive', default=ARCHIVE_DIR, help='archive directory')
+    parser.add_argument('--courses', default=COURSES_FILE, help='course scorecards giving hole yardage and handicap')
+    parser.add_argument('--player', help="only this player's rounds (the baseline still covers every round)")
+    parser.add_argument('--refit', action='store_true', help='refit the baseline even if the cached one is current')
+    parser.add_argument('--output', help='write the JSON here instead of printing it')
+    args = parser.parse_args()
+
+    with Archive(args.archive) as archive:
+        try:
+            result = strokes_gained(archive, args.player, args.courses, args.refit)
+        except KeyError as error:
+            parser.error(error.args[0])
+        status = 'refitted' if result['baseline']['refitted'] else 'cached'
+        print(f"Baseline ({status}) from {result['baseline']['holes']} hole scores in "
+              f"{os.path.normpath(os.path.join(args.archive, BASELINE_FILE))}", file=sys.stderr)
+        text = json.dumps(result, indent=2)
+        if args.output:
+            with open(args.output, 'w') as file:
+                file.write(text)
+            print(f"Results saved to {os.path.normpath(args.output)}")
+        else:
+            print(text)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic tournaments in the cleaned CSV shapes written by clean_data.py
+"""
+
+import argparse
+import csv
+import os
+import random
+from typing import Any, Dict, List, Sequence
+
+from course_data import COURSES_FILE, load_courses
+
+DEFAULT_FORMATS = ['Scramble', 'Match Play', 'Best Ball', 'Stableford']
+FLIGHT_SIZE = 8            # players per course per day, as on the real trip
+STABLEFORD_PAR_POINTS = 2
+
+# Header order matches save_to_csv (sorted union of the row keys)
+FIELDNAMES = {
+    'individual_scores.csv': ['course', 'day', 'format', 'par', 'player', 'score', 'stableford_points'],
+    'match_play_results.csv': ['day', 'format', 'player', 'possible_points', 'total_points'],
+    'team_scores.csv': ['day', 'format', 'score', 'team'],
+    'player_stats.csv': ['birdies', 'bogeys', 'double_bogeys', 'over_par_holes', 'pars', 'player',
+                         'quadruple_bogeys', 'quintuple_plus', 'scoring_average', 'total_holes',
+                         'total_score', 'triple_bogeys', 'under_par_holes'],
+    'hole_scores.csv': ['course', 'day', 'format', 'hole', 'par', 'player', 'strokes']
+}
+
+# A par-72 layout for when courses.md is unavailable: (par, stroke index) per hole
+FALLBACK_LAYOUT = [(4, 7), (5, 13), (3, 17), (4, 1), (4, 11), (4, 5), (3, 15), (5, 9), (4, 3),
+                   (4, 8), (4, 2), (3, 18), (5, 10), (4, 6), (4, 14), (3, 16), (5, 12), (4, 4)]
+
+def course_layouts(courses_file: str = COURSES_FILE) -> List[Dict[str, Any]]:
+    """Course names with (par, stroke index) per hole, from courses.md when present"""
+    if os.path.exists(courses_file):
+        courses = load_courses(courses_file)
+        layouts = [{'name': name, 'holes': [(hole.par, hole.stroke_index) for hole in course.holes]}
+                   for name, course in courses.items() if len(course.holes) == 18]
+        if layouts:
+            return layouts
+    return [{'name': 'Synthetic National', 'holes': FALLBACK_LAYOUT}]
+
+class PlayerModel:
+    """One synthetic golfer: a handicap-like skill level drives every hole score.
+
+    Skills follow a gamma distribution (mean 18, like a typical amateur
+    field). A hole's expected strokes over par grow with skill and with
+    hole difficulty (stroke index), and the right tail - the doubles and
+    'others' that dominate high handicappers' cards - widens with skill.
+    """
+
+    def __init__(self, name: str, rng: random.Random):
+        self.name = name
+        self.skill = min(54.0, rng.gammavariate(4.0, 4.5))
+
+    def hole(self, rng: random.Random, par: int, stroke_index: int) -> int:
+        difficulty = 1.3 - 0.6 * (stroke_index - 1) / 17
+        mean = self.skill / 18 * difficulty
+        relative = round(rng.gauss(mean, 0.7 + self.skill / 45))
+        if rng.random() < self.skill / 300:
+            relative += rng.randint(1, 3)  # a blow-up hole
+        return max(par + max(relative, -2), 1)
+
+def generate_tournament(output_dir: str, players: int = 8, rounds: int = 4, formats: Sequence[str] = DEFAULT_FORMATS,
+                        flight_size: int = FLIGHT_SIZE, seed: int = 0, courses_file: str = COURSES_FILE) -> Dict[str, int]:
+    """Write one synthetic tournament's cleaned CSV files and return the row count of each
+
+    Players are split into flights of flight_size; each flight plays its
+    own course each day (courses.md layouts in rotation, renamed for every
+    flight after the first so no two flights share a (day, course) round).
+    Round formats cycle through `formats`. Flights are split into two
+    sides for the scramble and team totals and into pairs for best ball
+    and match play, like the real trip. Rows are streamed to disk, so
+    memory stays proportional to the number of players.
+    """
+    rng = random.Random(seed)
+    layouts = course_layouts(courses_file)
+    field = [PlayerModel(f'Player {number:06d}', rng) for number in range(1, players + 1)]
+    flights = [field[start:start + flight_size] for start in range(0, players, flight_size)]
+    # Strokes over par per player, folded like clean_data's category counts (-1 = birdie or better, 5 = quintuple+)
+    tallies = {player.name: [0] * 7 for player in field}
+    totals = {player.name: [0, 0] for player in field}  # strokes, holes
+    counts = dict.fromkeys(FIELDNAMES, 0)
+
+    os.makedirs(output_dir, exist_ok=True)
+    files = {name: open(os.path.join(output_dir, name), 'w', newline='') for name in FIELDNAMES}
+    try:
+        writers = {name: csv.DictWriter(file, fieldnames=FIELDNAMES[name]) for name, file in files.items()}
+        for writer in writers.values():
+            writer.writeheader()
+        hole_writer = csv.writer(files['hole_scores.csv'])
+
+        def write(name: str, row: Dict[str, Any]):
+            writers[name].writerow(row)
+            counts[name] += 1
+
+        team_totals: Dict[str, List[Any]] = {}
+        for day in range(1, rounds + 1):
+            round_format = formats[(day - 1) % len(formats)]
+            for flight_number, flight in enumerate(flights):
+                layout = layouts[(day - 1) % len(layouts)]
+                course = layout['name'] if flight_number == 0 else f"{layout['name']} {flight_number + 1:05d}"
+                par = sum(hole_par for hole_par, _ in layout['holes'])
+                cards = {player.name: [player.hole(rng, hole_par, index) for hole_par, index in layout['holes']]
+                         for player in flight}
+                sides = [flight[:(len(flight) + 1) // 2], flight[(len(flight) + 1) // 2:]]
+                side_names = [f'Flight {flight_number + 1} Team {letter}' for letter in 'AB']
+                pairs = [flight[index:index + 2] for index in range(0, len(flight) - 1, 2)]
+
+                if round_format == 'Scramble':
+                    for side, team in zip(sides, side_names):
+                        if not side:
+                            continue
+                        # Best ball of the side, less the odd stroke saved by playing the best shot
+                        score = sum(max(min(cards[p.name][hole] for p in side) - (rng.random() < 0.25), 1)
+                                    for hole in range(len(layout['holes'])))
+                        write('individual_scores.csv', {'course': course, 'day': day, 'format': round_format,
+                                                        'par': par, 'player': team, 'score': score})
+                        team_totals.setdefault(team, []).append((day, round_format, score))
+                    continue
+
+                points = {}
+                for player in flight:
+                    card = cards[player.name]
+                    row = {'course': course, 'day': day, 'format': round_format, 'par': par,
+                           'player': player.name, 'score': sum(card)}
+                    if round_format == 'Stableford':
+                        row['stableford_points'] = points[player.name] = sum(
+                            max(0, STABLEFORD_PAR_POINTS - strokes + hole_par)
+                            for strokes, (hole_par, _) in zip(card, layout['holes'])
+                        )
+                    write('individual_scores.csv', row)
+                    # The bulk of the output: plain rows in FIELDNAMES order rather than dicts
+                    hole_writer.writerows(
+                        (course, day, round_format, hole, hole_par, player.name, strokes)
+                        for hole, (strokes, (hole_par, _)) in enumerate(zip(card, layout['holes']), start=1)
+                    )
+                    counts['hole_scores.csv'] += len(card)
+                    tally = tallies[player.name]
+                    for strokes, (hole_par, _) in zip(card, layout['holes']):
+                        tally[min(max(strokes - hole_par, -1), 5) + 1] += 1
+                    totals[player.name][0] += sum(card)
+                    totals[player.name][1] += len(card)
+
+                if round_format == 'Best Ball':
+                    for pair in pairs:
+                        score = sum(map(min, *(cards[p.name] for p in pair)))
+                        write('individual_scores.csv', {'course': course, 'day': day, 'format': 'Best Ball Team',
+                                                        'par': par, 'player': '/'.join(p.name for p in pair),
+                                                        'score': score})
+                        for p in pair:
+                            points[p.name] = score / len(pair)
+                elif round_format == 'Match Play':
+                    for pair in pairs:
+                        a, b = (cards[p.name] for p in pair)
+                        won = sum(x < y for x, y in zip(a, b)) + sum(x == y for x, y in zip(a, b)) / 2
+                        for p, total in ((pair[0], won), (pair[1], len(a) - won)):
+                            write('match_play_results.csv', {'day': day, 'format': round_format, 'player': p.name,
+                                                             'possible_points': len(a), 'total_points': _number(total)})
+                            points[p.name] = total
+                for side, team in zip(sides, side_names):
+                    if side and points:
+                        team_totals.setdefault(team, []).append((day, round_format, sum(points.get(p.name, 0) for p in side)))
+
+        # Team rows grouped by day, then the tournament totals, as extract_team_scores orders them
+        for day in range(1, rounds + 1):
+            for team, scores in team_totals.items():
+                for score_day, round_format, score in scores:
+                    if score_day == day:
+                        write('team_scores.csv', {'day': day, 'format': round_format, 'score': _number(score), 'team': team})
+        for team, scores in team_totals.items():
+            write('team_scores.csv', {'day': 'Total', 'format': 'Tournament Total',
+                                      'score': _number(sum(score for _, _, score in scores)), 'team': team})
+
+        for player in field:
+            tally = tallies[player.name]
+            strokes, holes = totals[player.name]
+            write('player_stats.csv', {
+                'player': player.name,
+                'total_score': strokes,
+                'scoring_average': round(strokes / holes, 2) if holes else 0,
+                'birdies': tally[0],
+                'pars': tally[1],
+                'bogeys': tally[2],
+                'double_bogeys': tally[3],
+                'triple_bogeys': tally[4],
+                'quadruple_bogeys': tally[5],
+                'quintuple_plus': tally[6],
+                'total_holes': holes,
+                'under_par_holes': tally[0],
+                'over_par_holes': holes - tally[0] - tally[1]
+            })
+    finally:
+        for file in files.values():
+            file.close()
+    return counts
+
+def _number(value: float) -> Any:
+    """Whole numbers without a trailing .0, as the export writes them"""
+    return int(value) if float(value).is_integer() else round(value, 2)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--output-dir', default='synthetic', help='where to write the CSV files')
+    parser.add_argument('--players', type=int, default=8, help='number of players')
+    parser.add_argument('--rounds', type=int, default=4, help='number of rounds (days)')
+    parser.add_argument('--formats', nargs='+', default=DEFAULT_FORMATS, choices=DEFAULT_FORMATS + ['Stroke Play'],
+                        help='round formats, cycled day by day')
+    parser.add_argument('--flight-size', type=int, default=FLIGHT_SIZE, help='players per course per day')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('--courses', default=COURSES_FILE, help='course layouts to play (courses.md)')
+    args = parser.parse_args()
+    if args.rounds > 127:
+        parser.error("at most 127 rounds (days are stored as single bytes)")
+
+    counts = generate_tournament(args.output_dir, args.players, args.rounds, args.formats,
+                                 args.flight_size, args.seed, args.courses)
+    for name, rows in counts.items():
+        print(f"Created {os.path.normpath(os.path.join(args.output_dir, name))} with {rows} rows")
@@ -0,0 +1,112 @@
+import csv
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from archive import Archive, append_event, career_stats, course_history, read_meta, season_stats
+from calculate_stats import (calculate_course_difficulty, calculate_course_performance, calculate_individual_player_stats,
+                             calculate_tournament_summary, load_tournament_frame)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def one_day(directory, day):
+    """The sample event cut down to a single day's individual and hole scores"""
+    os.makedirs(directory)
+    for name in ('individual_scores.csv', 'hole_scores.csv'):
+        with open(os.path.join(ROOT, name), 'r', newline='') as file:
+            reader = csv.DictReader(file)
+            rows = [row for row in reader if int(row['day']) == day]
+        with open(os.path.join(directory, name), 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=reader.fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+    return str(directory)
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    directory = str(tmp_path / 'archive')
+    append_event(directory, ROOT, 'myrtle', 2024)
+    return directory
+
+def archive_files(directory):
+    return {name: os.path.getsize(os.path.join(directory, name)) for name in sorted(os.listdir(directory))}
+
+def test_append_and_reopen_keeps_the_indexes_right(archive_dir, tmp_path):
+    added = append_event(archive_dir, one_day(tmp_path / 'd4', 4), 'myrtle-d4', 2025)
+    assert added['rounds'] == 8 and added['holes'] == 8 * 18 and added['matches'] == 0
+    files = os.listdir(archive_dir)
+    assert sorted(name for name in files if name.startswith('index.')) == ['index.course.2.bin', 'index.player.2.bin']
+
+    frames = {'myrtle': load_tournament_frame(ROOT), 'myrtle-d4': load_tournament_frame(str(tmp_path / 'd4'))}
+    with Archive(archive_dir) as archive:
+        assert [event['name'] for event in archive.meta['events']] == ['myrtle', 'myrtle-d4']
+        assert archive.meta['rows']['rounds'] == sum(len(frame.rounds) for frame in frames.values())
+        for column, names in (('player', archive.meta['players']), ('course', archive.meta['courses'])):
+            seen = []
+            for code, name in enumerate(names):
+                rows = list(archive.rows_by(column, name))
+                assert rows == sorted(rows)
+                assert all(archive.rounds[column][row] == code for row in rows)
+                seen += rows
+            assert sorted(seen) == list(range(archive.meta['rows']['rounds']))
+
+        # Every round's hole run is its own card from the event it came from
+        for row in range(archive.meta['rows']['rounds']):
+            event = archive.meta['events'][archive.rounds['event'][row]]['name']
+            player = archive.meta['players'][archive.rounds['player'][row]]
+            day = archive.rounds['day'][row]
+            card = sorted((r['hole'], r['par'], r['strokes']) for r in frames[event].hole_scores
+                          if r['player'] == player and r['day'] == day)
+            pars, strokes = (list(view) for view in archive.round_holes(row))  # no views outlive the archive
+            assert list(zip(pars, strokes)) == [(par, stroke) for _, par, stroke in card]
+            assert archive.rounds['score'][row] == sum(strokes)
+
+def test_re_adding_an_event_is_rejected(archive_dir):
+    before, meta = archive_files(archive_dir), read_meta(archive_dir)
+    with pytest.raises(ValueError, match='already archived'):
+        append_event(archive_dir, ROOT, 'myrtle', 2025)
+    assert archive_files(archive_dir) == before
+    assert read_meta(archive_dir) == meta
+
+def test_figures_match_calculate_stats(archive_dir):
+    frame = load_tournament_frame(ROOT)
+    summary = calculate_tournament_summary(frame)
+    difficulty = calculate_course_difficulty(frame)['course_stats']
+    with Archive(archive_dir) as archive:
+        season = season_stats(archive, 2024)
+        assert season['rounds_played'] == len(frame.rounds)
+        assert [entry['player'] for entry in season['leaderboard']] == [entry['player'] for entry in summary['leaderboard']]
+        assert [entry['scoring_average'] for entry in season['leaderboard']] == \
+            [entry['scoring_average'] for entry in summary['leaderboard']]
+
+        for player in frame.players:
+            career = career_stats(archive, player)
+            stats = calculate_individual_player_stats(player, frame)
+            basic, sheet = stats['basic_stats'], stats['detailed_performance']
+            assert (career['rounds_played'], career['scoring_average'], career['average_relative_to_par']) == \
+                (basic['rounds_played'], basic['scoring_average'], basic['average_relative_to_par'])
+            assert (career['best_round']['score'], career['worst_round']['score']) == (basic['best_round'], basic['worst_round'])
+            holes = career['holes']
+            assert (holes['birdies_or_better'], holes['pars'], holes['bogeys'], holes['double_bogeys']) == \
+                (sheet['birdies'], sheet['pars'], sheet['bogeys'], sheet['double_bogeys'])
+            assert holes['triple_bogeys_or_worse'] == sheet['triple_bogeys'] + sheet['big_numbers']
+            assert holes['par_or_better_percentage'] == sheet['par_or_better_percentage']
+            match_play = stats['match_play_performance']
+            assert (career['match_play']['points'], career['match_play']['possible_points'],
+                    career['match_play']['win_percentage']) == \
+                (match_play['total_points'], match_play['possible_points'], match_play['win_percentage'])
+
+        for course, figures in difficulty.items():
+            history = course_history(archive, course)
+            assert (history['rounds_played'], history['scoring_average'], history['average_relative_to_par'],
+                    history['best_round']['score']) == \
+                (figures['rounds_played'], figures['average_score'], figures['average_over_par'], figures['best_score'])
+            for player, record in history['players'].items():
+                performance = calculate_course_performance(player, frame.player_rounds(player), None)[course]
+                assert (record['rounds_played'], record['scoring_average'], record['average_relative_to_par'],
+                        record['best_round']['score']) == \
+                    (performance['rounds_played'], performance['average_score'],
+                     performance['average_relative_to_par'], performance['best_round'])
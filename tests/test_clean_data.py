@@ -0,0 +1,128 @@
+import csv
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculate_stats import SqliteSource, calculate_player_statistics, load_csv_data, load_tournament_frame
+from clean_data import (DAY_HEADER, OUTPUT_FILES, HoleScoreTensor, clean_myrtle_scores, event_directory, iter_tournaments,
+                        save_to_csv)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXPORT = os.path.join(ROOT, 'myrtleScores.csv')
+COURSES = os.path.join(ROOT, 'courses.md')
+
+def day4_export(tmp_path):
+    """Only the Stableford day of the sample export: no team rows"""
+    with open(EXPORT, 'r', newline='') as file:
+        lines = file.readlines()
+    # The section title, not the Par row's 'Day 1,...,Day 4,Total' team header
+    start = next(index for index, line in enumerate(lines)
+                 if (match := DAY_HEADER.match(line)) and match.group(1) == '4')
+    end = next(index for index, line in enumerate(lines) if line.startswith('Solo Scores'))
+    path = tmp_path / 'day4.csv'
+    path.write_text(''.join(lines[start:end]))
+    return path
+
+def test_save_to_csv_skips_empty_table(tmp_path):
+    path = tmp_path / 'empty.csv'
+    assert save_to_csv([], str(path)) is False
+    assert not path.exists()
+
+def test_save_to_csv_removes_stale_table(tmp_path):
+    path = tmp_path / 'match_play_results.csv'
+    path.write_text('day,format,player,possible_points,total_points\n2,Match Play,Nixon,18,12\n')
+    assert save_to_csv([], str(path)) is False
+    assert not path.exists()
+
+def test_export_with_empty_tables(tmp_path):
+    output_dir = tmp_path / 'd4'
+    clean_myrtle_scores(str(day4_export(tmp_path)), str(output_dir))
+
+    written = sorted(os.listdir(output_dir))
+    assert 'individual_scores.csv' in written
+    assert 'team_scores.csv' not in written
+    assert 'match_play_results.csv' not in written
+    assert set(written) <= set(OUTPUT_FILES)
+
+def test_pipeline_without_match_play(tmp_path):
+    output_dir = tmp_path / 'd4'
+    db_path = str(tmp_path / 'd4.db')
+    # Re-clean over the full event: its match play results must not carry over
+    clean_myrtle_scores(EXPORT, str(output_dir), db_path=db_path, event='d4')
+    clean_myrtle_scores(str(day4_export(tmp_path)), str(output_dir), db_path=db_path, event='d4')
+
+    for source in (str(output_dir), SqliteSource(db_path, 'd4')):
+        frame = load_tournament_frame(source)
+        assert len(frame.match_play_results) == 0
+        results = calculate_player_statistics(source)
+        assert results['head_to_head']['match_play_leaderboard'] == []
+        assert results['head_to_head']['match_play_champion'] is None
+        assert set(results['player_statistics']) == set(frame.players)
+        assert len(results['tournament_summary']['leaderboard']) == len(frame.players)
+
+def committed(filename):
+    with open(os.path.join(ROOT, filename), 'r', newline='') as file:
+        return file.read()
+
+def written(directory, filename):
+    with open(os.path.join(directory, filename), 'r', newline='') as file:
+        return file.read()
+
+def test_tables_match_the_committed_csvs(tmp_path):
+    clean_myrtle_scores(EXPORT, str(tmp_path), courses_file=COURSES)
+    assert sorted(os.listdir(tmp_path)) == sorted(OUTPUT_FILES)
+    for filename in OUTPUT_FILES:
+        assert written(tmp_path, filename) == committed(filename), filename
+
+def test_concatenated_export_splits_into_events(tmp_path):
+    # The full sample event, then a second event that only played the Stableford day
+    with open(EXPORT, 'r', newline='') as file:
+        export = file.read()
+    source = tmp_path / 'two_events.csv'
+    # The sample export has no trailing newline
+    source.write_text(export.rstrip('\r\n') + '\n' + day4_export(tmp_path).read_text())
+    output_dir = tmp_path / 'out'
+    clean_myrtle_scores(str(source), str(output_dir), courses_file=COURSES)
+
+    assert sorted(os.listdir(output_dir)) == ['event_001', 'event_002']
+    first, second = event_directory(str(output_dir), 1), event_directory(str(output_dir), 2)
+    assert sorted(os.listdir(first)) == sorted(OUTPUT_FILES)
+    for filename in OUTPUT_FILES:
+        assert written(first, filename) == committed(filename), filename
+
+    assert 'match_play_results.csv' not in os.listdir(second)
+    assert 'team_scores.csv' not in os.listdir(second)
+    frame = load_tournament_frame(second)
+    assert {row['day'] for row in frame.individual_scores} == {4}
+    assert {row['day'] for row in frame.hole_scores} == {4}
+    stableford = [row for row in load_tournament_frame(ROOT).individual_scores if row['day'] == 4]
+    assert [dict(row) for row in frame.individual_scores] == [dict(row) for row in stableford]
+
+def test_category_counts_match_a_hand_count():
+    with open(EXPORT, 'r', newline='') as file:
+        [tournament] = iter_tournaments(csv.reader(file))
+    tensor = HoleScoreTensor.from_tournament(tournament)
+    hand = {}
+    for row in load_csv_data(os.path.join(ROOT, 'hole_scores.csv')):
+        to_par = row['strokes'] - row['par']
+        category = 'birdies' if to_par < 0 else 'pars' if to_par == 0 else 'bogeys' if to_par == 1 else 'doubles'
+        hand.setdefault(row['player'], Counter())[category] += 1
+
+    assert sorted(tensor.players) == sorted(hand)
+    for player, counts in hand.items():
+        categories = tensor.category_counts(player)
+        assert set(categories) <= set(range(-1, 6))
+        assert categories[-1] == counts['birdies']
+        assert categories[0] == counts['pars']
+        assert categories[1] == counts['bogeys']
+        assert sum(categories[over] for over in range(2, 6)) == counts['doubles']
+        assert sum(categories.values()) == tensor.holes_played(player) == sum(counts.values())
+
+def test_category_counts_without_hole_scores():
+    tensor = HoleScoreTensor(['A', 'B'], [{'day': 1}], [4] * 18)
+    tensor.set_round('A', 0, [3, 4, 5, 6, 9] + [4] * 13)
+    assert tensor.category_counts('A') == Counter({-1: 1, 0: 14, 1: 1, 2: 1, 5: 1})
+    assert tensor.category_counts('B') == Counter()
+    assert tensor.holes_played('B') == 0 and tensor.total_score('B') == 0
@@ -0,0 +1,91 @@
+import os
+import statistics
+import sys
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from course_data import Course
+from handicap import WINDOW, HandicapRecord, score_differential
+
+def record_of(differentials, start=None):
+    """A record with every differential posted in order, a day apart when start is given"""
+    record = HandicapRecord()
+    for day, differential in enumerate(differentials):
+        record.post(differential, start + timedelta(days=day) if start else None)
+    return record
+
+def test_differential_rounds_halves_up():
+    course = Course(name='Test', par=72, yardage=6500, rating=72.45, slope=113, holes=[])
+    # 85 - 72.45 is 12.549999999999997 in floats; WHS rounds the 12.55 up
+    assert score_differential(85, course) == 12.6
+    assert score_differential(85, course._replace(rating=72.3)) == 12.7
+    assert score_differential(90, course._replace(rating=72.0, slope=130)) == 15.6   # 15.646
+
+def test_index_rounds_halves_up():
+    # Best 8 of 20 average to 12.25
+    record = record_of([12.2] * 7 + [12.6] + [20.0] * 12)
+    assert record.index == 12.3
+
+def test_best_eight_of_twenty():
+    differentials = [float(value) for value in range(20, 0, -1)]
+    record = record_of(differentials)
+    assert not any(entry['exceptional_reduction'] for entry in record.history)
+    assert record.index == statistics.mean(sorted(differentials)[:8])   # 4.5
+
+    # The 21st round pushes out the oldest (20.0); the low rounds, posted last, still count
+    record.post(25.0)
+    assert len(record.window) == WINDOW
+    assert record.index == 4.5
+    assert sorted(value for value, _ in record.ranked) == sorted(differentials[1:] + [25.0])
+
+def test_fewer_than_twenty_differentials():
+    assert record_of([10.0, 11.0]).index is None
+    assert record_of([10.0, 11.0, 12.0]).index == 8.0            # lowest 1, -2.0
+    assert record_of([10.0, 11.0, 12.0, 13.0, 14.0, 15.0]).index == 9.5   # lowest 2, -1.0
+
+def test_soft_and_hard_caps():
+    record = record_of([10.0] * WINDOW)
+    assert record.index == 10.0
+    assert record.low_index == 8.0                   # the index from the first three rounds (10 - 2)
+
+    for _ in range(12):
+        record.post(30.0)
+    assert record.index == 10.0                      # best 8 are still all 10s
+    record.post(30.0)
+    assert record.index == 11.8                      # 12.5 is 4.5 over: 3 + half of 1.5, 11.75 rounded up
+    record.post(30.0)
+    record.post(30.0)
+    assert record.index == 13.0                      # 17.5 soft-caps to 15.75, hard-capped at low + 5
+
+def test_exceptional_score_reductions():
+    record = record_of([20.0] * WINDOW)
+    record.post(12.0)                                # 8 below the index: every differential drops 1
+    assert record.history[-1]['exceptional_reduction'] == 1.0
+    assert [value for _, value in record.window] == [19.0] * (WINDOW - 1) + [11.0]
+    assert record.index == 18.0                      # (11 + 7 x 19) / 8
+
+    record.post(8.0)                                 # 10 below: 2 more
+    assert record.history[-1]['exceptional_reduction'] == 2.0
+    assert [value for _, value in record.window][-3:] == [17.0, 9.0, 6.0]
+    assert record.index == 14.6                      # (6 + 9 + 6 x 17) / 8 = 14.625
+    assert sorted(value for value, _ in record.ranked) == sorted(value for _, value in record.window)
+
+def test_low_index_looks_back_one_year():
+    start = date(2025, 1, 1)
+    record = record_of([10.0] * WINDOW, start)
+    # Indexes so far: 8.0 (day 2), 9.0, 10.0, 9.0 (day 5), then 10.0
+    record.post(10.0, start + timedelta(days=20))
+    assert record.low_index == 8.0
+
+    record.post(10.0, start + timedelta(days=2 + 366))
+    assert record.low_index == 9.0                   # day 2's 8.0 is over a year old
+    record.post(10.0, start + timedelta(days=5 + 366))
+    assert record.low_index == 10.0
+
+def test_low_index_needs_an_established_record():
+    record = record_of([10.0] * (WINDOW - 2))
+    record.post(10.0)
+    assert record.low_index is None
+    record.post(10.0)
+    assert record.low_index == 8.0
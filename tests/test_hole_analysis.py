@@ -0,0 +1,73 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculate_stats import load_tournament_frame
+from hole_analysis import CourseMatrix, calculate_hole_analysis
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Aberdeen Country Club as the dashboard's HoleAnalysisService.ts computed it from the same
+# scores, at the precision hole_analysis reports: holes 6 and 11 tie for hardest
+ABERDEEN = {
+    'difficulty_rank': [7, 15, 16, 11, 12, 1, 4, 8, 9, 5, 2, 13, 18, 14, 6, 3, 17, 10],
+    'difficulty_rating': [12, 14, 17, 17, 5, 18, 18, 10, 8, 18, 15, 18, 18, 14, 18, 10, 10, 9],
+    'scoring_index': [1.53, 0.89, 0.38, 1.01, 1.81, 2.27, 1.37, 1.67, 1.8, 1.18, 2.48, 0.94, -0.07, 1.08, 1.45, 2.49,
+                      0.84, 1.73],
+    'average_score': [7, 5.62, 4.38, 5.88, 6.88, 6.88, 5.5, 6, 6, 6.25, 7.88, 5.88, 4.12, 5.75, 6.25, 7.62, 4.38, 6],
+    'birdie_rate': [0] * 18,
+    'par_rate': [0, 25, 12.5, 0, 12.5, 12.5, 12.5, 0, 0, 12.5, 0, 12.5, 37.5, 12.5, 12.5, 25, 25, 25],
+    'bogey_rate': [37.5, 25, 50, 50, 37.5, 12.5, 12.5, 37.5, 25, 25, 25, 50, 25, 25, 25, 12.5, 25, 25],
+    'double_bogey_plus_rate': [62.5, 50, 37.5, 50, 50, 75, 75, 62.5, 75, 62.5, 75, 37.5, 37.5, 62.5, 62.5, 62.5, 50, 50],
+    'heatmap': [
+        [1, 1, 1, 1, 1, 0, 2, 3, 2, 1, 1, 1, 0, 2, 1, 1, 1, 1],  # Jimbo
+        [1, 1, 0, 1, 2, 2, 0, 2, 2, 2, 2, 0, 1, 0, 0, 0, 0, 0],  # Mike
+        [2, 0, 1, 2, 2, 1, 2, 1, 1, 2, 2, 1, 0, 2, 2, 2, 0, 3],  # Dave
+        [2, 0, 2, 1, 1, 3, 4, 1, 3, 0, 2, 2, 0, 2, 1, 0, 3, 0],  # Ryan
+        [1, 2, 1, 3, 5, 3, 1, 3, 2, 4, 1, 2, 2, 1, 5, 5, 1, 3],  # AJ
+        [3, 2, 1, 2, 1, 4, 2, 2, 1, 1, 5, 1, 3, 1, 2, 4, 2, 5],  # Nixon
+        [2, 3, 3, 1, 3, 6, 6, 1, 3, 2, 7, 1, 1, 2, 3, 5, 2, 1],  # Todd
+        [4, 4, 2, 4, 0, 4, 3, 3, 2, 6, 3, 7, 2, 4, 4, 4, 2, 3]   # Doug
+    ]
+}
+
+def test_matches_the_dashboard_service():
+    frame = load_tournament_frame(ROOT)
+    analysis = calculate_hole_analysis(frame.hole_scores, frame.players, frame.courses)['Aberdeen Country Club']
+    assert analysis['players'] == ['Jimbo', 'Mike', 'Dave', 'Ryan', 'AJ', 'Nixon', 'Todd', 'Doug']
+    for key, expected in ABERDEEN.items():
+        assert analysis[key] == expected, key
+    assert [hole['hole'] for hole in analysis['course_difficulty']['hardest_holes']] == [6, 11, 16, 7, 10]
+    assert [hole['hole'] for hole in analysis['course_difficulty']['easiest_holes']] == [13, 17, 3, 2, 14]
+
+def test_widening_keeps_cells_in_place():
+    matrix = CourseMatrix()
+    for player, strokes in (('A', 5), ('B', 6)):
+        for hole in range(18):
+            matrix.add(player, hole, 4, strokes)
+    matrix.add('A', 26, 5, 4)
+    matrix.add('C', 20, 3, 3)
+    assert matrix.holes == 27
+    assert len(matrix.sums) == len(matrix.counts) == len(matrix.squares) == 3 * 27
+    for row, relative in ((0, 1), (1, 2)):
+        assert list(matrix.sums[row * 27:row * 27 + 18]) == [relative] * 18
+        assert list(matrix.squares[row * 27:row * 27 + 18]) == [relative * relative] * 18
+        assert list(matrix.counts[row * 27:row * 27 + 18]) == [1] * 18
+    assert matrix.sums[26] == -1 and matrix.counts[26] == 1 and not any(matrix.counts[18:26])
+    assert not any(matrix.counts[27 + 18:2 * 27])
+    assert matrix.counts[2 * 27 + 20] == 1 and sum(matrix.counts[2 * 27:]) == 1
+    assert matrix.par[18:] == [0, 0, 3, 0, 0, 0, 0, 0, 5]
+    assert [outcome[26] for outcome in matrix.outcomes] == [1, 0, 0, 0]
+
+def test_long_card_without_a_layout():
+    rows = [{'course': 'Long Links', 'player': player, 'hole': hole, 'par': 4, 'strokes': 4 + (player == 'B') + (hole > 18)}
+            for player in ('A', 'B') for hole in range(1, 28)]
+    rows += [{'course': 'Long Links', 'player': 'A', 'hole': 27, 'par': 4, 'strokes': 6}]
+    analysis = calculate_hole_analysis(rows, ['A', 'B'], {})['Long Links']
+    assert analysis['holes'] == list(range(1, 28))
+    assert analysis['handicap'] == [None] * 27 and analysis['difficulty_rating'] == [None] * 27
+    assert analysis['heatmap'][0] == [0] * 18 + [1] * 8 + [1.5]
+    assert analysis['heatmap'][1] == [1] * 18 + [2] * 9
+    # Hole 27 is hardest, then the rest of the extra nine and the first 18 in hole order
+    assert analysis['difficulty_rank'] == list(range(10, 28)) + list(range(2, 10)) + [1]
@@ -0,0 +1,94 @@
+import os
+import random
+import statistics
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from insights import GroupRule, Running, RowRule, TopK, TotalRule, evaluate_rules
+
+def reference_top(values, k, largest):
+    """Every (rank, value, item) within the k best, ties with the k-th included, earliest first among equals"""
+    order = sorted(range(len(values)), key=lambda index: (-values[index] if largest else values[index], index))
+    if len(order) > k:
+        cutoff = values[order[k - 1]]
+        order = [index for index in order if (values[index] >= cutoff if largest else values[index] <= cutoff)]
+    ranked = []
+    for position, index in enumerate(order):
+        tied = ranked and values[index] == ranked[-1][1]
+        ranked.append((ranked[-1][0] if tied else position + 1, values[index], f'item{index}'))
+    return ranked
+
+@pytest.mark.parametrize('seed', range(40))
+def test_top_k_matches_sorting(seed):
+    rng = random.Random(seed)
+    k = rng.randint(1, 5)
+    values = [rng.randint(0, rng.choice([2, 5, 30])) for _ in range(rng.randint(0, 40))]
+    for largest in (False, True):
+        top = TopK(k, largest)
+        for index, value in enumerate(values):
+            top.push(value, f'item{index}')
+        assert top.ranked() == reference_top(values, k, largest)
+
+def test_top_k_ties():
+    top = TopK(2)
+    for value, item in [(5, 'a'), (3, 'b'), (5, 'c'), (5, 'd'), (4, 'e')]:
+        top.push(value, item)
+    assert top.ranked() == [(1, 3, 'b'), (2, 4, 'e')]  # the tied fives go once the cutoff improves
+
+    top = TopK(2, largest=True)
+    for value, item in [(7, 'a'), (9, 'b'), (7, 'c'), (7, 'd')]:
+        top.push(value, item)
+    assert top.ranked() == [(1, 9, 'b'), (2, 7, 'a'), (2, 7, 'c'), (2, 7, 'd')]
+
+@pytest.mark.parametrize('values', [[3, 4, 5, 9], [88, 88], [1.5, 2.25, 3.0, 0.1], [0.1] * 5, [1, 2.5, 4, 0.25]])
+def test_running_matches_statistics(values):
+    running = Running()
+    for value in values:
+        running.add(value)
+    assert running.stdev() == statistics.stdev(values)
+    assert running.mean() == statistics.mean(values)
+    assert running.sum() == pytest.approx(sum(values))
+    assert (running.first, running.last) == (values[0], values[-1])
+
+ROWS = [
+    {'player': 'A', 'course': 'X', 'score': 80, 'par': 72, 'points': 30},
+    {'player': 'B', 'course': 'X', 'score': 78, 'par': 72, 'points': None},
+    {'player': 'C', 'course': 'Y', 'score': 78, 'par': 70, 'points': 33},
+    {'player': 'A', 'course': 'Y', 'score': 76, 'par': 70, 'points': 33},
+    {'player': 'B', 'course': 'Y', 'score': 90, 'par': 70, 'points': 20},
+    {'player': 'D', 'course': 'X', 'score': 99, 'par': 72, 'points': 12},
+]
+
+def test_rules_in_one_pass():
+    score, player, course = (lambda row: row['score']), (lambda row: row['player']), (lambda row: row['course'])
+    rules = [
+        RowRule('low', 'rounds', score, player),
+        RowRule('points', 'rounds', lambda row: row['points'], player, largest=True),
+        GroupRule('total', 'rounds', player, score, 'sum'),
+        GroupRule('steady', 'rounds', player, score, 'stdev', min_count=2),
+        GroupRule('improved', 'rounds', player, score, 'improvement', largest=True, min_count=2),
+        GroupRule('hard', 'rounds', course, lambda row: row['score'] - row['par'], 'mean', largest=True, label='course'),
+        GroupRule('weighted', 'extra', player, lambda row: row['weight'], 'stdev', min_count=2),
+        TotalRule('strokes', 'rounds', score)
+    ]
+    extra = [{'player': 'A', 'weight': 0.5}, {'player': 'A', 'weight': 1.25}, {'player': 'B', 'weight': 0.1}]
+    fed = []
+
+    def rounds():
+        for row in ROWS:
+            fed.append(row)
+            yield row
+
+    results = evaluate_rules(rules, {'rounds': rounds(), 'extra': extra}, places=2)
+    assert len(fed) == len(ROWS)  # one scan, whatever the number of rules
+    assert results['low'] == [(1, 76, 'A'), (2, 78, 'B'), (2, 78, 'C')]
+    assert results['points'] == [(1, 33, 'C'), (1, 33, 'A')]  # None skipped
+    assert results['total'] == [(1, 78, 'C'), (2, 99, 'D')]
+    assert results['steady'] == [(1, statistics.stdev([80, 76]), 'A'), (2, statistics.stdev([78, 90]), 'B')]
+    assert results['improved'] == [(1, 4, 'A'), (2, -12, 'B')]
+    assert results['hard'] == [(1, 41 / 3, 'X'), (2, 34 / 3, 'Y')]
+    assert results['weighted'] == [(1, statistics.stdev([0.5, 1.25]), 'A')]
+    assert results['strokes'] == [(1, sum(row['score'] for row in ROWS), None)]
@@ -0,0 +1,131 @@
+import io
+import json
+import os
+import random
+import statistics
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from live_scoring import HOLES_PER_ROUND, LiveTournament, RunningStats, read_events, run
+
+PARS = [4, 4, 3, 5, 4, 4, 3, 4, 5, 4, 4, 3, 5, 4, 4, 3, 4, 5]
+
+def hole_events(player, day, strokes):
+    return [{'type': 'hole', 'player': player, 'day': day, 'hole': hole, 'strokes': score, 'par': par}
+            for hole, (score, par) in enumerate(zip(strokes, PARS), 1)]
+
+def standings(live):
+    """Every player's rank and to-par, recomputed from scratch"""
+    totals = {name: player.to_par() for name, player in live.players.items()}
+    return {name: {'rank': 1 + sum(other < to_par for other in totals.values()), 'to_par': to_par}
+            for name, to_par in totals.items()}
+
+@pytest.mark.parametrize('seed', range(10))
+def test_running_stats_remove_matches_statistics(seed):
+    rng = random.Random(seed)
+    stats, values = RunningStats(), []
+    for _ in range(200):
+        if values and rng.random() < 0.4:
+            value = values.pop(rng.randrange(len(values)))
+            stats.remove(value)
+        else:
+            value = rng.randrange(65, 110)
+            values.append(value)
+            stats.add(value)
+        assert stats.count == len(values)
+        if values:
+            assert stats.mean == pytest.approx(statistics.mean(values))
+        if len(values) > 1:
+            assert stats.stdev() == pytest.approx(statistics.stdev(values))
+        else:
+            assert stats.stdev() == 0
+
+def test_hole_by_hole_matches_whole_round_posting():
+    rng = random.Random(1)
+    by_hole, by_round = LiveTournament(), LiveTournament()
+    for day in (1, 2, 3):
+        for player in ('A', 'B', 'C'):
+            strokes = [par + rng.choice([-1, 0, 0, 1, 2]) for par in PARS]
+            for event in hole_events(player, day, strokes):
+                by_hole.apply(event)
+            by_round.apply({'type': 'round', 'player': player, 'day': day, 'score': sum(strokes), 'par': sum(PARS)})
+    assert by_hole.snapshot()['leaderboard'] == by_round.snapshot()['leaderboard']
+    assert by_hole.snapshot()['players'] == by_round.snapshot()['players']
+
+def test_round_in_progress_counts_towards_to_par_only():
+    live = LiveTournament()
+    changes = [live.apply(event) for event in hole_events('A', 1, [5, 4, 3])]
+    assert changes[-1]['players']['A']['current_round'] == {'day': 1, 'course': '', 'thru': 3, 'score': 12,
+                                                            'relative_to_par': 1}
+    assert [change['leaderboard'] for change in changes] == [{'A': {'rank': 1, 'to_par': 1}}, {}, {}]  # then pars
+    assert live.players['A'].summary()['rounds_played'] == 0
+
+def test_correcting_a_posted_round_matches_posting_the_correction():
+    corrected, direct = LiveTournament(), LiveTournament()
+    for live in (corrected, direct):
+        live.apply({'player': 'A', 'day': 1, 'score': 80, 'par': 72})
+        live.apply({'player': 'B', 'day': 1, 'score': 78, 'par': 72})
+    corrected.apply({'player': 'A', 'day': 2, 'score': 90, 'par': 72})
+    corrected.apply({'player': 'A', 'day': 2, 'score': 74, 'par': 72})
+    direct.apply({'player': 'A', 'day': 2, 'score': 74, 'par': 72})
+    assert corrected.snapshot()['players'] == direct.snapshot()['players']
+    assert corrected.leaderboard() == direct.leaderboard()
+
+    # A whole round rescored hole by hole replaces the posted total
+    strokes = [par + 1 for par in PARS]
+    for event in hole_events('B', 1, strokes):
+        corrected.apply(event)
+    assert corrected.players['B'].summary()['total_score'] == sum(strokes)
+    assert corrected.players['B'].scores.count == 1
+
+@pytest.mark.parametrize('seed', range(10))
+def test_leaderboard_changes_are_exactly_the_moved_standings(seed):
+    rng = random.Random(seed)
+    live = LiveTournament()
+    previous = {}
+    for _ in range(150):
+        player = rng.choice('ABCDEFGH')
+        if rng.random() < 0.5:
+            event = {'type': 'hole', 'player': player, 'day': rng.randint(1, 3), 'hole': rng.randint(1, HOLES_PER_ROUND),
+                     'strokes': rng.randint(2, 8), 'par': rng.choice([3, 4, 5])}
+        else:
+            event = {'type': 'round', 'player': player, 'day': rng.randint(1, 3), 'score': rng.randint(66, 95), 'par': 72}
+        changes = live.apply(event)['leaderboard']
+        current = standings(live)
+        assert changes == {name: standing for name, standing in current.items() if previous.get(name) != standing}
+        previous = current
+
+def test_malformed_event_leaves_state_untouched():
+    live = LiveTournament()
+    live.apply({'type': 'round', 'player': 'A', 'day': 1, 'score': 90, 'par': 72})
+    live.apply({'type': 'round', 'player': 'B', 'day': 1, 'score': 85, 'par': 72})
+    before = live.snapshot()
+    for event in [{'type': 'round', 'player': 'A', 'day': 1, 'par': 72},
+                  {'type': 'hole', 'player': 'A', 'day': 1, 'hole': 1, 'par': 4},
+                  {'type': 'round', 'player': 'A', 'day': 1, 'score': 'ninety', 'par': 72},
+                  {'type': 'round', 'day': 1, 'score': 80, 'par': 72},
+                  {'type': 'putt', 'player': 'A'},
+                  ['A', 1, 80]]:
+        with pytest.raises(ValueError):
+            live.apply(event)
+    assert live.snapshot() == before
+    assert live.players['A'].total_score == 90 and live.board.score('A') == 18
+
+def test_stream_reports_and_skips_bad_lines():
+    lines = '\n'.join([
+        json.dumps({'type': 'round', 'player': 'A', 'day': 1, 'score': 90, 'par': 72}),
+        '{not json',
+        json.dumps({'type': 'round', 'player': 'A', 'day': 1, 'par': 72}),
+        json.dumps({'type': 'round', 'player': 'B', 'day': 1, 'score': 85, 'par': 72})
+    ])
+    out, errors = io.StringIO(), io.StringIO()
+    live = LiveTournament()
+    run(read_events(io.StringIO(lines), errors), live, out, errors=errors)
+    assert [json.loads(line)['event'] for line in out.getvalue().splitlines()] == [1, 2]
+    reported = errors.getvalue().splitlines()
+    assert len(reported) == 2
+    assert reported[0].startswith('Skipped line 2') and 'has no score' in reported[1]
+    assert [entry['player'] for entry in live.leaderboard()] == ['B', 'A']
@@ -0,0 +1,108 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculate_stats import load_tournament_frame
+from match_play import pairwise_results, play_field, play_match
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def naive_match(a, b):
+    """One match hole by hole, closed the first time the lead exceeds the holes left"""
+    won = sum(x < y for x, y in zip(a, b))
+    lost = sum(x > y for x, y in zip(a, b))
+    lead, closed = 0, None
+    for hole, (x, y) in enumerate(zip(a, b)):
+        lead += (x < y) - (x > y)
+        remaining = len(a) - 1 - hole
+        if closed is None and abs(lead) > remaining:
+            closed = (lead, remaining)
+    lead, remaining = closed or (0, 0)
+    if lead == 0:
+        margin = 'AS'
+    elif remaining:
+        margin = f'{abs(lead)}&{remaining}'
+    else:
+        margin = f'{abs(lead)} up'
+    return {
+        'holes_won': won,
+        'holes_halved': len(a) - won - lost,
+        'holes_lost': lost,
+        'hole_points': won + (len(a) - won - lost) / 2,
+        'possible_points': len(a),
+        'result': 'W' if lead > 0 else 'L' if lead < 0 else 'H',
+        'margin': margin
+    }
+
+@pytest.mark.parametrize('seed', range(30))
+def test_field_matches_per_pair_loop(seed):
+    rng = random.Random(seed)
+    players = rng.randint(1, 11)  # odd and even fields
+    holes = rng.choice([1, 2, 9, 18, 27])
+    cards = [[rng.randint(2, 9) for _ in range(holes)] for _ in range(players)]
+    played = dict(play_field(cards))
+    assert sorted(played) == list(range(players - 1))
+    for index, results in played.items():
+        assert results == [naive_match(cards[index], other) for other in cards[index + 1:]]
+
+@pytest.mark.parametrize('a, b, margin, result', [
+    ([4] * 18, [4] * 18, 'AS', 'H'),
+    ([3] + [4] * 17, [4] * 18, '1 up', 'W'),
+    ([4] * 17 + [5], [4] * 18, '1 up', 'L'),
+    ([3] * 10 + [4] * 8, [4] * 18, '10&8', 'W'),
+    # Dormie 2 up with 2 to play, then the last two holes lost: all square
+    ([3, 3] + [4] * 14 + [5, 5], [4] * 18, 'AS', 'H'),
+    # Dormie, then a halve closes it out on the 17th
+    ([3, 3] + [4] * 16, [4] * 18, '2&1', 'W'),
+    # Dormie 9 down at the turn and every hole back: all square
+    ([5] * 9 + [3] * 9, [4] * 18, 'AS', 'H'),
+    # A comeback does not undo a match already lost
+    ([5] * 10 + [3] * 8, [4] * 18, '10&8', 'L'),
+])
+def test_margins(a, b, margin, result):
+    match = play_match(a, b)
+    assert (match['margin'], match['result']) == (margin, result)
+    assert match == naive_match(a, b)
+
+def test_blow_up_holes_are_capped_but_still_lost():
+    match = play_match([4, 120, 4], [4, 5, 4])
+    assert (match['holes_won'], match['holes_halved'], match['holes_lost']) == (0, 2, 1)
+
+def hole_rows(cards, day=1, course='Test Links', round_format='Match Play'):
+    return [{'day': day, 'course': course, 'format': round_format, 'player': player, 'hole': hole, 'strokes': strokes}
+            for player, card in cards.items() for hole, strokes in enumerate(card, 1)]
+
+def test_incomplete_cards_and_other_formats_are_left_out():
+    rows = hole_rows({'A': [4, 4, 4], 'B': [5, 4, 3], 'C': [4, 4]})
+    rows += hole_rows({'A': [3, 3, 3], 'D': [5, 5, 5]}, day=2, round_format='Stroke Play')
+    pairwise = pairwise_results(rows, ['A', 'B', 'C', 'D'])
+    assert pairwise['rounds'] == [{'day': 1, 'course': 'Test Links', 'players': 2}]
+    assert pairwise['matrix'] == {'A': {'B': 0.5}, 'B': {'A': 0.5}}
+    assert pairwise['matches']['A']['B']['margins'] == ['Day 1: H AS']
+
+def test_rematches_accumulate():
+    rows = hole_rows({'A': [3, 4], 'B': [4, 4]}, day=1) + hole_rows({'A': [5, 4], 'B': [4, 4]}, day=3)
+    pairwise = pairwise_results(rows)
+    record = pairwise['matches']['A']['B']
+    assert (record['matches'], record['won'], record['lost'], record['points']) == (2, 1, 1, 1)
+    assert record['margins'] == ['Day 1: W 1 up', 'Day 3: L 1 up']
+    assert pairwise['matches']['B']['A']['hole_points'] == record['possible_points'] - record['hole_points']
+
+def test_sheet_match_play_day():
+    """The sheet's match play points are each player's hole points against their real opponent"""
+    frame = load_tournament_frame(ROOT)
+    pairwise = pairwise_results(frame.hole_scores, frame.players)
+    assert pairwise['rounds'] == [{'day': 2, 'course': 'Barefoot Dye', 'players': 8}]
+    sheet = {row['player']: row['total_points'] for row in frame.match_play_results}
+    for a, b in [('Jimbo', 'Mike'), ('Dave', 'Ryan'), ('AJ', 'Nixon'), ('Todd', 'Doug')]:
+        assert sheet[a] + sheet[b] == 18
+        assert pairwise['matches'][a][b]['hole_points'] == sheet[a]
+        assert pairwise['matches'][b][a]['hole_points'] == sheet[b]
+    assert pairwise['matches']['Jimbo']['Mike']['margins'] == ['Day 2: L 4&3']
+    records = {record['player']: record for record in pairwise['records']}
+    assert all(record['matches'] == 7 and record['possible_points'] == 126 for record in records.values())
+    assert sum(record['points'] for record in records.values()) == 28  # one point per match
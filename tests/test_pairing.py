@@ -0,0 +1,63 @@
+import os
+import random
+import sys
+from itertools import combinations
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pairing import balanced_pairs, balanced_split
+
+def partitions(players):
+    """Every way to split players into pairs"""
+    if not players:
+        yield []
+        return
+    first, rest = players[0], players[1:]
+    for position, partner in enumerate(rest):
+        for others in partitions(rest[:position] + rest[position + 1:]):
+            yield [(first, partner)] + others
+
+@pytest.mark.parametrize('seed', range(40))
+def test_balanced_pairs_matches_brute_force(seed):
+    rng = random.Random(seed)
+    players = [f'P{number}' for number in range(rng.choice([2, 4, 6, 8]))]
+    scores = {pair: round(rng.uniform(60, 80), 2) for pair in combinations(players, 2)}
+
+    draw = balanced_pairs(players, scores)
+    spreads = [max(scores[pair] for pair in pairing) - min(scores[pair] for pair in pairing)
+               for pairing in partitions(players)]
+    assert draw['spread'] == round(min(spreads), 2)
+
+    paired = [player for team in draw['teams'] for player in team['players']]
+    assert sorted(paired) == sorted(players)
+    team_scores = [scores[tuple(team['players'])] for team in draw['teams']]
+    assert round(max(team_scores) - min(team_scores), 2) == draw['spread']
+
+def test_balanced_pairs_needs_an_even_field():
+    with pytest.raises(ValueError):
+        balanced_pairs(['A', 'B', 'C'], {})
+
+@pytest.mark.parametrize('seed', range(40))
+def test_balanced_split_matches_brute_force(seed):
+    rng = random.Random(seed)
+    strengths = {f'P{number}': rng.uniform(70, 95) for number in range(rng.choice([2, 4, 6, 8]))}
+
+    draw = balanced_split(strengths)
+    side_a, side_b = (side['players'] for side in draw['sides'])
+    assert sorted(side_a + side_b) == sorted(strengths) and len(side_a) == len(side_b)
+
+    # The difference is the sides' own, not the rounded weights'
+    difference = abs(sum(strengths[p] for p in side_a) - sum(strengths[p] for p in side_b))
+    assert draw['difference'] == round(difference, 2)
+
+    total = sum(strengths.values())
+    best = min(abs(total - 2 * sum(strengths[p] for p in side))
+               for side in combinations(strengths, len(strengths) // 2))
+    assert difference <= best + len(strengths) * 0.005
+
+def test_balanced_split_exact_weights():
+    draw = balanced_split({'A': 70.0, 'B': 72.0, 'C': 75.0, 'D': 77.0})
+    assert draw['difference'] == 0.0
+    assert sorted(map(sorted, (side['players'] for side in draw['sides']))) == [['A', 'D'], ['B', 'C']]
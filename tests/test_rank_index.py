@@ -0,0 +1,155 @@
+import math
+import os
+import random
+import sys
+from operator import itemgetter
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rank_index import RankIndex, bucket_scale, rank_entries
+
+def reference(scores, lower_is_better=True):
+    """(key, score) best first by a stable sort of the entries in insertion order"""
+    sign = 1 if lower_is_better else -1
+    return sorted(scores.items(), key=lambda item: item[1] * sign)
+
+def expected_rank(scores, key, sign):
+    return 1 + sum(1 for other in scores.values() if other * sign < scores[key] * sign)
+
+def expected_percentile(scores, key, sign):
+    if len(scores) < 2:
+        return 100.0
+    behind = sum(1 for other in scores.values() if other * sign > scores[key] * sign)
+    return round(behind / (len(scores) - 1) * 100, 1)
+
+def assert_matches(board, scores, sign):
+    assert list(board) == reference(scores, sign == 1)
+    assert len(board) == len(scores)
+    for key in scores:
+        assert board.rank(key) == expected_rank(scores, key, sign)
+        assert board.percentile(key) == expected_percentile(scores, key, sign)
+    assert [(rank, key, percentile) for rank, key, _, percentile in board.ranked()] == [
+        (expected_rank(scores, key, sign), key, expected_percentile(scores, key, sign))
+        for key, _ in reference(scores, sign == 1)]
+
+@pytest.mark.parametrize('lower_is_better', [True, False])
+@pytest.mark.parametrize('seed', range(20))
+def test_updates_match_a_sorted_list(seed, lower_is_better):
+    rng = random.Random(seed)
+    sign = 1 if lower_is_better else -1
+    board = RankIndex(lower_is_better, scale=2)
+    scores = {}
+    for _ in range(200):
+        key = f'P{rng.randrange(30)}'
+        if key in scores and rng.random() < 0.3:
+            board.remove(key)
+            del scores[key]
+        else:
+            # Few distinct scores, so most entries share a bucket
+            score = rng.randrange(-20, 21) / 2
+            board.insert(key, score)
+            scores.pop(key, None)  # a moved entry goes behind those it now ties with
+            scores[key] = score
+    assert_matches(board, scores, sign)
+
+def test_ties_share_the_best_rank_in_entry_order():
+    board = RankIndex()
+    for key, score in [('A', 72), ('B', 70), ('C', 72), ('D', 70), ('E', 75)]:
+        board.insert(key, score)
+    assert [(rank, key) for rank, key, _, _ in board.ranked()] == [(1, 'B'), (1, 'D'), (3, 'A'), (3, 'C'), (5, 'E')]
+    assert board.rank_of(71) == 3
+    assert board.percentile('B') == 75.0 and board.percentile('E') == 0.0
+
+def test_explicit_tiebreaks_order_a_bucket():
+    board = RankIndex()
+    for key, tiebreak in [('A', 3), ('B', 1), ('C', 2), ('D', 1)]:
+        board.insert(key, 70, tiebreak)
+    assert [key for key, _ in board] == ['B', 'D', 'C', 'A']
+    board.remove('D')
+    assert [key for key, _ in board] == ['B', 'C', 'A']
+
+def test_single_entry_is_the_hundredth_percentile():
+    board = RankIndex()
+    board.insert('A', 70)
+    assert board.percentile('A') == 100.0 and board.rank('A') == 1
+
+@pytest.mark.parametrize('lower_is_better', [True, False])
+@pytest.mark.parametrize('seed', range(10))
+def test_within_and_between_match_a_sorted_list(seed, lower_is_better):
+    rng = random.Random(seed)
+    sign = 1 if lower_is_better else -1
+    board = RankIndex(lower_is_better, scale=2)
+    scores = {}
+    for number in range(40):
+        scores[f'P{number}'] = rng.randrange(120, 180) / 2
+        board.insert(f'P{number}', scores[f'P{number}'])
+    ordered = reference(scores, lower_is_better)
+    lead = ordered[0][1]
+
+    for margin in [0, 0.4, 0.5, 1, 2.75, 3, 100]:
+        snapped = math.floor(margin * 2) / 2
+        assert board.within(margin) == [(key, score) for key, score in ordered if (score - lead) * sign <= snapped]
+
+    for _ in range(20):
+        first, last = rng.randrange(110, 190) / 2, rng.randrange(110, 190) / 2
+        low, high = sorted((first, last))
+        expected = [(key, score) for key, score in ordered if low <= score <= high]
+        assert board.between(first, last) == expected
+        assert board.between(last, first) == expected
+    assert board.between() == ordered
+    assert board.between(first=ordered[5][1]) == [item for item in ordered if (item[1] - ordered[5][1]) * sign >= 0]
+    assert board.between(last=ordered[5][1]) == [item for item in ordered if (item[1] - ordered[5][1]) * sign <= 0]
+
+def test_within_rejects_bad_margins():
+    board = RankIndex()
+    assert board.within(3) == []
+    for margin in [-1, math.inf, math.nan]:
+        with pytest.raises(ValueError):
+            board.within(margin)
+
+def test_buckets_grow_in_both_directions():
+    board = RankIndex()
+    scores = {}
+    for key, score in [('A', 0), ('B', 1000), ('C', -1000), ('D', 5), ('E', -2500), ('F', 4000)]:
+        board.insert(key, score)
+        scores[key] = score
+        assert board.low <= min(scores.values()) <= max(scores.values()) < board.low + board.tree.size
+        assert_matches(board, scores, 1)
+    assert board.leader() == -2500
+
+def test_scores_must_fit_the_buckets():
+    board = RankIndex(scale=2)
+    board.insert('A', 70.5)
+    with pytest.raises(ValueError):
+        board.insert('B', 70.25)
+    with pytest.raises(ValueError):
+        board.insert('B', math.inf)
+
+def test_bucket_scale():
+    assert bucket_scale([]) == 1
+    assert bucket_scale([70, 71, 72]) == 1
+    assert bucket_scale([70, 70.5]) == 2
+    assert bucket_scale([0.25, 0.5, 1 / 3]) == 12
+    with pytest.raises(ValueError):
+        bucket_scale([70.001])
+
+    # Every score gets its own whole bucket at the chosen scale
+    scores = [1.5, 2.25, 3.75, 4]
+    board = RankIndex(scale=bucket_scale(scores))
+    for number, score in enumerate(scores):
+        board.insert(number, score)
+    assert list(board) == list(enumerate(scores))
+
+@pytest.mark.parametrize('lower_is_better', [True, False])
+@pytest.mark.parametrize('seed', range(10))
+def test_rank_entries_ranks_as_a_rank_index(seed, lower_is_better):
+    rng = random.Random(seed)
+    entries = [(f'P{number}', rng.randrange(60, 80)) for number in range(rng.randrange(1, 50))]
+    board = RankIndex(lower_is_better)
+    for player, score in entries:
+        board.insert(player, score)
+    assert [(rank, entry[0], percentile) for rank, entry, percentile in
+            rank_entries(entries, itemgetter(1), lower_is_better)] == [
+        (rank, key, percentile) for rank, key, _, percentile in board.ranked()]
@@ -0,0 +1,146 @@
+import csv
+import io
+import os
+import random
+import sys
+from contextlib import redirect_stdout
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculate_stats import load_csv_data
+from clean_data import extract_individual_scores, iter_tournaments
+from course_data import Course, Hole, find_course, load_courses
+from scoring import ScoringEngine, course_handicap, load_handicaps, strokes_by_index
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COURSES = load_courses(os.path.join(ROOT, 'courses.md'))
+
+def course(rating: float, slope: int, par: int = 72) -> Course:
+    return Course(name='Test', par=par, yardage=6500, rating=rating, slope=slope, holes=[])
+
+def card_course(seed: int, holes: int = 18) -> Course:
+    rng = random.Random(seed)
+    indexes = list(range(1, holes + 1))
+    rng.shuffle(indexes)
+    card = [Hole(number=number, par=rng.choice([3, 4, 4, 5]), yardage=400, stroke_index=index)
+            for number, index in enumerate(indexes, 1)]
+    return Course(name=f'Card {seed}', par=sum(hole.par for hole in card), yardage=400 * holes,
+                  rating=72.0, slope=113, holes=card)
+
+def naive_received(course: Course, handicap: int):
+    """Hand out strokes one at a time: hardest hole first, or back from the easiest for a plus handicap"""
+    holes = len(course.holes)
+    received = {hole.stroke_index: 0 for hole in course.holes}
+    for stroke in range(abs(handicap)):
+        if handicap > 0:
+            received[stroke % holes + 1] += 1
+        else:
+            received[holes - stroke % holes] -= 1
+    return [received[hole.stroke_index] for hole in course.holes]
+
+def test_course_handicap_rounds_halves_up():
+    # 10.0 x 113 / 113 + 0.5 = 10.5: WHS gives 11 where round() gives the even 10
+    assert course_handicap(10.0, course(72.5, 113)) == 11
+    assert course_handicap(11.0, course(72.5, 113)) == 12
+    assert course_handicap(10.0, course(72.4, 113)) == 10
+
+def test_course_handicap_slope_and_rating():
+    assert course_handicap(0.0, course(72.0, 113)) == 0
+    assert course_handicap(18.0, course(73.1, 130)) == 22   # 20.71 + 1.1 = 21.81
+    assert course_handicap(-2.0, course(70.0, 113)) == -4
+
+def test_strokes_by_index_above_18_and_36_and_plus():
+    assert strokes_by_index(20) == (2, 2) + (1,) * 16
+    assert strokes_by_index(40) == (3, 3, 3, 3) + (2,) * 14
+    assert strokes_by_index(-2) == (0,) * 16 + (-1, -1)
+    assert strokes_by_index(-20) == (-1,) * 16 + (-2, -2)
+    assert all(sum(strokes_by_index(handicap)) == handicap for handicap in range(-40, 60))
+
+@pytest.mark.parametrize('handicap', [-20, -3, -1, 0, 1, 9, 17, 18, 19, 25, 36, 37, 40, 54])
+def test_score_card_matches_hole_by_hole(handicap):
+    engine = ScoringEngine({})
+    for seed in range(5):
+        played = card_course(seed)
+        rng = random.Random(seed * 100 + handicap)
+        gross = [hole.par + rng.randint(-2, 5) for hole in played.holes]
+        received = naive_received(played, handicap)
+        net = [strokes - given for strokes, given in zip(gross, received)]
+        points = [max(0, 2 + hole.par - strokes) for hole, strokes in zip(played.holes, net)]
+        result = engine.score_card(gross, played, handicap)
+        assert result['net_holes'] == net
+        assert result['hole_points'] == points
+        assert result['net_score'] == sum(gross) - handicap
+        assert result['net_relative_to_par'] == sum(gross) - handicap - played.par
+        assert result['stableford_points'] == sum(points)
+
+def test_plus_handicap_gives_back_on_the_easiest_holes():
+    played = card_course(3)
+    gross = [hole.par for hole in played.holes]
+    result = ScoringEngine({}).score_card(gross, played, -2)
+    easiest = {hole.number for hole in played.holes if hole.stroke_index > 16}
+    assert [hole.number for hole, points in zip(played.holes, result['hole_points']) if points == 1] == sorted(easiest)
+    assert result['stableford_points'] == 34
+
+def hole_rows(player, day, played, strokes, round_format='Stroke Play'):
+    return [{'player': player, 'day': day, 'course': played.name, 'format': round_format,
+             'hole': hole.number, 'strokes': strokes} for hole in played.holes]
+
+def test_score_rounds_uses_day_overrides_and_skips_incomplete_cards():
+    played = card_course(1)
+    engine = ScoringEngine({played.name: played}, {'A': 10, ('A', 2): 4})
+    rows = hole_rows('A', 1, played, 5) + hole_rows('A', 2, played, 5) + hole_rows('B', 1, played, 4)[:-1]
+    scored = {(row['player'], row['day']): row for row in engine.score_rounds(rows)}
+    assert sorted(scored) == [('A', 1), ('A', 2)]
+    assert (scored[('A', 1)]['course_handicap'], scored[('A', 1)]['net_score']) == (10, 80)
+    assert (scored[('A', 2)]['course_handicap'], scored[('A', 2)]['net_score']) == (4, 86)
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=sorted({key for row in rows for key in row}))
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+def test_load_handicaps_course_handicaps_player_wide_and_per_day(tmp_path):
+    path = write_csv(tmp_path / 'handicaps.csv', [
+        {'player': 'A', 'course_handicap': '12'},
+        {'player': 'A', 'day': '3', 'course_handicap': '8'},
+        {'player': ' B ', 'course_handicap': '-2'}
+    ])
+    handicaps = load_handicaps(path, COURSES)
+    assert handicaps == {'A': 12, ('A', 3): 8, 'B': -2}
+    engine = ScoringEngine(COURSES, handicaps)
+    assert [engine.handicap_for('A', day) for day in (1, 3)] == [12, 8]
+
+def test_load_handicaps_index_converted_per_round(tmp_path):
+    hole_scores = load_csv_data(os.path.join(ROOT, 'hole_scores.csv'))
+    rounds = {(row['player'], row['day']): row['course'] for row in hole_scores}
+    path = write_csv(tmp_path / 'handicaps.csv', [
+        {'player': 'Jimbo', 'handicap_index': '14.2'},
+        {'player': 'Mike', 'handicap_index': '6.0'},
+        {'player': 'Mike', 'day': '2', 'handicap_index': '9.5'}
+    ])
+    handicaps = load_handicaps(path, COURSES, hole_scores)
+    for (player, day), course_name in rounds.items():
+        index = {'Jimbo': 14.2, 'Mike': 9.5 if day == 2 else 6.0}.get(player)
+        if index is None:
+            assert (player, day) not in handicaps
+        else:
+            assert handicaps[(player, day)] == course_handicap(index, find_course(COURSES, course_name))
+
+def test_computed_stableford_matches_the_sheet():
+    with open(os.path.join(ROOT, 'myrtleScores.csv'), newline='') as file:
+        [tournament] = iter_tournaments(csv.reader(file))
+    [stableford] = [current for current in tournament['rounds'] if current['format'] == 'Stableford']
+    sheet = {entry['name']: entry['points'] for entry in stableford['entries'] if entry['points'] is not None}
+    assert len(sheet) == 8
+    with redirect_stdout(io.StringIO()) as printed:
+        scores = extract_individual_scores(tournament, COURSES)
+    assert 'Warning' not in printed.getvalue()
+    computed = {row['player']: row['stableford_points'] for row in scores if 'stableford_points' in row}
+    assert computed == sheet
+    committed = {row['player']: row['stableford_points'] for row in load_csv_data(os.path.join(ROOT, 'individual_scores.csv'))
+                 if row['format'] == 'Stableford'}
+    assert committed == sheet
@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import simulate
+from calculate_stats import load_tournament_frame
+from simulate import (ScoreModel, best_ball_teams, event_rounds, merge_tallies, new_tally, run_simulations,
+                      simulate_chunk, summarize)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPETITIONS = ['stroke_play', 'stableford', 'match_play', 'best_ball', 'teams']
+
+@pytest.fixture(scope='module')
+def event():
+    frame = load_tournament_frame(ROOT)
+    teams = {'/'.join(members): members for members in best_ball_teams(frame)}
+    return ScoreModel(frame.hole_scores, frame.players), event_rounds(frame), teams
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(simulate, 'CHUNK_SIMULATIONS', 40)
+
+def test_same_seed_same_result_for_any_worker_count(event, small_chunks):
+    model, rounds, teams = event
+    serial = run_simulations(model, rounds, teams, 130, seed=7)  # three full chunks and a partial one
+    assert serial['simulations'] == 130
+    assert run_simulations(model, rounds, teams, 130, seed=7) == serial
+    assert run_simulations(model, rounds, teams, 130, seed=7, workers=2) == serial
+    assert run_simulations(model, rounds, teams, 130, seed=7, workers=3) == serial
+    assert run_simulations(model, rounds, teams, 130, seed=8) != serial
+
+def test_chunks_merge_in_any_order(event):
+    model, rounds, teams = event
+    parts = [simulate_chunk(model, rounds, teams, size, f'3:{index}') for index, size in enumerate([25, 25, 10])]
+    merged = []
+    for order in (parts, parts[::-1]):
+        total = new_tally(model.players, teams)
+        for part in order:
+            merge_tallies(total, part)
+        merged.append(summarize(total, rounds))
+    assert merged[0] == merged[1]
+    assert merged[0]['simulations'] == 60
+
+def test_win_probabilities_sum_to_one(event):
+    model, rounds, teams = event
+    results = run_simulations(model, rounds, teams, 300, seed=1)
+    assert set(COMPETITIONS) <= set(results)
+    for competition in COMPETITIONS:
+        rows = results[competition]
+        # Each probability is rounded to 4 places; tied winners share a win
+        assert sum(row['win_probability'] for row in rows) == pytest.approx(1, abs=len(rows) * 0.00005 + 1e-9)
+        assert sorted(row['expected_position'] for row in rows)[0] >= 1
+    for a, opponents in results['match_play_head_to_head'].items():
+        for b, share in opponents.items():
+            assert share + results['match_play_head_to_head'][b][a] == pytest.approx(1, abs=0.0001 + 1e-9)
+
+def test_single_chunk_tally_wins_sum_to_simulations(event):
+    model, rounds, teams = event
+    tally = simulate_chunk(model, rounds, teams, 50, 'x')
+    for competition in COMPETITIONS:
+        assert sum(tally[competition]['wins'].values()) == pytest.approx(50)
+
+def test_needs_a_simulation(event):
+    model, rounds, teams = event
+    with pytest.raises(ValueError):
+        run_simulations(model, rounds, teams, 0)
@@ -0,0 +1,51 @@
+import io
+import os
+import shutil
+import sys
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculate_stats import run
+from clean_data import OUTPUT_FILES, clean_myrtle_scores
+from stage_profile import start_profiling, stop_profiling
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXPORT = os.path.join(ROOT, 'myrtleScores.csv')
+COURSES = os.path.join(ROOT, 'courses.md')
+
+def read(directory, name):
+    with open(os.path.join(directory, name), 'rb') as file:
+        return file.read()
+
+def pipeline(output_dir, profile_stage=None):
+    """Clean the sample export and calculate its stats, optionally under the stage profiler"""
+    profiler = start_profiling(profile_stage, output_dir) if profile_stage is not None else None
+    try:
+        with redirect_stdout(io.StringIO()):
+            clean_myrtle_scores(EXPORT, output_dir, courses_file=COURSES)
+            run([(output_dir, output_dir)], use_cache=False)
+            run([(os.path.join(output_dir, 'streamed'), output_dir)], use_cache=False, stream=True)
+            if profiler is not None:
+                profiler.save(os.path.join(output_dir, 'profile.json'))
+    finally:
+        if profiler is not None:
+            stop_profiling()
+    return profiler
+
+def test_profiling_leaves_outputs_unchanged(tmp_path):
+    plain, profiled = str(tmp_path / 'plain'), str(tmp_path / 'profiled')
+    pipeline(plain)
+    profiler = pipeline(profiled, profile_stage='extract_hole_scores')
+
+    for name in OUTPUT_FILES + ['advanced_stats.json', os.path.join('streamed', 'advanced_stats.json')]:
+        assert read(profiled, name) == read(plain, name), name
+    assert read(plain, 'advanced_stats.json') == read(ROOT, 'advanced_stats.json')
+
+    report = profiler.report()
+    stages = {record['stage'].partition(':')[0]: record for record in report['stages']}
+    assert stages['extract_hole_scores']['rows'] == 432
+    assert os.path.exists(os.path.join(profiled, 'profile.json'))
+    assert os.path.exists(stages['extract_hole_scores']['cprofile'])
+    assert all(record['wall_seconds'] >= 0 and record['peak_memory_bytes'] >= 0 for record in report['stages'])
+    assert not any(name.endswith(('.prof', '.tracemalloc', 'profile.json')) for name in os.listdir(plain))
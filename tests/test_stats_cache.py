@@ -0,0 +1,87 @@
+import csv
+import os
+import shutil
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import calculate_stats
+from calculate_stats import PLAYER_SECTION_PREFIX, SECTIONS, calculate_player_statistics, run
+from stats_cache import SectionCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TABLES = ['individual_scores.csv', 'match_play_results.csv', 'team_scores.csv', 'player_stats.csv', 'hole_scores.csv']
+PLAYERS = ['Jimbo', 'Mike', 'Dave', 'Ryan', 'AJ', 'Nixon', 'Todd', 'Doug']
+ALL_SECTIONS = set(SECTIONS) | {PLAYER_SECTION_PREFIX + player for player in PLAYERS}
+
+def event_copy(directory):
+    os.makedirs(directory)
+    for name in TABLES:
+        shutil.copy(os.path.join(ROOT, name), directory)
+    return str(directory)
+
+def cached_run(data_dir, cache_dir, fingerprint='code'):
+    cache = SectionCache(cache_dir, fingerprint)
+    return calculate_player_statistics(data_dir, cache), cache
+
+def rescore(data_dir, player, day, change):
+    path = os.path.join(data_dir, 'individual_scores.csv')
+    with open(path, 'r', newline='') as file:
+        rows = list(csv.DictReader(file))
+    for row in rows:
+        if row['player'] == player and int(row['day']) == day:
+            row['score'] = str(int(row['score']) + change)
+    with open(path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def test_unchanged_inputs_hit(tmp_path):
+    data_dir, cache_dir = event_copy(tmp_path / 'event'), str(tmp_path / 'cache')
+    first, cache = cached_run(data_dir, cache_dir)
+    assert set(cache.misses) == ALL_SECTIONS and not cache.hits
+    second, cache = cached_run(data_dir, cache_dir)
+    assert set(cache.hits) == ALL_SECTIONS and not cache.misses and not cache.pruned
+    assert second == first
+
+def test_one_players_change_only_misses_what_reads_it(tmp_path):
+    data_dir, cache_dir = event_copy(tmp_path / 'event'), str(tmp_path / 'cache')
+    cached_run(data_dir, cache_dir)
+    rescore(data_dir, 'Dave', 3, -5)
+    results, cache = cached_run(data_dir, cache_dir)
+    # Sections over every round see the change; other players' sections, head to head and the hole analysis do not
+    assert set(cache.misses) == {PLAYER_SECTION_PREFIX + 'Dave', 'tournament_summary', 'course_analysis',
+                                 'performance_trends', 'tournament_insights'}
+    assert set(cache.hits) == ALL_SECTIONS - set(cache.misses)
+    assert results == calculate_player_statistics(data_dir)
+
+def test_prune_removes_stale_sections(tmp_path):
+    data_dir, cache_dir = event_copy(tmp_path / 'event'), str(tmp_path / 'cache')
+    _, cache = cached_run(data_dir, cache_dir)
+    live = sorted(os.listdir(cache_dir))
+    stale = SectionCache(cache_dir, 'code')
+    stale.store(PLAYER_SECTION_PREFIX + 'Ghost', 'key', {})
+    assert len(os.listdir(cache_dir)) == len(live) + 1
+
+    _, cache = cached_run(data_dir, cache_dir)
+    assert len(cache.pruned) == 1 and cache.pruned[0].startswith('player_statistics.Ghost')
+    assert sorted(os.listdir(cache_dir)) == live
+    assert not cache.misses
+
+def test_code_change_invalidates_every_section(tmp_path, monkeypatch, capsys):
+    data_dir = event_copy(tmp_path / 'event')
+    source = tmp_path / 'calculate_stats.py'
+    shutil.copy(calculate_stats.__file__, source)
+    monkeypatch.setattr(calculate_stats, '__file__', str(source))
+
+    def report():
+        run([(data_dir, data_dir)])
+        return next(line for line in capsys.readouterr().out.splitlines() if line.startswith('Section cache'))
+
+    sections = len(ALL_SECTIONS)
+    assert report() == f"Section cache: 0 hits, {sections} misses"
+    assert report() == f"Section cache: {sections} hits, 0 misses"
+    with open(source, 'a') as file:
+        file.write('\n# edited\n')
+    assert report() == f"Section cache: 0 hits, {sections} misses"
+    assert report() == f"Section cache: {sections} hits, 0 misses"
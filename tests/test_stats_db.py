@@ -0,0 +1,82 @@
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculate_stats import (SqliteSource, calculate_course_difficulty, calculate_course_performance,
+                             calculate_player_statistics, calculate_tournament_summary, load_tournament_frame)
+from clean_data import DAY_HEADER, clean_myrtle_scores
+from stats_db import TABLES, connect, list_events
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXPORT = os.path.join(ROOT, 'myrtleScores.csv')
+COURSES = os.path.join(ROOT, 'courses.md')
+
+def load(source, db_path, event):
+    with redirect_stdout(io.StringIO()):
+        clean_myrtle_scores(str(source), db_path=db_path, event=event, write_csv=False, courses_file=COURSES)
+
+def day4_export(tmp_path):
+    with open(EXPORT, 'r', newline='') as file:
+        lines = file.readlines()
+    start = next(index for index, line in enumerate(lines)
+                 if (match := DAY_HEADER.match(line)) and match.group(1) == '4')
+    end = next(index for index, line in enumerate(lines) if line.startswith('Solo Scores'))
+    path = tmp_path / 'day4.csv'
+    path.write_text(''.join(lines[start:end]))
+    return path
+
+def event_rows(db_path):
+    conn = connect(db_path)
+    try:
+        return {table: dict(conn.execute(f'SELECT event, COUNT(*) FROM {table} GROUP BY event').fetchall())
+                for table in TABLES}
+    finally:
+        conn.close()
+
+def table_rows(db_path, event, table):
+    conn = connect(db_path)
+    try:
+        return conn.execute(f'SELECT * FROM {table} WHERE event = ? ORDER BY rowid', (event,)).fetchall()
+    finally:
+        conn.close()
+
+def test_write_tournament_replaces_only_its_event(tmp_path):
+    db_path = str(tmp_path / 'stats.db')
+    load(EXPORT, db_path, 'full')
+    load(day4_export(tmp_path), db_path, 'stableford')
+    full = {table: table_rows(db_path, 'full', table) for table in TABLES}
+    before = event_rows(db_path)
+    assert before['match_play_results'] == {'full': 8}
+    assert before['individual_scores']['stableford'] < before['individual_scores']['full']
+
+    # Re-cleaning the other event with different tables leaves this one as it was
+    load(EXPORT, db_path, 'stableford')
+    load(day4_export(tmp_path), db_path, 'stableford')
+    conn = connect(db_path)
+    assert list_events(conn) == ['full', 'stableford']
+    conn.close()
+    assert event_rows(db_path) == before
+    assert {table: table_rows(db_path, 'full', table) for table in TABLES} == full
+
+    # ... and rewriting this one replaces its rows rather than adding to them
+    load(day4_export(tmp_path), db_path, 'full')
+    after = event_rows(db_path)
+    assert after['individual_scores'] == {'full': before['individual_scores']['stableford'],
+                                          'stableford': before['individual_scores']['stableford']}
+    assert after['match_play_results'] == {}
+
+def test_sql_backend_matches_in_memory(tmp_path):
+    db_path = str(tmp_path / 'stats.db')
+    load(EXPORT, db_path, 'myrtle')
+    sql, memory = load_tournament_frame(SqliteSource(db_path, 'myrtle')), load_tournament_frame(ROOT)
+    assert sql.store is not None and memory.store is None
+
+    assert calculate_tournament_summary(sql) == calculate_tournament_summary(memory)
+    assert calculate_course_difficulty(sql) == calculate_course_difficulty(memory)
+    for player in memory.players:
+        assert calculate_course_performance(player, sql.player_rounds(player), sql.store) == \
+            calculate_course_performance(player, memory.player_rounds(player), memory.store)
+    assert calculate_player_statistics(SqliteSource(db_path, 'myrtle')) == calculate_player_statistics(ROOT)
@@ -0,0 +1,49 @@
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stats_output import write_json_stream
+
+RESULTS = {
+    'tournament_summary': {'winner': 'Nixon', 'winning_score': 301, 'leaderboard': [
+        {'player': 'Nixon', 'total_score': 301, 'percentile': 100.0},
+        {'player': 'Ruth "Babe"', 'total_score': 305.5, 'percentile': 0.0}
+    ]},
+    'player_statistics': {
+        'Nixon': {'scores': [75, 76, 74, 76], 'note': 'line one\nline two', 'course_performance': {}},
+        'Ruth "Babe"': {'scores': [], 'best': None, 'flags': [True, False], 'name': 'Zoë'}
+    },
+    'empty_section': {},
+    'performance_trends': {'Nixon': {'change_point': None, 'slope_per_round': -0.25}}
+}
+
+def streamed(indent):
+    """The results written as a stream, player_statistics as a nested stream"""
+    def items():
+        for name, value in RESULTS.items():
+            yield name, iter(value.items()) if name == 'player_statistics' else value
+    file = io.StringIO()
+    write_json_stream(items(), file, indent=indent)
+    return file.getvalue()
+
+@pytest.mark.parametrize('indent', [2, 4, 0])
+def test_stream_matches_json_dump(indent):
+    expected = io.StringIO()
+    json.dump(RESULTS, expected, indent=indent)
+    assert streamed(indent) == expected.getvalue()
+
+def test_compact_stream_matches_json_dump():
+    expected = io.StringIO()
+    json.dump(RESULTS, expected, separators=(',', ':'))
+    assert streamed(None) == expected.getvalue()
+
+def test_empty_stream():
+    for indent in (2, None):
+        file = io.StringIO()
+        write_json_stream(iter(()), file, indent=indent)
+        assert file.getvalue() == '{}'
@@ -0,0 +1,151 @@
+import asyncio
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stats_server
+from calculate_stats import load_tournament_frame
+from course_data import find_course
+from handicap import player_handicap
+from scoring import course_handicap
+from stats_server import BadRequest, NotFound, StatsService, handle_connection, leaderboard_scores
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TABLES = ['individual_scores.csv', 'match_play_results.csv', 'team_scores.csv', 'player_stats.csv', 'hole_scores.csv']
+
+def event_copy(directory):
+    os.makedirs(directory)
+    for name in TABLES:
+        shutil.copy(os.path.join(ROOT, name), directory)
+    return str(directory)
+
+class Writer:
+    """Collects what handle_connection writes"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.closed = False
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+def exchange(service, *requests):
+    """Send requests down one connection and parse the responses as (status, headers, body)"""
+    async def talk():
+        reader = asyncio.StreamReader()
+        for request in requests:
+            reader.feed_data(request.encode('latin-1'))
+        reader.feed_eof()
+        writer = Writer()
+        await handle_connection(service, reader, writer)
+        assert writer.closed
+        return bytes(writer.data)
+
+    data = asyncio.run(talk())
+    responses = []
+    while data:
+        head, _, data = data.partition(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        headers = dict(line.split(': ', 1) for line in lines[1:])
+        length = int(headers['Content-Length']) if not requests[len(responses)].startswith('HEAD') else 0
+        body, data = data[:length], data[length:]
+        responses.append((int(lines[0].split(' ')[1]), headers, json.loads(body) if body else None))
+    return responses
+
+def get(path, **headers):
+    return ''.join([f'GET {path} HTTP/1.1\r\nHost: localhost\r\n', *(f'{k.replace("_", "-")}: {v}\r\n' for k, v in headers.items()), '\r\n'])
+
+@pytest.fixture
+def service(tmp_path):
+    return StatsService({'myrtle': event_copy(tmp_path / 'myrtle')})
+
+def test_lru_evicts_the_least_recently_used(service):
+    service.cache_size = 2
+    query = {}
+    for path in ('/players', '/courses', '/players', '/days'):
+        service.respond(path, query)
+    # /players was used again after /courses, so /courses is the one that went
+    assert (service.hits, service.misses, service.evictions) == (1, 3, 1)
+    assert [key[0] for key in service.cache] == [('players',), ('days',)]
+    service.respond('/courses', query)
+    assert (service.misses, service.evictions) == (4, 2)
+
+def test_rewritten_event_misses_the_cache(service):
+    first = service.respond('/players/Jimbo', {})
+    assert service.respond('/players/Jimbo', {}) == first and service.hits == 1
+    path = os.path.join(service.sources['myrtle'], 'individual_scores.csv')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert service.respond('/players/Jimbo', {}) == first  # same answer, recomputed
+    assert (service.hits, service.misses) == (1, 2)
+
+def test_etag_revalidation(service):
+    [(status, headers, body)] = exchange(service, get('/leaderboards/gross'))
+    assert status == 200 and body['leader'] == 269
+    etag = headers['ETag']
+    responses = exchange(service, get('/leaderboards/gross', If_None_Match=etag),
+                         get('/leaderboards/gross', If_None_Match=f'"other", W/{etag}'),
+                         get('/leaderboards/gross', If_None_Match='"other"'))
+    assert [(status, headers.get('ETag'), body) for status, headers, body in responses[:2]] == [(304, etag, None)] * 2
+    assert responses[2][0] == 200 and responses[2][2]['leader'] == 269
+    assert all(headers['Connection'] == 'keep-alive' for _, headers, _ in responses)
+
+def test_error_statuses(service, tmp_path, monkeypatch):
+    responses = exchange(service, get('/days/four'), get('/leaderboards/gross?within=-1'), get('/nowhere'),
+                         get('/players/Nobody'), get('/leaderboards/par'), get('/players?event=other'))
+    assert [status for status, _, _ in responses] == [400, 400, 404, 404, 404, 404]
+    assert all('error' in body and 'ETag' not in headers for _, headers, body in responses)
+
+    several = StatsService({'a': service.sources['myrtle'], 'b': event_copy(tmp_path / 'b')})
+    [(status, _, body)] = exchange(several, get('/players'))
+    assert status == 400 and '?event=' in body['error']
+
+    def broken(*args):
+        raise RuntimeError('boom')
+    monkeypatch.setattr(service, '_answer', broken)
+    responses = exchange(service, get('/players'), get('/status'))
+    assert responses[0][0] == 500 and responses[0][2] == {'error': 'internal error serving /players'}
+    assert responses[1][0] == 500  # the connection is still served after a failure
+    monkeypatch.undo()
+    assert exchange(service, get('/players'))[0][0] == 200
+
+def test_service_errors_directly(service):
+    with pytest.raises(NotFound):
+        service.respond('/courses/Nowhere', {})
+    with pytest.raises(BadRequest):
+        service.respond('/leaderboards/net', {'within': ['nan']})
+
+def test_net_leaderboard_subtracts_course_handicaps():
+    frame = load_tournament_frame(ROOT)
+    gross, net = leaderboard_scores(frame, 'gross'), leaderboard_scores(frame, 'net')
+    assert set(net) == set(gross) == set(frame.players)
+    for player in frame.players:
+        rounds = sorted(frame.player_rounds(player), key=lambda r: r['day'])
+        index = player_handicap(rounds, frame.player_hole_cards(player), frame.courses)['handicap_index']
+        strokes = sum(course_handicap(index, find_course(frame.courses, r['course'])) for r in rounds)
+        assert gross[player] == sum(r['score'] for r in rounds)
+        assert net[player] == gross[player] - strokes
+    assert net['Jimbo'] == 231 and net['Doug'] == 234
+
+def test_net_is_gross_without_a_handicap_index(monkeypatch):
+    frame = load_tournament_frame(ROOT)
+    monkeypatch.setattr(stats_server, 'player_handicap', lambda *args: {'handicap_index': None})
+    assert leaderboard_scores(frame, 'net') == leaderboard_scores(frame, 'gross')
+
+def test_net_leaderboard_endpoint(service):
+    result = service.respond('/leaderboards/net', {'within': ['4'], 'player': ['Ryan']})
+    body = json.loads(result[0])
+    assert body['leader'] == 231
+    assert [entry['player'] for entry in body['standings']] == ['Jimbo', 'Nixon', 'Doug', 'Todd']
+    assert body['player']['rank'] == 5 and body['player']['behind_leader'] == 8
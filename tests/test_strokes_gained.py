@@ -0,0 +1,119 @@
+import csv
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from archive import Archive, append_event
+from strokes_gained import (LEVELS, MIN_SAMPLES, Slots, _cell, expected_table, fit_baseline, load_baseline,
+                            score_strokes_gained)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COURSES = os.path.join(ROOT, 'courses.md')
+ARCADIAN_PARS = [5, 3, 5, 4, 4, 4, 4, 3, 4, 5, 4, 4, 4, 4, 3, 5, 3, 4]
+
+def write_event(directory, cards):
+    """A cleaned event from {(player, day, course): [(par, strokes), ...]}"""
+    os.makedirs(directory)
+    with open(os.path.join(directory, 'individual_scores.csv'), 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['course', 'day', 'format', 'par', 'player', 'score'])
+        for (player, day, course), holes in cards.items():
+            writer.writerow([course, day, 'Stroke Play', sum(p for p, _ in holes), player, sum(s for _, s in holes)])
+    with open(os.path.join(directory, 'hole_scores.csv'), 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['course', 'day', 'format', 'hole', 'par', 'player', 'strokes'])
+        for (player, day, course), holes in cards.items():
+            for number, (par, strokes) in enumerate(holes, 1):
+                writer.writerow([course, day, 'Stroke Play', number, par, player, strokes])
+    return str(directory)
+
+def tiny_cards(offset=0):
+    return {
+        ('A', 1, 'Arcadian Shores'): [(par, par + offset + (hole % 3 == 0)) for hole, par in enumerate(ARCADIAN_PARS)],
+        ('B', 1, 'Arcadian Shores'): [(par, par + 2) for par in ARCADIAN_PARS],
+        ('A', 2, 'Nowhere Links'): [(4, 5), (3, 3), (5, 7)]  # not in courses.md: par alone
+    }
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    directory = str(tmp_path / 'archive')
+    append_event(directory, write_event(tmp_path / 'e1', tiny_cards()), 'e1', 2024)
+    return directory
+
+def cell_entry(fields, key, holes, expected):
+    return {'fields': list(fields), 'cells': [{'key': list(key), 'holes': holes, 'expected': expected}]}
+
+def test_expected_falls_back_from_fine_to_coarse_to_par(archive_dir):
+    with Archive(archive_dir) as archive:
+        slots = Slots(archive, COURSES)
+        fit_baseline(archive, slots)
+        slot = archive.meta['courses'].index('Arcadian Shores') * slots.width  # hole 1, a par 5
+        features = slots.features(slot)
+        fine, coarse, par = (_cell(features, level) for level in LEVELS)
+        assert None not in (fine, coarse, par)
+
+        def expected(fine_holes, coarse_holes, par_cell=True):
+            levels = [cell_entry(LEVELS[0], fine, fine_holes, 4.5), cell_entry(LEVELS[1], coarse, coarse_holes, 5.5)]
+            levels.append(cell_entry(LEVELS[2], par, 1, 6.5) if par_cell else {'fields': list(LEVELS[2]), 'cells': []})
+            return expected_table({'levels': levels}, slots)[slot]
+
+        assert expected(MIN_SAMPLES, MIN_SAMPLES) == 4.5
+        assert expected(MIN_SAMPLES - 1, MIN_SAMPLES) == 5.5
+        assert expected(MIN_SAMPLES - 1, MIN_SAMPLES - 1) == 6.5  # the coarsest level is trusted at any size
+        assert expected(MIN_SAMPLES - 1, MIN_SAMPLES - 1, par_cell=False) == 5  # no cell at all: par
+
+        # A course missing from courses.md only has a par cell
+        nowhere = archive.meta['courses'].index('Nowhere Links') * slots.width
+        assert [_cell(slots.features(nowhere), level) for level in LEVELS] == [None, None, (4,)]
+
+def test_totals_are_expected_minus_actual(archive_dir):
+    with Archive(archive_dir) as archive:
+        slots = Slots(archive, COURSES)
+        baseline = fit_baseline(archive, slots)
+        expected = expected_table(baseline, slots)
+        result = score_strokes_gained(archive, slots, expected)
+
+        by_hand = {}
+        for (player, _, course), holes in tiny_cards().items():
+            base = archive.meta['courses'].index(course) * slots.width
+            total = by_hand.setdefault(player, [0, 0.0])
+            total[0] += len(holes)
+            total[1] += sum(expected[base + hole] - strokes for hole, (_, strokes) in enumerate(holes))
+        for player, (holes, gained) in by_hand.items():
+            summary = result['players'][player]
+            assert summary['holes'] == holes
+            assert summary['strokes_gained'] == round(gained, 2)
+            assert summary['per_round'] == round(gained / holes * 18, 2)
+            assert sum(group['strokes_gained'] for group in summary['by_par'].values()) == pytest.approx(gained, abs=0.05)
+        # Every cell is too small to trust here, so each hole is measured against its par's field average
+        assert result['players']['B']['strokes_gained'] < 0 < result['players']['A']['strokes_gained']
+        for player in ('A', 'B'):
+            assert score_strokes_gained(archive, slots, expected, archive.rows_by('player', player))['players'] == \
+                {player: result['players'][player]}
+
+def test_baseline_cache_follows_the_archive_and_courses(archive_dir, tmp_path):
+    courses = str(tmp_path / 'courses.md')
+    shutil.copy(COURSES, courses)
+
+    def load(refit=False):
+        with Archive(archive_dir) as archive:
+            return load_baseline(archive, Slots(archive, courses), courses, refit)
+
+    first, fitted = load()
+    assert fitted
+    assert load() == (first, False)
+    assert load(refit=True) == (first, True)
+
+    append_event(archive_dir, write_event(tmp_path / 'e2', tiny_cards(offset=1)), 'e2', 2025)
+    second, fitted = load()
+    assert fitted and second['holes'] == 2 * first['holes']
+    assert load() == (second, False)
+
+    with open(courses, 'a') as file:
+        file.write('\n')
+    assert load()[1]
+    assert not load()[1]
@@ -0,0 +1,53 @@
+import csv
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculate_stats import calculate_player_statistics, load_tournament_frame
+from clean_data import OUTPUT_FILES, save_to_csv
+from synthetic_data import FIELDNAMES, generate_tournament
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COURSES = os.path.join(ROOT, 'courses.md')
+
+def test_tables_round_trip_through_clean_data(tmp_path):
+    # An odd field: two full flights and one of five, so one player sits out the pairings
+    counts = generate_tournament(str(tmp_path / 'synthetic'), players=21, seed=3, courses_file=COURSES)
+    assert sorted(counts) == sorted(OUTPUT_FILES)
+    for name in OUTPUT_FILES:
+        with open(tmp_path / 'synthetic' / name, 'r', newline='') as file:
+            text = file.read()
+        rows = list(csv.DictReader(io.StringIO(text)))
+        assert len(rows) == counts[name], name
+        # clean_data would write the same rows byte for byte
+        with redirect_stdout(io.StringIO()):
+            save_to_csv(rows, str(tmp_path / name))
+        with open(tmp_path / name, 'r', newline='') as file:
+            assert file.read() == text, name
+        assert text.splitlines()[0] == ','.join(FIELDNAMES[name])
+
+def test_requested_field_size_loads_and_scores(tmp_path):
+    players, flight_size, rounds = 21, 8, 4
+    counts = generate_tournament(str(tmp_path), players=players, rounds=rounds, flight_size=flight_size, seed=3,
+                                 courses_file=COURSES)
+    frame = load_tournament_frame(str(tmp_path))
+    names = [f'Player {number:06d}' for number in range(1, players + 1)]
+    assert sorted(frame.players) == names
+    assert len(frame.individual_scores) == counts['individual_scores.csv']
+    # The scramble day is played as teams; every other day is a full card per player
+    assert len(frame.hole_scores) == counts['hole_scores.csv'] == players * 18 * (rounds - 1)
+    # Pairs within each flight of 8, 8 and 5
+    assert counts['match_play_results.csv'] == 2 * (4 + 4 + 2)
+
+    results = calculate_player_statistics(str(tmp_path))
+    assert sorted(results['player_statistics']) == names
+    assert len(results['tournament_summary']['leaderboard']) == players
+    for row in frame.player_stats:
+        stats = results['player_statistics'][row['player']]
+        assert stats['basic_stats']['total_score'] == row['total_score']
+        assert stats['basic_stats']['rounds_played'] == rounds - 1
+        assert stats['detailed_performance']['birdies'] == row['birdies']
+        assert stats['detailed_performance']['pars'] == row['pars']
@@ -0,0 +1,71 @@
+import os
+import random
+import statistics
+import sys
+from itertools import accumulate
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trends import EWMA_ALPHA, ROLLING_WINDOW, trend_batch, trend_rows
+
+def ragged(rng, count, longest=40):
+    histories = [[rng.randrange(-4, 20) for _ in range(rng.randrange(0, longest))] for _ in range(count)]
+    offsets = [0, *accumulate(len(history) for history in histories)]
+    return histories, [value for history in histories for value in history], offsets
+
+def ewma_line(history):
+    line = [float(history[0])]
+    for value in history[1:]:
+        line.append(EWMA_ALPHA * value + (1 - EWMA_ALPHA) * line[-1])
+    return line
+
+@pytest.mark.parametrize('seed', range(10))
+def test_batch_matches_per_series_references(seed):
+    histories, values, offsets = ragged(random.Random(seed), 30)
+    for history, trend in zip(histories, trend_batch(values, offsets)):
+        assert trend['rounds'] == len(history)
+        if not history:
+            assert trend == {'rounds': 0, 'slope_per_round': None, 'current_form': None, 'change_point': None}
+            continue
+        if len(history) > 1:
+            slope = statistics.linear_regression(range(len(history)), history).slope
+            assert trend['slope_per_round'] == pytest.approx(round(slope, 3), abs=1e-9)
+        else:
+            assert trend['slope_per_round'] is None
+        line = ewma_line(history)
+        assert trend['form'] == [round(value, 2) for value in line]
+        assert trend['current_form'] == trend['form'][-1]
+        assert trend['rolling_average'] == [
+            round(statistics.mean(history[max(0, index + 1 - ROLLING_WINDOW):index + 1]), 2)
+            for index in range(len(history))
+        ]
+
+@pytest.mark.parametrize('seed', range(10))
+def test_rows_match_the_batch_without_lines(seed):
+    histories, values, offsets = ragged(random.Random(seed), 50, longest=300)
+    rows = list(trend_rows(values, offsets))
+    summaries = list(trend_batch(values, offsets, series=False))
+    assert [(s['rounds'], s['slope_per_round'], s['current_form'], s['change_point']) for s in summaries] == rows
+    for history, (_, _, form, _) in zip(histories, rows):
+        if history:
+            assert form == round(ewma_line(history)[-1], 2)
+
+def test_known_change_point():
+    steady, slump = [1, 2, 1, 0, 1, 2, 0], [7, 6, 8, 7, 6, 7]
+    [trend] = trend_batch(steady + slump, [0, 13])
+    assert trend['change_point'] == {'round': len(steady) + 1,
+                                     'shift': round(statistics.mean(slump) - statistics.mean(steady), 2)}
+
+def test_no_change_point_in_noise_or_short_histories():
+    [level, short, small_shift] = trend_batch([1, 2, 1, 0, 1, 2, 0, 1] + [0, 9, 9] + [0, 1, 0, 1, 2, 3, 2, 3],
+                                              [0, 8, 11, 19], series=False)
+    assert level['change_point'] is None
+    assert short['change_point'] is None
+    assert small_shift['change_point'] is None  # clear, but less than CHANGE_POINT_SHIFT strokes
+
+def test_single_round():
+    [trend] = trend_batch([3], [0, 1])
+    assert trend == {'rounds': 1, 'slope_per_round': None, 'current_form': 3.0, 'change_point': None,
+                     'form': [3.0], 'rolling_average': [3.0]}
@@ -0,0 +1,73 @@
+import csv
+import json
+import os
+import shutil
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculate_stats import TEAM_FORMATS, calculate_player_statistics
+from watch_stats import WATCHED_TABLES, StatsWatcher
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def watched_copy(tmp_path):
+    data_dir = tmp_path / 'event'
+    data_dir.mkdir()
+    for name in WATCHED_TABLES:
+        shutil.copy(os.path.join(ROOT, name), data_dir / name)
+    watcher = StatsWatcher(str(data_dir))
+    assert watcher.update()
+    return data_dir, watcher
+
+def edit_cell(path, column, value, where=lambda row: True):
+    """Set one cell of the first row matching where; returns that row's player"""
+    with open(path, newline='') as file:
+        rows = list(csv.DictReader(file))
+    row = next(index for index, values in enumerate(rows) if where(values))
+    rows[row][column] = value
+    with open(path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))  # a new mtime even on coarse clocks
+    return rows[row]['player']
+
+def assert_matches_full_run(data_dir):
+    results = calculate_player_statistics(str(data_dir))
+    with open(data_dir / 'advanced_stats.json') as file:
+        assert file.read() == json.dumps(results, indent=2)
+
+def test_player_stats_edit_recomputes_only_its_readers(tmp_path):
+    data_dir, watcher = watched_copy(tmp_path)
+    assert_matches_full_run(data_dir)
+
+    player = edit_cell(data_dir / 'player_stats.csv', 'birdies', '9', lambda row: row['birdies'] != '9')
+    assert watcher.update()
+    assert watcher.recomputed == ['tournament_insights', f'player_statistics.{player}']
+    assert_matches_full_run(data_dir)
+
+def test_score_edit_recomputes_round_sections(tmp_path):
+    data_dir, watcher = watched_copy(tmp_path)
+    player = edit_cell(data_dir / 'individual_scores.csv', 'score', '71',
+                       lambda row: row['format'] not in TEAM_FORMATS and row['score'] != '71')
+    assert watcher.update()
+    assert watcher.recomputed == ['tournament_summary', 'course_analysis', 'performance_trends',
+                                  'tournament_insights', f'player_statistics.{player}']
+    assert_matches_full_run(data_dir)
+
+def test_unchanged_content_is_not_reloaded(tmp_path):
+    data_dir, watcher = watched_copy(tmp_path)
+    path = data_dir / 'hole_scores.csv'
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert not watcher.update()
+
+def test_roster_change_recomputes_every_section(tmp_path):
+    data_dir, watcher = watched_copy(tmp_path)
+    edit_cell(data_dir / 'individual_scores.csv', 'player', 'Newcomer', lambda row: row['format'] not in TEAM_FORMATS)
+    assert watcher.update()
+    assert 'player_statistics.Newcomer' in watcher.recomputed
+    assert {'head_to_head', 'hole_analysis'} <= set(watcher.recomputed)
+    assert_matches_full_run(data_dir)
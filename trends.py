@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Form and trend analytics over every player's round history at once: slope, EWMA form, rolling averages, change points
+"""
+
+import math
+from functools import reduce
+from itertools import accumulate, islice
+from operator import mul
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+EWMA_ALPHA = 0.3            # weight of the latest round in the form line
+ROLLING_WINDOW = 5          # rounds per rolling average (fewer while a history is shorter)
+MIN_SEGMENT = 2             # rounds each side of a change point needs
+CHANGE_POINT_SHIFT = 3.0    # strokes the level must move by to flag a change point
+CHANGE_POINT_T = 3.0        # ... and how many standard errors that move must be (noise alone rarely gets there)
+
+TrendRow = Tuple[int, Optional[float], Optional[float], Optional[Dict[str, Any]]]
+
+def trend_rows(values: Sequence[float], offsets: Sequence[int]) -> Iterator[TrendRow]:
+    """(rounds, slope_per_round, current_form, change_point) of each series, as trend_batch reports them
+
+    The batch path: a tuple per series, for callers that merge the numbers
+    into records of their own. A series' sums are built-in sums over its
+    slice, and the current form is the same EWMA recurrence trend_batch
+    charts, folded with reduce() so only its last value is kept. Only a
+    history long enough to hold a change point gets running sums, and only
+    its own.
+    """
+    for start, end in zip(offsets, offsets[1:]):
+        n = end - start
+        if n == 0:
+            yield 0, None, None, None
+            continue
+        history = values[start:end]
+        form = reduce(_ewma, islice(history, 1, None), float(history[0]))
+        yield (n, _slope(n, sum(history), sum(map(mul, history, range(n)))), round(form, 2),
+               _change_point(history) if n >= 2 * MIN_SEGMENT else None)
+
+def trend_batch(values: Sequence[float], offsets: Sequence[int], series: bool = True) -> Iterator[Dict[str, Any]]:
+    """Trend stats for ragged series, series i being values[offsets[i]:offsets[i + 1]] in playing order.
+
+    Every player's history sits in one flat array (the same layout as the
+    archive's player index) and is taken in one pass (see trend_rows).
+    series=False leaves out the per-round form and rolling lines, which
+    keep every step of the EWMA recurrence. Results are yielded in
+    series order, so a caller merging them elsewhere never holds them all.
+    """
+    for start, end, (n, slope, form, change_point) in zip(offsets, offsets[1:], trend_rows(values, offsets)):
+        result = {'rounds': n, 'slope_per_round': slope, 'current_form': form, 'change_point': change_point}
+        if series and n:
+            history = values[start:end]
+            line = list(accumulate(islice(history, 1, None), _ewma, initial=float(history[0])))
+            result['form'] = [round(value, 2) for value in line]
+            running = list(accumulate(history, initial=0))
+            result['rolling_average'] = [
+                round((running[index] - running[max(0, index - ROLLING_WINDOW)]) / min(index, ROLLING_WINDOW), 2)
+                for index in range(1, n + 1)
+            ]
+        yield result
+
+def _ewma(form: float, value: float) -> float:
+    return EWMA_ALPHA * value + (1 - EWMA_ALPHA) * form
+
+def _slope(n: int, total: float, cross: float) -> Optional[float]:
+    """Least-squares strokes per round against round number 0..n-1, from sum(y) and sum(x*y)"""
+    if n < 2:
+        return None
+    sum_x = n * (n - 1) / 2
+    sum_xx = (n - 1) * n * (2 * n - 1) / 6
+    return round((n * cross - sum_x * total) / (n * sum_xx - sum_x * sum_x), 3)
+
+def _change_point(history: Sequence[float]) -> Optional[Dict[str, Any]]:
+    """The split where the mean level shifts most in standard errors, if it moved far and surely enough"""
+    n = len(history)
+    prefix = list(accumulate(history, initial=0))
+    squares = list(accumulate(map(mul, history, history), initial=0))
+    total, total_squares = prefix[n], squares[n]
+    best = None
+    for k in range(MIN_SEGMENT, n - MIN_SEGMENT + 1):
+        head, head_squares = prefix[k], squares[k]
+        before, after = head / k, (total - head) / (n - k)
+        # Pooled within-segment variance, from the sums of squares either side of the split
+        residual = head_squares - head * before + (total_squares - head_squares) - (total - head) * after
+        error = math.sqrt(max(residual, 0) / (n - 2) * (1 / k + 1 / (n - k)))
+        t = abs(after - before) / error if error else math.inf
+        if best is None or t > best[0]:
+            best = (t, k, after - before)
+    if best is None or abs(best[2]) < CHANGE_POINT_SHIFT or best[0] < CHANGE_POINT_T:
+        return None
+    return {'round': best[1] + 1, 'shift': round(best[2], 2)}
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Watch the tournament files and keep advanced_stats.json up to date from warm in-memory tables
+"""
+
+import argparse
+import hashlib
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from calculate_stats import (PLAYER_SECTION_PREFIX, SECTION_TABLES, SECTIONS, TournamentFrame,
+                             compute_section, derive_roster, load_csv_data, section_names)
+from clean_data import clean_myrtle_scores
+from stats_output import EncodedJSON, encode_json, write_json_stream
+
+# Cleaned tables the stats are built from; team_scores.csv feeds no section
+WATCHED_TABLES = ['individual_scores.csv', 'match_play_results.csv', 'player_stats.csv', 'hole_scores.csv']
+POLL_INTERVAL = 0.25
+
+class StatsWatcher:
+    """Loaded tables and computed sections for one tournament directory, kept warm between edits.
+
+    Files are polled by mtime and size; a changed file is re-read only if
+    its content hash differs, and only that table is re-parsed and
+    re-indexed in the frame. The table's content hash stands in for the
+    inputs of the sections that read it (SECTION_TABLES): those are
+    recomputed, as hashing their input rows would cost about as much. Of
+    the player sections, only those whose own rows of the table differ
+    are recomputed. Each section's JSON text is kept, so a write encodes
+    only what changed. The output is replaced atomically, so the dashboard
+    never reads a half-written file.
+    """
+
+    def __init__(self, data_dir: str = '.', source: Optional[str] = None, compact: bool = False):
+        self.data_dir = data_dir
+        self.source = source
+        self.compact = compact
+        self.tables: Dict[str, Any] = {}
+        self.digests: Dict[str, Optional[str]] = {}
+        self.stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+        self.sections: Dict[str, Any] = {}
+        self.encoded: Dict[str, EncodedJSON] = {}  # section name -> its text in advanced_stats.json
+        self.frame: Optional[TournamentFrame] = None
+        self.recomputed: List[str] = []
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.data_dir, filename)
+
+    def _watched(self) -> List[str]:
+        return ([self.source] if self.source else []) + [self._path(name) for name in WATCHED_TABLES]
+
+    @staticmethod
+    def _stamp(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def changed_files(self) -> List[str]:
+        """Watched files whose mtime or size moved since the last look"""
+        changed = []
+        for path in self._watched():
+            stamp = self._stamp(path)
+            if stamp != self.stamps.get(path, ()):
+                self.stamps[path] = stamp
+                changed.append(path)
+        return changed
+
+    def reload(self, paths: List[str]) -> List[str]:
+        """Re-clean the raw export if it changed, then re-read the tables whose content changed"""
+        if self.source in paths:
+            clean_myrtle_scores(self.source, self.data_dir)
+            # Cleaning rewrites every table; content hashes decide which are really new
+            for name in WATCHED_TABLES:
+                self.stamps[self._path(name)] = self._stamp(self._path(name))
+            paths = [self._path(name) for name in WATCHED_TABLES]
+
+        reloaded = []
+        for name in WATCHED_TABLES:
+            path = self._path(name)
+            if path not in paths:
+                continue
+            try:
+                with open(path, 'rb') as file:
+                    digest = hashlib.sha256(file.read()).hexdigest()
+            except OSError:
+                digest = None
+            if digest == self.digests.get(name, ''):
+                continue
+            self.tables[name] = load_csv_data(path) if digest is not None else None
+            self.digests[name] = digest
+            reloaded.append(name)
+        return reloaded
+
+    def refresh(self, reloaded: List[str]):
+        """Re-index the reloaded tables and recompute the sections that read them"""
+        if self.tables.get('individual_scores.csv') is None:
+            raise FileNotFoundError(self._path('individual_scores.csv'))
+        frame = self.frame
+        if frame is None:
+            individual_scores = self.tables['individual_scores.csv']
+            frame = TournamentFrame(individual_scores, self.tables.get('match_play_results.csv'),
+                                    self.tables.get('player_stats.csv'), derive_roster(individual_scores),
+                                    hole_scores=self.tables.get('hole_scores.csv'))
+            stale = set(section_names(frame))
+        else:
+            roster = frame.players
+            stale = set()
+            try:
+                for name in reloaded:
+                    before = frame.player_rows(name)
+                    frame.replace_table(name, self.tables.get(name))
+                    after = frame.player_rows(name)
+                    stale.update(section for section, tables in SECTION_TABLES.items() if name in tables)
+                    # Rows compare by value, so only players whose rows of this table changed are recomputed
+                    stale.update(PLAYER_SECTION_PREFIX + player for player in frame.players
+                                 if before.get(player) != after.get(player))
+            except Exception:
+                self.frame = None  # half re-indexed; the next update builds the frame afresh
+                raise
+            if frame.players != roster:
+                stale.update(SECTIONS)  # every section lists or orders the field
+        self.frame = frame
+
+        sections = {}
+        for name in section_names(frame):
+            if name in stale or name not in self.sections:
+                sections[name] = compute_section(frame, name)
+                self.encoded.pop(name, None)
+            else:
+                sections[name] = self.sections[name]
+        self.recomputed = [name for name in sections if name in stale or name not in self.sections]
+        self.sections = sections  # players who left the field drop out here
+        for name in list(self.encoded):
+            if name not in sections:
+                del self.encoded[name]
+
+    def _encoded(self, name: str, level: int) -> EncodedJSON:
+        text = self.encoded.get(name)
+        if text is None:
+            text = self.encoded[name] = encode_json(self.sections[name], None if self.compact else 2, level)
+        return text
+
+    def save_json(self):
+        """advanced_stats.json from each section's kept text, byte-for-byte what save_results_to_json writes"""
+        filename = os.path.normpath(self._path('advanced_stats.json'))
+        items = [('tournament_summary', self._encoded('tournament_summary', 1)),
+                 ('player_statistics', iter([(player, self._encoded(PLAYER_SECTION_PREFIX + player, 2))
+                                             for player in self.frame.players]))]
+        items.extend((name, self._encoded(name, 1)) for name in SECTIONS[1:])
+        temp_path = filename + '.tmp'
+        with open(temp_path, 'w') as file:
+            write_json_stream(items, file, indent=None if self.compact else 2)
+        os.replace(temp_path, filename)
+        print(f"Advanced statistics saved to {filename}")
+
+    def update(self) -> bool:
+        """One poll: reload, recompute and rewrite if anything changed"""
+        changed = self.changed_files()
+        if not changed:
+            return False
+        start = time.perf_counter()
+        try:
+            reloaded = self.reload(changed)
+            if not reloaded and self.frame is not None:
+                return False
+            self.refresh(reloaded)
+            self.save_json()
+        except (OSError, ValueError, KeyError, IndexError) as error:
+            # Most often a file caught mid-save; keep serving the last good output
+            print(f"Update skipped ({type(error).__name__}: {error}); waiting for the next change")
+            for path in changed:
+                self.stamps.pop(path, None)
+            return False
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"Reloaded {', '.join(reloaded) or 'nothing'}; recomputed {len(self.recomputed)} of "
+              f"{len(self.sections)} sections in {elapsed:.1f} ms")
+        return True
+
+    def run(self, interval: float = POLL_INTERVAL):
+        """Poll until interrupted"""
+        print(f"Watching {', '.join(os.path.normpath(path) for path in self._watched())} (Ctrl+C to stop)")
+        try:
+            while True:
+                self.update()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("Stopped watching")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data-dir', default='.', help='directory holding the cleaned CSV files')
+    parser.add_argument('--source', help='also watch this raw scorecard export and re-clean it on change')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, help='seconds between polls')
+    parser.add_argument('--compact', action='store_true', help='write advanced_stats.json without indentation')
+    parser.add_argument('--once', action='store_true', help='build the outputs once and exit')
+    args = parser.parse_args()
+
+    watcher = StatsWatcher(args.data_dir, args.source, args.compact)
+    watcher.update()
+    if not args.once:
+        watcher.run(args.interval)